@@ -0,0 +1,42 @@
+-- Migration: Add bulk_upsert_airlines() for seeding airlines in one call
+-- Run this in your Supabase SQL Editor, then call it via
+--   client.rpc('bulk_upsert_airlines', {'payload': [...rows]})
+
+-- Inserts new airlines with their full row. Existing airlines (matched by name)
+-- only get career_page_url / ats_type refreshed, so scheduling and health
+-- columns are left untouched. Returns how many rows were inserted vs updated.
+CREATE OR REPLACE FUNCTION bulk_upsert_airlines(payload JSONB)
+RETURNS TABLE (inserted INTEGER, updated INTEGER) AS $$
+BEGIN
+  RETURN QUERY
+  WITH upserted AS (
+    INSERT INTO airlines_to_scrape (
+      name, career_page_url, ats_type, tier, scrape_frequency_hours,
+      region, country, iata_code, icao_code
+    )
+    SELECT
+      r.name, r.career_page_url, r.ats_type, r.tier, r.scrape_frequency_hours,
+      r.region, r.country, r.iata_code, r.icao_code
+    FROM jsonb_to_recordset(payload) AS r(
+      name VARCHAR(255),
+      career_page_url TEXT,
+      ats_type VARCHAR(50),
+      tier INTEGER,
+      scrape_frequency_hours INTEGER,
+      region VARCHAR(50),
+      country VARCHAR(100),
+      iata_code VARCHAR(3),
+      icao_code VARCHAR(4)
+    )
+    ON CONFLICT (name) DO UPDATE
+      SET career_page_url = EXCLUDED.career_page_url,
+          ats_type = EXCLUDED.ats_type
+    -- xmax is 0 only for freshly inserted rows
+    RETURNING (xmax = 0) AS is_insert
+  )
+  SELECT
+    COUNT(*) FILTER (WHERE is_insert)::INTEGER,
+    COUNT(*) FILTER (WHERE NOT is_insert)::INTEGER
+  FROM upserted;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,29 @@
+-- Migration: Add update_airline_after_scrape() to record a scrape outcome in one call
+-- Run this in your Supabase SQL Editor
+
+-- Updates scheduling and health columns atomically, so callers never need to
+-- read consecutive_failures / total_jobs_found before writing them back.
+-- An airline is moved to 'error' after 5 consecutive failed scrapes.
+CREATE OR REPLACE FUNCTION update_airline_after_scrape(
+  p_id UUID,
+  p_jobs INTEGER,
+  p_success BOOLEAN,
+  p_error TEXT DEFAULT NULL
+)
+RETURNS VOID AS $$
+BEGIN
+  UPDATE airlines_to_scrape
+  SET
+    last_checked = NOW(),
+    last_successful_scrape = CASE WHEN p_success THEN NOW() ELSE last_successful_scrape END,
+    jobs_found_last_scrape = p_jobs,
+    total_jobs_found = total_jobs_found + p_jobs,
+    consecutive_failures = CASE WHEN p_success THEN 0 ELSE consecutive_failures + 1 END,
+    status = CASE
+      WHEN NOT p_success AND consecutive_failures + 1 >= 5 THEN 'error'
+      ELSE status
+    END,
+    last_error = LEFT(p_error, 500)
+  WHERE id = p_id;
+END;
+$$ LANGUAGE plpgsql;
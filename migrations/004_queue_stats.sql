@@ -0,0 +1,32 @@
+-- Migration: Add queue_stats() so the smart queue gets its statistics in one query
+-- Run this in your Supabase SQL Editor
+
+-- One pass over airlines_to_scrape instead of a COUNT query per tier and status.
+-- tier_hours maps tier -> scrape frequency in hours, e.g. {"1": 3, "2": 12, "3": 24}
+-- (TIER_FREQUENCIES in scraper/smart_queue.py); unknown tiers default to 24 hours.
+CREATE OR REPLACE FUNCTION queue_stats(tier_hours JSONB)
+RETURNS JSONB AS $$
+  SELECT jsonb_build_object(
+    'total', COUNT(*),
+    'by_tier', jsonb_build_object(
+      '1', COUNT(*) FILTER (WHERE tier = 1),
+      '2', COUNT(*) FILTER (WHERE tier = 2),
+      '3', COUNT(*) FILTER (WHERE tier = 3)
+    ),
+    'by_status', jsonb_build_object(
+      'active', COUNT(*) FILTER (WHERE status = 'active'),
+      'inactive', COUNT(*) FILTER (WHERE status = 'inactive'),
+      'error', COUNT(*) FILTER (WHERE status = 'error')
+    ),
+    'due_count', COUNT(*) FILTER (
+      WHERE status = 'active'
+        AND (
+          last_checked IS NULL
+          OR last_checked < NOW() - make_interval(
+            hours => COALESCE((tier_hours ->> tier::TEXT)::INTEGER, 24)
+          )
+        )
+    )
+  )
+  FROM airlines_to_scrape;
+$$ LANGUAGE sql STABLE;
@@ -0,0 +1,10 @@
+-- Migration: Partial index for the smart queue's "due airlines" query
+-- Run this in your Supabase SQL Editor (CONCURRENTLY cannot run inside a
+-- transaction block, so run it as a standalone statement)
+
+-- get_due_airlines filters status = 'active' by tier and last_checked, and
+-- orders by last_checked NULLS FIRST with a LIMIT. With this index Postgres
+-- reads just the first rows per tier instead of scanning every airline.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_airlines_due
+  ON airlines_to_scrape (tier, last_checked NULLS FIRST)
+  WHERE status = 'active';
@@ -0,0 +1,18 @@
+-- Migration: Add next_due_at() so an idle smart queue knows how long to sleep
+-- Run this in your Supabase SQL Editor
+
+-- Earliest time any active airline becomes due for scraping (NOW() if one
+-- already is, NULL if there are no active airlines). tier_hours is the same
+-- tier -> frequency map passed to queue_stats(); p_tier limits it to one tier.
+CREATE OR REPLACE FUNCTION next_due_at(tier_hours JSONB, p_tier INTEGER DEFAULT NULL)
+RETURNS TIMESTAMP WITH TIME ZONE AS $$
+  SELECT MIN(
+    COALESCE(
+      last_checked + make_interval(hours => COALESCE((tier_hours ->> tier::TEXT)::INTEGER, 24)),
+      NOW()
+    )
+  )
+  FROM airlines_to_scrape
+  WHERE status = 'active'
+    AND (p_tier IS NULL OR tier = p_tier);
+$$ LANGUAGE sql STABLE;
@@ -0,0 +1,24 @@
+-- Migration: Materialized queue statistics for `smart_queue.py --stats`
+-- Run this in your Supabase SQL Editor after 004_queue_stats.sql
+-- (pg_cron must be enabled: Database -> Extensions -> pg_cron)
+
+-- One precomputed row, so dashboards/cron polling --stats never aggregate
+-- airlines_to_scrape themselves. Tier frequencies mirror TIER_FREQUENCIES in
+-- scraper/smart_queue.py.
+CREATE MATERIALIZED VIEW IF NOT EXISTS queue_stats_mv AS
+  SELECT
+    1 AS id,
+    queue_stats('{"1": 3, "2": 12, "3": 24}'::JSONB) AS stats,
+    NOW() AS refreshed_at;
+
+-- REFRESH ... CONCURRENTLY needs a unique index
+CREATE UNIQUE INDEX IF NOT EXISTS idx_queue_stats_mv_id ON queue_stats_mv(id);
+
+GRANT SELECT ON queue_stats_mv TO anon, authenticated, service_role;
+
+-- Refresh every minute
+SELECT cron.schedule(
+  'refresh-queue-stats',
+  '* * * * *',
+  'REFRESH MATERIALIZED VIEW CONCURRENTLY queue_stats_mv'
+);
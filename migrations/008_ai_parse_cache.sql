@@ -0,0 +1,18 @@
+-- Migration: Add ai_parse_cache so unchanged job pages skip the Claude call
+-- Run this in your Supabase SQL Editor
+
+-- One row per job URL (keyed by md5 of the URL). universal_engine reuses
+-- ai_json while content_sha256 still matches the page text sent to the model
+-- and the row is younger than its TTL (7 days); otherwise it re-parses and
+-- upserts the row.
+CREATE TABLE IF NOT EXISTS ai_parse_cache (
+  url_hash TEXT PRIMARY KEY,
+  content_sha256 TEXT NOT NULL,
+  ai_json JSONB NOT NULL,
+  cached_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Lets stale rows be pruned cheaply, e.g.
+--   DELETE FROM ai_parse_cache WHERE cached_at < NOW() - INTERVAL '7 days';
+CREATE INDEX IF NOT EXISTS idx_ai_parse_cache_cached_at
+  ON ai_parse_cache (cached_at);
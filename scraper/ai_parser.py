@@ -1,26 +1,44 @@
 import json
 import os
 import re
+import threading
+from collections import OrderedDict
+import httpx
 from anthropic import Anthropic
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# Initialize Claude
+# Initialize Claude - one client (and one keep-alive HTTP/2 pool) for every
+# call in the process, whichever scraper thread makes it
 try:
-    client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+    client = Anthropic(
+        api_key=os.getenv("ANTHROPIC_API_KEY"),
+        http_client=httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        ),
+    )
 except:
     client = None
 
-def parse_job_with_ai(raw_text, url, company_name):
-    """
-    The 'Nuclear' Parser.
-    It reads the page text and decides if it is a VALID PILOT JOB.
-    """
-    if not client:
-        return {"is_valid_job": False}
+# Max AI requests in flight at once across scraper threads
+AI_MAX_CONCURRENCY = 8
+_ai_slots = threading.BoundedSemaphore(AI_MAX_CONCURRENCY)
+
+AI_MODEL = "claude-3-haiku-20240307"
+
+# Only the first 6000 chars reach the model, so identical cross-posted
+# descriptions get one API call. Failed calls are not cached.
+MAX_PROMPT_CHARS = 6000
+AI_CACHE_SIZE = 4096
+_ai_cache = OrderedDict()
+_ai_cache_lock = threading.Lock()
 
-    system_prompt = """
+# Pages sent together in one parse_jobs_with_ai_batch request
+AI_BATCH_SIZE = 10
+
+SYSTEM_PROMPT = """
     You are an expert aviation recruiter.
     Analyze the webpage text provided.
 
@@ -41,30 +59,143 @@ def parse_job_with_ai(raw_text, url, company_name):
     - is_low_hour: Boolean (True if min_hours < 500 or text says "Cadet"/"Entry Level").
     """
 
-    user_message = f"""
-    Company: {company_name}
-    URL: {url}
-
-    PAGE TEXT:
-    {raw_text[:6000]}
+BATCH_SYSTEM_PROMPT = SYSTEM_PROMPT + """
+    You will receive several numbered pages. Analyze each one on its own and
+    return a JSON array with exactly one object per page, in the same order.
     """
 
-    try:
+
+def _is_verdict(result):
+    """True if a decoded reply has the shape SYSTEM_PROMPT asks for"""
+    return isinstance(result, dict) and isinstance(result.get("is_valid_job"), bool)
+
+
+def _cache_get(cache_key):
+    with _ai_cache_lock:
+        cached = _ai_cache.get(cache_key)
+        if cached is not None:
+            _ai_cache.move_to_end(cache_key)
+    return dict(cached) if cached is not None else None
+
+
+def _cache_put(cache_key, result):
+    with _ai_cache_lock:
+        _ai_cache[cache_key] = result
+        if len(_ai_cache) > AI_CACHE_SIZE:
+            _ai_cache.popitem(last=False)
+
+
+def _ask(system_prompt, user_message, max_tokens):
+    """Send one request and decode the JSON in the reply"""
+    with _ai_slots:
         response = client.messages.create(
-            model="claude-3-haiku-20240307",
-            max_tokens=1024,
+            model=AI_MODEL,
+            max_tokens=max_tokens,
             temperature=0,
             system=system_prompt,
             messages=[{"role": "user", "content": user_message}]
         )
 
-        # Clean response
-        json_str = response.content[0].text.strip()
-        if "```" in json_str:
-            json_str = json_str.split("```json")[-1].split("```")[0].strip()
+    # Clean response
+    json_str = response.content[0].text.strip()
+    if "```" in json_str:
+        json_str = json_str.split("```json")[-1].split("```")[0].strip()
+
+    return json.loads(json_str)
+
+
+def parse_job_with_ai(raw_text, url, company_name):
+    """
+    The 'Nuclear' Parser.
+    It reads the page text and decides if it is a VALID PILOT JOB.
+    """
+    if not client:
+        return {"is_valid_job": False, "error": "no client"}
 
-        return json.loads(json_str)
+    page_text = raw_text[:MAX_PROMPT_CHARS]
+    cache_key = (company_name, page_text)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    user_message = f"""
+    Company: {company_name}
+    URL: {url}
+
+    PAGE TEXT:
+    {page_text}
+    """
+
+    try:
+        result = _ask(SYSTEM_PROMPT, user_message, max_tokens=1024)
+        if not _is_verdict(result):
+            raise ValueError(f"unexpected reply: {str(result)[:100]}")
+        _cache_put(cache_key, result)
+        return dict(result)
 
     except Exception as e:
         print(f"      [X] AI Analysis Failed: {e}")
-        return {"is_valid_job": False}
+        return {"is_valid_job": False, "error": str(e)}
+
+
+def parse_jobs_with_ai_batch(pages, company_name):
+    """
+    Batch version of parse_job_with_ai for one company.
+
+    Args:
+        pages: List of (raw_text, url) tuples
+
+    Returns:
+        One result dict per page, in order. Cached pages cost nothing, the rest
+        go out AI_BATCH_SIZE at a time in a single request each; a batch whose
+        reply can't be matched up falls back to one call per page.
+    """
+    if not client:
+        return [{"is_valid_job": False, "error": "no client"} for _ in pages]
+
+    results = [None] * len(pages)
+    misses = []
+
+    for i, (raw_text, url) in enumerate(pages):
+        page_text = raw_text[:MAX_PROMPT_CHARS]
+        results[i] = _cache_get((company_name, page_text))
+        if results[i] is None:
+            misses.append((i, page_text, url))
+
+    for start in range(0, len(misses), AI_BATCH_SIZE):
+        batch = misses[start:start + AI_BATCH_SIZE]
+
+        sections = "\n".join(
+            f"""
+    === PAGE {n} ===
+    URL: {url}
+
+    PAGE TEXT:
+    {page_text}
+    """
+            for n, (_, page_text, url) in enumerate(batch, 1)
+        )
+        user_message = f"""
+    Company: {company_name}
+    Pages: {len(batch)}
+    {sections}
+    """
+
+        try:
+            verdicts = _ask(BATCH_SYSTEM_PROMPT, user_message, max_tokens=4096)
+            if not isinstance(verdicts, list) or len(verdicts) != len(batch):
+                raise ValueError(f"expected {len(batch)} results")
+        except Exception as e:
+            print(f"      [X] Batch AI Analysis Failed ({e}), parsing pages one by one")
+            for i, page_text, url in batch:
+                results[i] = parse_job_with_ai(page_text, url, company_name)
+            continue
+
+        for (i, page_text, _), verdict in zip(batch, verdicts):
+            if not _is_verdict(verdict):
+                results[i] = {"is_valid_job": False, "error": f"unexpected reply: {str(verdict)[:100]}"}
+                continue
+            _cache_put((company_name, page_text), verdict)
+            results[i] = dict(verdict)
+
+    return results
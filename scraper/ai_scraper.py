@@ -14,16 +14,24 @@ Best for getting detailed job requirements (hours, aircraft, visa, etc.)
 """
 
 import os
+import re
 import sys
 import time
 import logging
 from typing import List, Dict, Optional
-from datetime import datetime
+from datetime import datetime, timezone
+from urllib.parse import urljoin, urlparse, parse_qsl
 
 from playwright.sync_api import sync_playwright, Page
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -31,7 +39,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 load_dotenv(os.path.join(project_root, '.env'))
 
-from ai_parser import parse_job_with_ai, client as ai_client
+from ai_parser import parse_jobs_with_ai_batch, client as ai_client
+from normalizer import JobNormalizer, AIRCRAFT_ALIASES
 
 # Logging
 logging.basicConfig(
@@ -53,6 +62,137 @@ PILOT_KEYWORDS = [
     "cockpit", "flight deck", "atpl", "cpl", "command"
 ]
 
+# One compiled alternation per keyword list - a single C-level scan per link
+PILOT_RE = re.compile("|".join(map(re.escape, PILOT_KEYWORDS)), re.IGNORECASE)
+
+# Whole URL-path segments that mark a pilot job link. Matching tokens of the
+# path (not substrings of the full URL) keeps tracker/query params out of it.
+PILOT_URL_TOKENS = frozenset({"pilot", "pilots", "captain", "flight", "cockpit"})
+URL_PATH_SPLIT_RE = re.compile(r"[/_\-.]+")
+
+# A link title skips the AI only if it names one role, a whole-word aircraft
+# alias and something marking it as an actual posting - "Pilot Careers -
+# Boeing 777" or "Captain stories: flying the A350" are not jobs
+TITLE_ROLE_RE = re.compile(
+    r"\b(?:captain|commander|(?:senior\s*)?first\s*officer|second\s*officer|co-?pilot|pilot|cadet|instructor)\b"
+)
+TITLE_JOB_RE = re.compile(
+    r"\b(?:vacanc(?:y|ies)|position|opening|job|hiring|recruitment|direct[\s-]*entry"
+    r"|(?:non[\s-]*)?type[\s-]*rated|dec|defo|full[\s-]*time|part[\s-]*time"
+    r"|permanent|contract|temporary|seasonal)\b"
+)
+# Longest alias first, so "737 max" wins over "737"
+AIRCRAFT_WORD_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, sorted(AIRCRAFT_ALIASES, key=len, reverse=True))) + r")\b"
+)
+
+# Location keywords per region, checked in order (first region listed wins)
+REGION_KEYWORDS = {
+    "middle_east": ["dubai", "uae", "qatar", "doha", "saudi", "bahrain", "oman", "kuwait", "abu dhabi"],
+    "europe": ["uk", "london", "ireland", "dublin", "germany", "france", "spain", "italy", "netherlands"],
+    "asia": ["singapore", "hong kong", "japan", "tokyo", "korea", "seoul", "china", "thailand", "malaysia"],
+    "north_america": ["usa", "united states", "america", "canada", "new york", "los angeles"],
+    "oceania": ["australia", "sydney", "melbourne", "new zealand"],
+    "africa": ["south africa", "kenya", "ethiopia", "egypt", "morocco"],
+    "south_america": ["brazil", "chile", "argentina", "colombia"]
+}
+
+if AHOCORASICK_AVAILABLE:
+    # Every keyword maps to (region order, region): one scan finds all hits
+    _REGION_AC = ahocorasick.Automaton()
+    for _order, (_region, _keywords) in enumerate(REGION_KEYWORDS.items()):
+        for _kw in _keywords:
+            _REGION_AC.add_word(_kw, (_order, _region))
+    _REGION_AC.make_automaton()
+
+# Page text is all we read; stylesheets stay so inner_text still skips hidden elements
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--blink-settings=imagesEnabled=false",
+    "--disable-dev-shm-usage",
+]
+
+
+def _block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+# Shorter job pages are skipped as empty
+MIN_PAGE_TEXT = 100
+
+# The same pilot vocabulary find_job_links / read_job_page filter on, for the
+# in-page waits below (page chrome alone never satisfies them)
+_PILOT_JS_PATTERN = "|".join(map(re.escape, dict.fromkeys(PILOT_KEYWORDS + sorted(PILOT_URL_TOKENS))))
+
+# Career page: pilot-looking links exist and their count has held for settleMs
+# (a JS-rendered job list has finished arriving)
+_JOB_LINKS_SETTLED_JS = """([pattern, settleMs]) => {
+    const re = new RegExp(pattern, 'i');
+    const count = Array.from(document.querySelectorAll('a[href]'))
+        .filter(a => re.test(a.getAttribute('href') + ' ' + a.textContent)).length;
+    const state = window.__jobLinksWait || (window.__jobLinksWait = {count: -1, since: 0});
+    const now = performance.now();
+    if (count !== state.count) {
+        state.count = count;
+        state.since = now;
+    }
+    return count > 0 && now - state.since >= settleMs;
+}"""
+
+# Job page: the body mentions the role and its text has stopped growing
+_JOB_TEXT_SETTLED_JS = """([pattern, minChars, settleMs]) => {
+    const text = document.body ? document.body.innerText : '';
+    const state = window.__jobTextWait || (window.__jobTextWait = {length: -1, since: 0});
+    const now = performance.now();
+    if (text.length !== state.length) {
+        state.length = text.length;
+        state.since = now;
+    }
+    return text.length >= minChars && new RegExp(pattern, 'i').test(text)
+        && now - state.since >= settleMs;
+}"""
+
+
+def _wait_for(page: Page, condition: str, arg=None, timeout: int = 3000) -> bool:
+    """Wait until a JS condition holds; False (quietly) on timeout - the page may never meet it"""
+    try:
+        page.wait_for_function(condition, arg=arg, timeout=timeout, polling=250)
+        return True
+    except Exception:
+        return False
+
+
+def _wait_for_job_links(page: Page):
+    """Wait for the career page's pilot job links; networkidle if none ever settle"""
+    if not _wait_for(page, _JOB_LINKS_SETTLED_JS, [_PILOT_JS_PATTERN, 1500], timeout=15000):
+        try:
+            page.wait_for_load_state("networkidle", timeout=10000)
+        except Exception:
+            pass
+
+
+def _wait_for_text(page: Page):
+    """Return once the job description has rendered, not after a fixed sleep"""
+    _wait_for(page, _JOB_TEXT_SETTLED_JS, [_PILOT_JS_PATTERN, MIN_PAGE_TEXT, 500], timeout=5000)
+
+
+def _canon_url(url: str) -> tuple:
+    """
+    Dedup key for a URL: ignores scheme, leading www., trailing slash,
+    fragment and query parameter order
+    """
+    parsed = urlparse(url)
+    return (
+        parsed.netloc.lower().removeprefix("www."),
+        parsed.path.rstrip("/"),
+        frozenset(parse_qsl(parsed.query)),
+    )
+
 
 class AIDeepScraper:
     """AI-powered deep scraper that follows job links and parses with Claude"""
@@ -62,6 +202,7 @@ class AIDeepScraper:
             raise ValueError("Supabase credentials not configured")
 
         self.db = create_client(SUPABASE_URL, SUPABASE_KEY)
+        self.normalizer = JobNormalizer()
 
         if not ai_client:
             logger.warning("ANTHROPIC_API_KEY not set - AI parsing will use fallback")
@@ -82,34 +223,36 @@ class AIDeepScraper:
         seen_urls = set()
 
         try:
-            # Get all links on the page
-            links = page.query_selector_all("a[href]")
+            # Get all links on the page as [text, href] pairs in one round-trip
+            links = page.eval_on_selector_all(
+                "a[href]",
+                "els => els.map(a => [a.innerText || '', a.getAttribute('href') || ''])"
+            )
             logger.info(f"   Scanning {len(links)} links for pilot jobs...")
 
-            for link in links:
+            for text, href in links:
                 try:
-                    text = link.inner_text().strip().lower()
-                    href = link.get_attribute("href") or ""
+                    text = text.strip()
 
                     if not href or href.startswith("#") or href.startswith("javascript"):
                         continue
 
                     # Build full URL
-                    if href.startswith("/"):
-                        href = base_url.rstrip("/") + href
-                    elif not href.startswith("http"):
-                        href = base_url.rstrip("/") + "/" + href.lstrip("/")
+                    href = urljoin(base_url, href)
 
-                    # Skip already seen
-                    if href in seen_urls:
+                    # Skip already seen (same page under a different spelling)
+                    url_key = _canon_url(href)
+                    if url_key in seen_urls:
                         continue
 
-                    # Check if it's a pilot job
-                    is_pilot_job = any(kw in text for kw in PILOT_KEYWORDS)
-                    is_pilot_url = any(kw in href.lower() for kw in ["pilot", "captain", "flight", "cockpit"])
+                    # Check if it's a pilot job (by link text or by URL path)
+                    is_pilot_job = PILOT_RE.search(text) is not None
+                    is_pilot_url = not PILOT_URL_TOKENS.isdisjoint(
+                        URL_PATH_SPLIT_RE.split(url_key[1].lower())
+                    )
 
                     if is_pilot_job or is_pilot_url:
-                        seen_urls.add(href)
+                        seen_urls.add(url_key)
                         job_links.append({
                             "url": href,
                             "title_guess": text[:100],
@@ -124,34 +267,97 @@ class AIDeepScraper:
 
         return job_links
 
-    def scrape_job_detail(self, page: Page, job_url: str, airline_name: str) -> Optional[Dict]:
-        """Visit a job page and extract details using AI"""
+    def read_job_page(self, page: Page, job_url: str) -> Optional[str]:
+        """Visit a job page and return its text if it is worth sending to AI"""
         try:
             logger.info(f"      Reading job page...")
             page.goto(job_url, timeout=30000, wait_until="domcontentloaded")
-            time.sleep(1)  # Let dynamic content load
+            _wait_for_text(page)
 
             # Get the full page text
             raw_text = page.locator("body").inner_text()
 
-            if len(raw_text) < 100:
+            if len(raw_text) < MIN_PAGE_TEXT:
                 logger.warning(f"      Page too short ({len(raw_text)} chars), skipping")
                 return None
 
-            # Parse with AI
-            ai_data = parse_job_with_ai(raw_text, job_url, airline_name)
+            # No pilot vocabulary anywhere on the page - not worth an AI call
+            if PILOT_RE.search(raw_text) is None:
+                logger.info("      No pilot keywords on page, skipping")
+                return None
 
-            return {
-                "url": job_url,
-                "airline": airline_name,
-                "raw_length": len(raw_text),
-                "ai_parsed": ai_data
-            }
+            return raw_text
 
         except Exception as e:
             logger.error(f"      Error scraping job detail: {e}")
             return None
 
+    def parse_without_ai(self, title: str, raw_text: str) -> Optional[Dict]:
+        """
+        Build the AI-style result straight from a clear-cut link title.
+
+        Titles like "Captain A320 - Direct Entry" or "First Officer B737
+        (Type Rated)" already name the position and the aircraft; the rest
+        comes from the normalizer's regex extraction over the page. Returns
+        None when the title is ambiguous.
+        """
+        title_lower = title.lower()
+        if not TITLE_ROLE_RE.search(title_lower) or not TITLE_JOB_RE.search(title_lower):
+            return None
+
+        aircraft = AIRCRAFT_WORD_RE.search(title_lower)
+        if not aircraft:
+            return None
+
+        position_type = self.normalizer.extract_position_type(title)
+        if position_type == "other":
+            return None
+
+        requirements = self.normalizer.extract_requirements(raw_text)
+        return {
+            "is_valid_job": True,
+            "job_title": self.normalizer.clean_title(title),
+            "position_type": position_type,
+            "aircraft": [AIRCRAFT_ALIASES[aircraft.group()]],
+            "min_hours": requirements["min_total_hours"],
+            "min_pic_hours": requirements["min_pic_hours"],
+            "type_rating_required": requirements["type_rating_required"],
+            "type_rating_provided": requirements["type_rating_provided"],
+            "visa_sponsored": requirements["visa_sponsorship"],
+            "is_entry_level": requirements["is_entry_level"],
+            "is_low_hour": requirements["is_entry_level"],
+            "contract_type": self.normalizer.extract_contract_type(
+                {"title": title, "description": raw_text}
+            ),
+        }
+
+    def parse_job_pages(self, pages: List[tuple], airline_name: str) -> List[Dict]:
+        """
+        Parse (url, raw_text, title) pages, batching several pages per AI request
+
+        Pages whose title can be classified deterministically skip the AI.
+        """
+        results = [self.parse_without_ai(title, raw_text) for _, raw_text, title in pages]
+        ai_pages = [i for i, parsed in enumerate(results) if parsed is None]
+
+        if ai_pages:
+            logger.info(f"   Analyzing {len(ai_pages)}/{len(pages)} pages with AI...")
+            ai_results = parse_jobs_with_ai_batch(
+                [(pages[i][1], pages[i][0]) for i in ai_pages], airline_name
+            )
+            for i, ai_data in zip(ai_pages, ai_results):
+                results[i] = ai_data
+
+        return [
+            {
+                "url": url,
+                "airline": airline_name,
+                "raw_length": len(raw_text),
+                "ai_parsed": parsed
+            }
+            for (url, raw_text, _), parsed in zip(pages, results)
+        ]
+
     def save_job(self, job_data: Dict, airline_region: str = "global") -> bool:
         """Save parsed job to database"""
         try:
@@ -182,7 +388,8 @@ class AIDeepScraper:
             # Upsert (update if URL exists)
             self.db.table("pilot_jobs").upsert(
                 record,
-                on_conflict="application_url"
+                on_conflict="application_url",
+                returning="minimal"
             ).execute()
 
             return True
@@ -198,17 +405,11 @@ class AIDeepScraper:
 
         location_lower = location.lower()
 
-        region_keywords = {
-            "middle_east": ["dubai", "uae", "qatar", "doha", "saudi", "bahrain", "oman", "kuwait", "abu dhabi"],
-            "europe": ["uk", "london", "ireland", "dublin", "germany", "france", "spain", "italy", "netherlands"],
-            "asia": ["singapore", "hong kong", "japan", "tokyo", "korea", "seoul", "china", "thailand", "malaysia"],
-            "north_america": ["usa", "united states", "america", "canada", "new york", "los angeles"],
-            "oceania": ["australia", "sydney", "melbourne", "new zealand"],
-            "africa": ["south africa", "kenya", "ethiopia", "egypt", "morocco"],
-            "south_america": ["brazil", "chile", "argentina", "colombia"]
-        }
+        if AHOCORASICK_AVAILABLE:
+            hit = min((value for _, value in _REGION_AC.iter(location_lower)), default=None)
+            return hit[1] if hit else default
 
-        for region, keywords in region_keywords.items():
+        for region, keywords in REGION_KEYWORDS.items():
             if any(kw in location_lower for kw in keywords):
                 return region
 
@@ -238,10 +439,11 @@ class AIDeepScraper:
         total_jobs_saved = 0
 
         with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
+            browser = p.chromium.launch(headless=True, args=LAUNCH_ARGS)
             context = browser.new_context(
                 user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
             )
+            context.route("**/*", _block_heavy_resources)
             page = context.new_page()
 
             for airline in airlines:
@@ -260,46 +462,42 @@ class AIDeepScraper:
                 try:
                     # Visit career page
                     page.goto(url, timeout=60000, wait_until="domcontentloaded")
-                    time.sleep(2)
-
-                    # Get base URL for relative links
-                    from urllib.parse import urlparse
-                    parsed = urlparse(url)
-                    base_url = f"{parsed.scheme}://{parsed.netloc}"
+                    _wait_for_job_links(page)
 
-                    # Find job links
-                    job_links = self.find_job_links(page, name, base_url)
+                    # Find job links (relative to wherever the career page landed)
+                    job_links = self.find_job_links(page, name, page.url)
                     logger.info(f"   Found {len(job_links)} potential pilot job links")
 
-                    # Process each job (up to limit)
-                    jobs_processed = 0
-                    for job in job_links[:limit]:
+                    # Read each job page (up to limit)
+                    pages = []
+                    for jobs_processed, job in enumerate(job_links[:limit]):
                         logger.info(f"   [{jobs_processed+1}/{min(len(job_links), limit)}] {job['title_guess'][:50]}...")
 
-                        # Scrape job detail page with AI
-                        job_data = self.scrape_job_detail(page, job["url"], name)
+                        raw_text = self.read_job_page(page, job["url"])
+                        if raw_text:
+                            pages.append((job["url"], raw_text, job["title_guess"]))
 
-                        if job_data:
-                            total_jobs_found += 1
-                            ai = job_data.get("ai_parsed", {})
+                        time.sleep(1)  # Rate limit
 
-                            # Log what AI extracted
-                            logger.info(f"      AI: {ai.get('job_title', 'N/A')} | "
-                                       f"{ai.get('min_hours', 'N/A')}hrs | "
-                                       f"{ai.get('aircraft', [])}")
+                    # Parse the airline's pages (AI only for ambiguous titles)
+                    for job_data in self.parse_job_pages(pages, name):
+                        total_jobs_found += 1
+                        ai = job_data.get("ai_parsed", {})
 
-                            # Save to database
-                            if self.save_job(job_data, region):
-                                total_jobs_saved += 1
-                                logger.info(f"      Saved to database")
+                        # Log what AI extracted
+                        logger.info(f"      AI: {ai.get('job_title', 'N/A')} | "
+                                   f"{ai.get('min_hours', 'N/A')}hrs | "
+                                   f"{ai.get('aircraft', [])}")
 
-                        jobs_processed += 1
-                        time.sleep(1)  # Rate limit
+                        # Save to database
+                        if self.save_job(job_data, region):
+                            total_jobs_saved += 1
+                            logger.info(f"      Saved to database")
 
                     # Update airline last_checked
                     self.db.table("airlines_to_scrape").update({
-                        "last_checked": datetime.utcnow().isoformat()
-                    }).eq("id", airline["id"]).execute()
+                        "last_checked": datetime.now(timezone.utc).isoformat()
+                    }, returning="minimal").eq("id", airline["id"]).execute()
 
                 except Exception as e:
                     logger.error(f"Error processing {name}: {e}")
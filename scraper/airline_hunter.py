@@ -23,6 +23,7 @@ import json
 import logging
 import argparse
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Optional, Set
 from urllib.parse import urlparse, quote_plus
 
@@ -402,17 +403,21 @@ class ATSDetector:
         "AVATURE": ["avature.net"],
     }
 
+    # All patterns in one alternation; the named group is the ATS type
+    ATS_RE = re.compile(
+        "|".join(
+            f"(?P<{ats_type}>{'|'.join(map(re.escape, patterns))})"
+            for ats_type, patterns in ATS_PATTERNS.items()
+        ),
+        re.IGNORECASE
+    )
+
     @classmethod
+    @lru_cache(maxsize=1024)
     def detect(cls, url: str) -> str:
-        """Detect ATS type from URL"""
-        url_lower = url.lower()
-
-        for ats_type, patterns in cls.ATS_PATTERNS.items():
-            for pattern in patterns:
-                if pattern in url_lower:
-                    return ats_type
-
-        return "CUSTOM_AI"
+        """Detect ATS type from URL (cached: a URL's ATS doesn't change)"""
+        match = cls.ATS_RE.search(url)
+        return match.lastgroup if match else "CUSTOM_AI"
 
 
 # =============================================================================
@@ -443,7 +448,7 @@ class HunterDB:
             return False
 
         try:
-            self.client.table("airlines_to_scrape").insert(airline_data).execute()
+            self.client.table("airlines_to_scrape").insert(airline_data, returning="minimal").execute()
             return True
         except Exception as e:
             logger.error(f"Error adding airline: {e}")
@@ -459,7 +464,7 @@ class HunterDB:
                 "career_page_url": url,
                 "ats_type": ats_type,
                 "status": "active"
-            }).eq("name", name).execute()
+            }, returning="minimal").eq("name", name).execute()
             return True
         except Exception as e:
             logger.error(f"Error updating airline: {e}")
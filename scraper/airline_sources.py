@@ -59,6 +59,9 @@ TALEO_AIRLINES = {
 # ============================================================
 # WORKDAY ATS - Modern cloud-based ATS
 # URL Pattern: Usually myworkdayjobs.com or wd5.myworkdayjobs.com
+# Optional keys narrow the search API query at the source:
+#   "workday_facets": {"jobFamilyGroup": ["<facet id>", ...]}
+#   "workday_search_text": "pilot" (default)
 # ============================================================
 WORKDAY_AIRLINES = {
     "virgin_atlantic": {
@@ -0,0 +1,14 @@
+"""
+Shared writer for the scrapers' JSON result files
+"""
+
+import orjson
+
+# Indented like before, UTF-8 kept as-is (orjson writes bytes)
+JSON_OUTPUT_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def write_json(path: str, obj):
+    """Write obj to path as indented UTF-8 JSON"""
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(obj, option=JSON_OUTPUT_OPTIONS))
@@ -42,6 +42,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Dead links deactivated per UPDATE in `validate` (the ids travel in the URL)
+DEACTIVATE_CHUNK_SIZE = 50
+
 
 def cmd_scrape(args):
     """Run the universal scraper"""
@@ -217,6 +220,15 @@ def cmd_validate(args):
 
     valid = 0
     invalid = 0
+    invalid_ids = []
+
+    def deactivate():
+        """Deactivate the dead links found so far in one UPDATE ... WHERE id IN (...)"""
+        nonlocal invalid
+        invalid += len(invalid_ids)
+        if invalid_ids and not args.dry_run:
+            client.table("pilot_jobs").update({"is_active": False}, returning="minimal").in_("id", invalid_ids).execute()
+        invalid_ids.clear()
 
     for job in jobs.data:
         try:
@@ -224,16 +236,17 @@ def cmd_validate(args):
             if response.status_code < 400:
                 valid += 1
             else:
-                invalid += 1
-                if not args.dry_run:
-                    client.table("pilot_jobs").update({"is_active": False}).eq("id", job["id"]).execute()
+                invalid_ids.append(job["id"])
                 print(f"  ✗ {job['company']}: {response.status_code}")
         except Exception as e:
-            invalid += 1
-            if not args.dry_run:
-                client.table("pilot_jobs").update({"is_active": False}).eq("id", job["id"]).execute()
+            invalid_ids.append(job["id"])
             print(f"  ✗ {job['company']}: {str(e)[:50]}")
 
+        # Write as we go, so a crash part-way keeps what was already checked
+        if len(invalid_ids) >= DEACTIVATE_CHUNK_SIZE:
+            deactivate()
+    deactivate()
+
     print(f"\nResults: {valid} valid, {invalid} invalid")
     if args.dry_run:
         print("(Dry run - no changes made)")
@@ -9,9 +9,16 @@ This normalizer standardizes everything into a consistent format.
 """
 
 import re
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 from rapidfuzz import fuzz, process
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # ============================================================
 # AIRCRAFT STANDARDIZATION
 # ============================================================
@@ -69,6 +76,25 @@ AIRCRAFT_ALIASES = {
     'tbm': 'TBM', 'tbm 900': 'TBM 900', 'tbm 940': 'TBM 940',
 }
 
+
+def _build_alias_automaton(aliases: Dict) -> 'ahocorasick.Automaton':
+    """
+    Build an Aho-Corasick automaton over the alias keys.
+
+    Each key maps to (position in dict, value) so that, of all aliases found in
+    one scan, the caller can still pick the one listed first - the same winner
+    the old `for alias in aliases: if alias in text` loop returned.
+    """
+    automaton = ahocorasick.Automaton()
+    for order, (alias, value) in enumerate(aliases.items()):
+        automaton.add_word(alias, (order, value))
+    automaton.make_automaton()
+    return automaton
+
+
+if AHOCORASICK_AVAILABLE:
+    _AIRCRAFT_AC = _build_alias_automaton(AIRCRAFT_ALIASES)
+
 # ============================================================
 # POSITION STANDARDIZATION
 # ============================================================
@@ -120,6 +146,111 @@ REGULATORY_PATTERNS = {
     'CAAS': [r'\bcaas\b', r'\bsingapore\b'],
 }
 
+# ============================================================
+# REQUIREMENT PATTERNS (compiled once, applied to every job)
+# ============================================================
+
+# Pattern: number (3-5 digits) + optional "+" + whitespace/newlines + hours/hrs/total time
+_TOTAL_HOURS_PATTERNS = [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in [
+    r'(\d{3,5})\+?\s*(?:hrs?|hours?|total\s*flying\s*time|total\s*time)',
+    r'(\d{3,5})\s*\+?\s*(?:hours?|hrs?)?\s*(?:total|tt|total\s*time|total\s*flight)',
+    r'total\s*(?:time|hours?|flight)[\s:]*(\d{3,5})',
+    r'minimum\s*(?:of\s*)?(\d{3,5})\s*(?:hours?|hrs?)',
+    r'(\d{3,5})\s*(?:hours?|hrs?)\s*(?:minimum|required)',
+]]
+
+_PIC_HOURS_PATTERNS = [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in [
+    r'(\d{3,5})\+?\s*(?:hrs?|hours?)?\s*(?:pic|command|p\.i\.c)',
+    r'(?:pic|command|p\.i\.c)[\s:]*(\d{3,5})',
+    r'(\d{3,5})\s*(?:hours?|hrs?)\s*(?:in\s*command|as\s*pic)',
+]]
+
+_TYPE_HOURS_PATTERNS = [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in [
+    r'(\d{2,5})\+?\s*(?:hrs?|hours?)?\s*(?:on\s*type|type)',
+    r'(?:on\s*type|type\s*hours?)[\s:]*(\d{2,5})',
+    r'(\d{2,5})\s*(?:hours?|hrs?)\s*on\s*(?:the\s*)?type',
+]]
+
+_TYPE_REQUIRED_PATTERNS = [re.compile(p) for p in [
+    r'type\s*rat(?:ed|ing)\s*(?:is\s*)?required',
+    r'must\s*(?:have|hold).*type\s*rat',
+    r'current\s*(?:and\s*valid\s*)?type\s*rat',
+    r'valid\s*type\s*rating\s*(?:on|for)',
+]]
+
+_TYPE_PROVIDED_PATTERNS = [re.compile(p) for p in [
+    r'type\s*rat(?:ed|ing).*(?:will\s*be\s*)?provided',
+    r'(?:we\s*)?(?:will\s*)?provide.*type\s*rat',
+    r'training\s*(?:will\s*be\s*)?provided',
+    r'non[\s-]*type[\s-]*rated.*(?:welcome|accepted|considered)',
+]]
+
+_VISA_PATTERNS = [re.compile(p) for p in [
+    r'visa\s*(?:sponsorship|sponsored|support)',
+    r'sponsor(?:ed|ship)?\s*(?:for\s*)?visa',
+    r'work\s*permit\s*(?:provided|sponsored|support)',
+    r'relocation\s*(?:assistance|support|package)',
+    r'will\s*sponsor',
+    r'sponsorship\s*(?:is\s*)?available',
+    r'international\s*(?:candidates?|applicants?)\s*(?:welcome|considered|accepted)',
+    r'no\s*(?:visa|work\s*permit)\s*restrictions',
+]]
+
+_COMMUTE_PATTERNS = [re.compile(p) for p in [
+    r'home[\s-]*bas(?:ed|ing)',
+    r'commut(?:ing|er)\s*(?:contract|roster|pattern)',
+    r'roster[\s:]*\d+[\s/]+\d+',  # e.g., "roster: 5/4" or "5/2 pattern"
+    r'days?\s*(?:on|off)[\s/:]+\d+',
+]]
+
+_ENTRY_LEVEL_PATTERNS = [re.compile(p) for p in [
+    r'\bcadet\b', r'\bab[\s-]*initio\b', r'\btrainee\b',
+    r'no\s*(?:prior\s*)?experience\s*(?:required|needed|necessary)',
+    r'zero[\s-]*(?:hour|time|experience)',
+    r'low[\s-]*hour',
+]]
+
+_TITLE_REPLACEMENTS = [(re.compile(p, re.IGNORECASE), r) for p, r in [
+    (r'\bF/?O\b', 'First Officer'),
+    (r'\bCpt\.?\b', 'Captain'),
+    (r'\bCapt\.?\b', 'Captain'),
+    (r'\bCo-?Pilot\b', 'First Officer'),
+    (r'\bSFO\b', 'Senior First Officer'),
+    (r'\bTR\b', 'Type Rated'),
+    (r'\bNTR\b', 'Non-Type Rated'),
+    (r'\bDE\b', 'Direct Entry'),
+]]
+
+_POSITION_RES = {k: [re.compile(p) for p in v] for k, v in POSITION_PATTERNS.items()}
+_LICENSE_RES = {k: [re.compile(p) for p in v] for k, v in LICENSE_PATTERNS.items()}
+_REGULATORY_RES = {k: [re.compile(p) for p in v] for k, v in REGULATORY_PATTERNS.items()}
+
+_LOCATION_PREFIX_RE = re.compile(r'^(?:based\s*(?:in|at)?|location:)\s*', re.IGNORECASE)
+_AIRCRAFT_MENTION_RE = re.compile(r'(?:a|b|e)?-?\d{3}(?:ng|max|neo|xlr)?')
+
+# Checked in order - the first category with a matching name wins
+_AIRCRAFT_CATEGORIES = (
+    ('narrowbody', ('A318', 'A319', 'A320', 'A321', 'B737', 'A320 Family')),
+    ('widebody', ('A330', 'A340', 'A350', 'A380', 'B747', 'B757', 'B767', 'B777', 'B787')),
+    ('regional', ('E170', 'E175', 'E190', 'E195', 'CRJ', 'ATR', 'Dash 8', 'Saab')),
+    ('turboprop', ('ATR', 'Dash 8', 'Saab 340', 'PC-12')),
+    ('business', ('Citation', 'Learjet', 'Gulfstream', 'Global', 'Challenger', 'Falcon', 'Phenom')),
+)
+
+
+@lru_cache(maxsize=256)
+def _aircraft_category(aircraft: str) -> str:
+    """Category for a standardized aircraft name (a small, fixed set - memoized)"""
+    aircraft_upper = aircraft.upper()
+
+    for category, names in _AIRCRAFT_CATEGORIES:
+        for name in names:
+            if name in aircraft_upper:
+                return category
+
+    return 'unknown'
+
+
 # ============================================================
 # NORMALIZER CLASS
 # ============================================================
@@ -127,6 +258,9 @@ REGULATORY_PATTERNS = {
 class JobNormalizer:
     """Normalizes job data into consistent format"""
 
+    # Stateless - no per-instance __dict__
+    __slots__ = ()
+
     def normalize_job(self, job: Dict) -> Dict:
         """
         Normalize a job dictionary.
@@ -141,13 +275,14 @@ class JobNormalizer:
 
         # Normalize title and extract info
         title = job.get('title', '')
+        description = job.get('description', '')
         normalized['original_title'] = title
 
         # Extract and normalize position type
         normalized['position_type'] = self.extract_position_type(title)
 
         # Extract and normalize aircraft type
-        aircraft = self.extract_aircraft(title + ' ' + job.get('description', ''))
+        aircraft = self.extract_aircraft(title + ' ' + description)
         normalized['aircraft_type'] = aircraft['type']
         normalized['aircraft_category'] = aircraft['category']
 
@@ -158,12 +293,12 @@ class JobNormalizer:
         normalized['location'] = self.normalize_location(job.get('location', ''))
 
         # Extract requirements from description
-        requirements = self.extract_requirements(job.get('description', ''))
+        requirements = self.extract_requirements(description)
         normalized.update(requirements)
 
         # Normalize license requirements
         normalized['license_required'] = self.extract_license(
-            job.get('description', '') + ' ' + title
+            description + ' ' + title
         )
 
         # Determine contract type
@@ -175,9 +310,9 @@ class JobNormalizer:
         """Extract position type from job title"""
         title_lower = title.lower()
 
-        for position, patterns in POSITION_PATTERNS.items():
+        for position, patterns in _POSITION_RES.items():
             for pattern in patterns:
-                if re.search(pattern, title_lower):
+                if pattern.search(title_lower):
                     return position
 
         # Default to first_officer if pilot-related but unclear
@@ -190,17 +325,25 @@ class JobNormalizer:
         """Extract aircraft type from text"""
         text_lower = text.lower()
 
-        # Direct match
-        for alias, standard in AIRCRAFT_ALIASES.items():
-            if alias in text_lower:
+        # Direct match - one pass over the text for every alias at once
+        if AHOCORASICK_AVAILABLE:
+            hit = min((value for _, value in _AIRCRAFT_AC.iter(text_lower)), default=None)
+            if hit:
+                standard = hit[1]
                 return {
                     'type': standard,
                     'category': self._get_aircraft_category(standard)
                 }
+        else:
+            for alias, standard in AIRCRAFT_ALIASES.items():
+                if alias in text_lower:
+                    return {
+                        'type': standard,
+                        'category': self._get_aircraft_category(standard)
+                    }
 
         # Fuzzy match for aircraft mentions
-        aircraft_pattern = r'(?:a|b|e)?-?\d{3}(?:ng|max|neo|xlr)?'
-        matches = re.findall(aircraft_pattern, text_lower)
+        matches = _AIRCRAFT_MENTION_RE.findall(text_lower)
 
         for match in matches:
             normalized = match.upper().replace('-', '')
@@ -215,31 +358,7 @@ class JobNormalizer:
 
     def _get_aircraft_category(self, aircraft: str) -> str:
         """Determine aircraft category"""
-        aircraft_upper = aircraft.upper()
-
-        narrowbody = ['A318', 'A319', 'A320', 'A321', 'B737', 'A320 Family']
-        widebody = ['A330', 'A340', 'A350', 'A380', 'B747', 'B757', 'B767', 'B777', 'B787']
-        regional = ['E170', 'E175', 'E190', 'E195', 'CRJ', 'ATR', 'Dash 8', 'Saab']
-        turboprop = ['ATR', 'Dash 8', 'Saab 340', 'PC-12']
-        business = ['Citation', 'Learjet', 'Gulfstream', 'Global', 'Challenger', 'Falcon', 'Phenom']
-
-        for nb in narrowbody:
-            if nb in aircraft_upper:
-                return 'narrowbody'
-        for wb in widebody:
-            if wb in aircraft_upper:
-                return 'widebody'
-        for rj in regional:
-            if rj in aircraft_upper:
-                return 'regional'
-        for tp in turboprop:
-            if tp in aircraft_upper:
-                return 'turboprop'
-        for bj in business:
-            if bj in aircraft_upper:
-                return 'business'
-
-        return 'unknown'
+        return _aircraft_category(aircraft)
 
     def clean_title(self, title: str) -> str:
         """Clean up job title to be more readable"""
@@ -247,19 +366,8 @@ class JobNormalizer:
         title = ' '.join(title.split())
 
         # Standardize common abbreviations
-        replacements = [
-            (r'\bF/?O\b', 'First Officer'),
-            (r'\bCpt\.?\b', 'Captain'),
-            (r'\bCapt\.?\b', 'Captain'),
-            (r'\bCo-?Pilot\b', 'First Officer'),
-            (r'\bSFO\b', 'Senior First Officer'),
-            (r'\bTR\b', 'Type Rated'),
-            (r'\bNTR\b', 'Non-Type Rated'),
-            (r'\bDE\b', 'Direct Entry'),
-        ]
-
-        for pattern, replacement in replacements:
-            title = re.sub(pattern, replacement, title, flags=re.IGNORECASE)
+        for pattern, replacement in _TITLE_REPLACEMENTS:
+            title = pattern.sub(replacement, title)
 
         return title.strip()
 
@@ -272,7 +380,7 @@ class JobNormalizer:
         location = ' '.join(location.split())
 
         # Remove common prefixes
-        location = re.sub(r'^(?:based\s*(?:in|at)?|location:)\s*', '', location, flags=re.IGNORECASE)
+        location = _LOCATION_PREFIX_RE.sub('', location)
 
         return location.strip() or 'Multiple Locations'
 
@@ -308,17 +416,8 @@ class JobNormalizer:
         # =================================================================
 
         # Total hours - "Super Regex" that handles multi-line text
-        # Pattern: number (3-5 digits) + optional "+" + whitespace/newlines + hours/hrs/total time
-        total_patterns = [
-            r'(\d{3,5})\+?\s*(?:hrs?|hours?|total\s*flying\s*time|total\s*time)',
-            r'(\d{3,5})\s*\+?\s*(?:hours?|hrs?)?\s*(?:total|tt|total\s*time|total\s*flight)',
-            r'total\s*(?:time|hours?|flight)[\s:]*(\d{3,5})',
-            r'minimum\s*(?:of\s*)?(\d{3,5})\s*(?:hours?|hrs?)',
-            r'(\d{3,5})\s*(?:hours?|hrs?)\s*(?:minimum|required)',
-        ]
-
-        for pattern in total_patterns:
-            match = re.search(pattern, desc_lower, re.IGNORECASE | re.MULTILINE)
+        for pattern in _TOTAL_HOURS_PATTERNS:
+            match = pattern.search(desc_lower)
             if match:
                 hours = int(match.group(1))
                 if 100 <= hours <= 25000:  # Reasonable range
@@ -326,14 +425,8 @@ class JobNormalizer:
                     break
 
         # PIC hours - also multi-line aware
-        pic_patterns = [
-            r'(\d{3,5})\+?\s*(?:hrs?|hours?)?\s*(?:pic|command|p\.i\.c)',
-            r'(?:pic|command|p\.i\.c)[\s:]*(\d{3,5})',
-            r'(\d{3,5})\s*(?:hours?|hrs?)\s*(?:in\s*command|as\s*pic)',
-        ]
-
-        for pattern in pic_patterns:
-            match = re.search(pattern, desc_lower, re.IGNORECASE | re.MULTILINE)
+        for pattern in _PIC_HOURS_PATTERNS:
+            match = pattern.search(desc_lower)
             if match:
                 hours = int(match.group(1))
                 if 100 <= hours <= 15000:
@@ -341,14 +434,8 @@ class JobNormalizer:
                     break
 
         # Type hours - also multi-line aware
-        type_patterns = [
-            r'(\d{2,5})\+?\s*(?:hrs?|hours?)?\s*(?:on\s*type|type)',
-            r'(?:on\s*type|type\s*hours?)[\s:]*(\d{2,5})',
-            r'(\d{2,5})\s*(?:hours?|hrs?)\s*on\s*(?:the\s*)?type',
-        ]
-
-        for pattern in type_patterns:
-            match = re.search(pattern, desc_lower, re.IGNORECASE | re.MULTILINE)
+        for pattern in _TYPE_HOURS_PATTERNS:
+            match = pattern.search(desc_lower)
             if match:
                 hours = int(match.group(1))
                 if 50 <= hours <= 10000:
@@ -356,46 +443,20 @@ class JobNormalizer:
                     break
 
         # Type rating required
-        if any(re.search(p, desc_lower) for p in [
-            r'type\s*rat(?:ed|ing)\s*(?:is\s*)?required',
-            r'must\s*(?:have|hold).*type\s*rat',
-            r'current\s*(?:and\s*valid\s*)?type\s*rat',
-            r'valid\s*type\s*rating\s*(?:on|for)',
-        ]):
+        if any(p.search(desc_lower) for p in _TYPE_REQUIRED_PATTERNS):
             requirements['type_rating_required'] = True
 
         # Type rating provided
-        if any(re.search(p, desc_lower) for p in [
-            r'type\s*rat(?:ed|ing).*(?:will\s*be\s*)?provided',
-            r'(?:we\s*)?(?:will\s*)?provide.*type\s*rat',
-            r'training\s*(?:will\s*be\s*)?provided',
-            r'non[\s-]*type[\s-]*rated.*(?:welcome|accepted|considered)',
-        ]):
+        if any(p.search(desc_lower) for p in _TYPE_PROVIDED_PATTERNS):
             requirements['type_rating_provided'] = True
 
         # Visa sponsorship detection
-        visa_patterns = [
-            r'visa\s*(?:sponsorship|sponsored|support)',
-            r'sponsor(?:ed|ship)?\s*(?:for\s*)?visa',
-            r'work\s*permit\s*(?:provided|sponsored|support)',
-            r'relocation\s*(?:assistance|support|package)',
-            r'will\s*sponsor',
-            r'sponsorship\s*(?:is\s*)?available',
-            r'international\s*(?:candidates?|applicants?)\s*(?:welcome|considered|accepted)',
-            r'no\s*(?:visa|work\s*permit)\s*restrictions',
-        ]
-        if any(re.search(p, desc_lower) for p in visa_patterns):
+        if any(p.search(desc_lower) for p in _VISA_PATTERNS):
             requirements['visa_sponsorship'] = True
             requirements['tags'].append('Visa Sponsored')
 
         # Commuting/Home-based detection
-        commute_patterns = [
-            r'home[\s-]*bas(?:ed|ing)',
-            r'commut(?:ing|er)\s*(?:contract|roster|pattern)',
-            r'roster[\s:]*\d+[\s/]+\d+',  # e.g., "roster: 5/4" or "5/2 pattern"
-            r'days?\s*(?:on|off)[\s/:]+\d+',
-        ]
-        if any(re.search(p, desc_lower) for p in commute_patterns):
+        if any(p.search(desc_lower) for p in _COMMUTE_PATTERNS):
             requirements['tags'].append('Commuting Contract')
 
         # =================================================================
@@ -415,12 +476,7 @@ class JobNormalizer:
         # 5000+ hours. Don't guess without evidence.
 
         # HIGH CONFIDENCE: Explicit cadet/trainee keywords
-        if any(re.search(p, desc_lower) for p in [
-            r'\bcadet\b', r'\bab[\s-]*initio\b', r'\btrainee\b',
-            r'no\s*(?:prior\s*)?experience\s*(?:required|needed|necessary)',
-            r'zero[\s-]*(?:hour|time|experience)',
-            r'low[\s-]*hour',
-        ]):
+        if any(p.search(desc_lower) for p in _ENTRY_LEVEL_PATTERNS):
             requirements['is_entry_level'] = True
             if 'Entry Level' not in requirements['tags']:
                 requirements['tags'].append('Entry Level')
@@ -434,16 +490,16 @@ class JobNormalizer:
         regulators = []
 
         # Find license types
-        for license_type, patterns in LICENSE_PATTERNS.items():
+        for license_type, patterns in _LICENSE_RES.items():
             for pattern in patterns:
-                if re.search(pattern, text_lower):
+                if pattern.search(text_lower):
                     licenses.append(license_type)
                     break
 
         # Find regulatory body
-        for regulator, patterns in REGULATORY_PATTERNS.items():
+        for regulator, patterns in _REGULATORY_RES.items():
             for pattern in patterns:
-                if re.search(pattern, text_lower):
+                if pattern.search(text_lower):
                     regulators.append(regulator)
                     break
 
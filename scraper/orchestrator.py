@@ -32,6 +32,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from airline_sources import AIRLINES_BY_ATS, get_all_airlines, get_airlines_by_ats
 from normalizer import JobNormalizer
+from json_output import write_json
 from scrapers.workday_scraper import WorkdayScraper
 from scrapers.taleo_scraper import TaleoScraper
 from scrapers.successfactors_scraper import SuccessfactorsScraper
@@ -84,60 +85,67 @@ class ScraperOrchestrator:
         self.stats['start_time'] = datetime.now().isoformat()
         all_jobs = []
 
-        # Get all airlines from database
-        airlines = get_all_airlines()
-        print(f"\nTotal airlines to scrape: {len(airlines)}")
-
-        # Group by ATS type for efficient scraping
-        taleo_airlines = [a for a in airlines if a.get('ats_type') == 'taleo']
-        workday_airlines = [a for a in airlines if a.get('ats_type') == 'workday']
-        sf_airlines = [a for a in airlines if a.get('ats_type') == 'successfactors']
-        direct_airlines = [a for a in airlines if a.get('ats_type') == 'direct']
-
-        print(f"\nBy ATS type:")
-        print(f"  Taleo: {len(taleo_airlines)}")
-        print(f"  Workday: {len(workday_airlines)}")
-        print(f"  SuccessFactors: {len(sf_airlines)}")
-        print(f"  Direct: {len(direct_airlines)}")
-
-        # Scrape each ATS type
-        print("\n" + "-"*50)
-        print("SCRAPING TALEO AIRLINES")
-        print("-"*50)
-        taleo_jobs = await self._scrape_airlines(taleo_airlines, self.taleo_scraper)
-        all_jobs.extend(taleo_jobs)
-
-        print("\n" + "-"*50)
-        print("SCRAPING WORKDAY AIRLINES")
-        print("-"*50)
-        workday_jobs = await self._scrape_airlines(workday_airlines, self.workday_scraper)
-        all_jobs.extend(workday_jobs)
-
-        print("\n" + "-"*50)
-        print("SCRAPING SUCCESSFACTORS AIRLINES")
-        print("-"*50)
-        sf_jobs = await self._scrape_airlines(sf_airlines, self.successfactors_scraper)
-        all_jobs.extend(sf_jobs)
-
-        # Scrape recruitment agencies
-        print("\n" + "-"*50)
-        print("SCRAPING RECRUITMENT AGENCIES")
-        print("-"*50)
-        agency_jobs = await self.agency_orchestrator.fetch_all_jobs()
-        all_jobs.extend(agency_jobs)
-        print(f"Agency jobs: {len(agency_jobs)}")
-
-        # Normalize all jobs
-        print("\n" + "-"*50)
-        print("NORMALIZING DATA")
-        print("-"*50)
+        # Normalize each airline's jobs as soon as they arrive, while the
+        # next scrapes are waiting on the network
         normalized_jobs = []
-        for job in all_jobs:
-            try:
-                normalized = self.normalizer.normalize_job(job)
-                normalized_jobs.append(normalized)
-            except Exception as e:
-                print(f"[Normalizer] Error: {e}")
+        normalize_queue = asyncio.Queue()
+        normalize_task = asyncio.create_task(
+            self._normalize_worker(normalize_queue, normalized_jobs)
+        )
+
+        # The worker never exits on its own; cancel it even if a scrape raises
+        try:
+            # Get all airlines from database
+            airlines = get_all_airlines()
+            print(f"\nTotal airlines to scrape: {len(airlines)}")
+
+            # Group by ATS type for efficient scraping
+            taleo_airlines = [a for a in airlines if a.get('ats_type') == 'taleo']
+            workday_airlines = [a for a in airlines if a.get('ats_type') == 'workday']
+            sf_airlines = [a for a in airlines if a.get('ats_type') == 'successfactors']
+            direct_airlines = [a for a in airlines if a.get('ats_type') == 'direct']
+
+            print(f"\nBy ATS type:")
+            print(f"  Taleo: {len(taleo_airlines)}")
+            print(f"  Workday: {len(workday_airlines)}")
+            print(f"  SuccessFactors: {len(sf_airlines)}")
+            print(f"  Direct: {len(direct_airlines)}")
+
+            # Scrape each ATS type
+            print("\n" + "-"*50)
+            print("SCRAPING TALEO AIRLINES")
+            print("-"*50)
+            taleo_jobs = await self._scrape_airlines(taleo_airlines, self.taleo_scraper, normalize_queue)
+            all_jobs.extend(taleo_jobs)
+
+            print("\n" + "-"*50)
+            print("SCRAPING WORKDAY AIRLINES")
+            print("-"*50)
+            workday_jobs = await self._scrape_airlines(workday_airlines, self.workday_scraper, normalize_queue)
+            all_jobs.extend(workday_jobs)
+
+            print("\n" + "-"*50)
+            print("SCRAPING SUCCESSFACTORS AIRLINES")
+            print("-"*50)
+            sf_jobs = await self._scrape_airlines(sf_airlines, self.successfactors_scraper, normalize_queue)
+            all_jobs.extend(sf_jobs)
+
+            # Scrape recruitment agencies
+            print("\n" + "-"*50)
+            print("SCRAPING RECRUITMENT AGENCIES")
+            print("-"*50)
+            agency_jobs = await self.agency_orchestrator.fetch_all_jobs()
+            all_jobs.extend(agency_jobs)
+            normalize_queue.put_nowait(agency_jobs)
+            print(f"Agency jobs: {len(agency_jobs)}")
+
+            # Finish normalizing whatever is still queued
+            print("\n" + "-"*50)
+            print("NORMALIZING DATA")
+            print("-"*50)
+            await normalize_queue.join()
+        finally:
+            normalize_task.cancel()
 
         print(f"Normalized {len(normalized_jobs)} jobs")
 
@@ -272,14 +280,26 @@ class ScraperOrchestrator:
 
         return jobs
 
-    async def _scrape_airlines(self, airlines: List[Dict], scraper) -> List[Dict]:
-        """Scrape a list of airlines with a specific scraper"""
+    async def _scrape_airlines(
+        self,
+        airlines: List[Dict],
+        scraper,
+        normalize_queue: Optional[asyncio.Queue] = None
+    ) -> List[Dict]:
+        """
+        Scrape a list of airlines with a specific scraper
+
+        Each airline's jobs are also handed to normalize_queue, if given,
+        as soon as that airline is done.
+        """
         all_jobs = []
 
         for airline in airlines:
             try:
                 jobs = await scraper.fetch_jobs(airline)
                 all_jobs.extend(jobs)
+                if normalize_queue is not None:
+                    normalize_queue.put_nowait(jobs)
                 self.stats['airlines_scraped'] += 1
             except Exception as e:
                 error_msg = f"Error scraping {airline.get('name')}: {str(e)}"
@@ -291,6 +311,24 @@ class ScraperOrchestrator:
 
         return all_jobs
 
+    async def _normalize_worker(self, queue: asyncio.Queue, normalized_jobs: List[Dict]):
+        """
+        Normalize batches of jobs from queue into normalized_jobs until cancelled
+
+        A single worker: normalization is CPU-bound Python, so it only pays to
+        run it in the gaps while scrapers await I/O, in arrival order.
+        """
+        while True:
+            jobs = await queue.get()
+            try:
+                for job in jobs:
+                    try:
+                        normalized_jobs.append(self.normalizer.normalize_job(job))
+                    except Exception as e:
+                        print(f"[Normalizer] Error: {e}")
+            finally:
+                queue.task_done()
+
     def _deduplicate_jobs(self, jobs: List[Dict]) -> List[Dict]:
         """Remove duplicate jobs based on key fields"""
         seen = set()
@@ -317,15 +355,14 @@ class ScraperOrchestrator:
 
         # Save as JSON
         json_path = os.path.join(self.output_dir, f'{filename}_{timestamp}.json')
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump({
-                'metadata': {
-                    'scraped_at': datetime.now().isoformat(),
-                    'total_jobs': len(jobs),
-                    'stats': self.stats,
-                },
-                'jobs': jobs
-            }, f, indent=2, ensure_ascii=False)
+        write_json(json_path, {
+            'metadata': {
+                'scraped_at': datetime.now().isoformat(),
+                'total_jobs': len(jobs),
+                'stats': self.stats,
+            },
+            'jobs': jobs
+        })
 
         print(f"\nResults saved to: {json_path}")
 
@@ -336,8 +373,7 @@ class ScraperOrchestrator:
 
         # Save latest (overwrite)
         latest_path = os.path.join(self.output_dir, 'latest_jobs.json')
-        with open(latest_path, 'w', encoding='utf-8') as f:
-            json.dump({'jobs': jobs}, f, indent=2, ensure_ascii=False)
+        write_json(latest_path, {'jobs': jobs})
 
     def _save_csv(self, jobs: List[Dict], filepath: str):
         """Save jobs as CSV"""
@@ -71,6 +71,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from scrapers.playwright_scraper import PlaywrightScraper
 from normalizer import JobNormalizer
+from json_output import write_json
 
 
 class ProxyManager:
@@ -177,9 +178,10 @@ class DatabaseManager:
 
                 if db_jobs:
                     # Upsert: Update if URL exists, insert if new
-                    result = self.supabase.table('pilot_jobs').upsert(
+                    self.supabase.table('pilot_jobs').upsert(
                         db_jobs,
-                        on_conflict='application_url'
+                        on_conflict='application_url',
+                        returning='minimal'
                     ).execute()
 
                     saved_count = len(db_jobs)
@@ -200,17 +202,15 @@ class DatabaseManager:
 
         # Save timestamped version
         json_path = self.output_dir / f'jobs_{timestamp}.json'
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump({
-                'scraped_at': datetime.now().isoformat(),
-                'total_jobs': len(jobs),
-                'jobs': jobs
-            }, f, indent=2, ensure_ascii=False)
+        write_json(json_path, {
+            'scraped_at': datetime.now().isoformat(),
+            'total_jobs': len(jobs),
+            'jobs': jobs
+        })
 
         # Update latest_jobs.json (for frontend fallback)
         latest_path = self.output_dir / 'latest_jobs.json'
-        with open(latest_path, 'w', encoding='utf-8') as f:
-            json.dump({'jobs': jobs}, f, indent=2, ensure_ascii=False)
+        write_json(latest_path, {'jobs': jobs})
 
         logger.info(f"✓ Saved {len(jobs)} jobs to {json_path}")
 
@@ -223,7 +223,7 @@ class DatabaseManager:
             cutoff = datetime.now() - timedelta(hours=hours)
             self.supabase.table('pilot_jobs').update({
                 'is_active': False
-            }).lt('date_scraped', cutoff.isoformat()).execute()
+            }, returning='minimal').lt('date_scraped', cutoff.isoformat()).execute()
 
             logger.info(f"✓ Marked jobs older than {hours} hours as inactive")
         except Exception as e:
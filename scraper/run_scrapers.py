@@ -3,7 +3,6 @@ Quick script to run all Playwright scrapers and update latest_jobs.json
 """
 
 import asyncio
-import json
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -17,6 +16,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from scrapers.playwright_scraper import PlaywrightScraper
 from normalizer import JobNormalizer
+from json_output import write_json
 
 
 async def run_all_scrapers():
@@ -77,21 +77,19 @@ async def run_all_scrapers():
     # Save timestamped version
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     timestamped_file = output_dir / f'jobs_{timestamp}.json'
-    with open(timestamped_file, 'w', encoding='utf-8') as f:
-        json.dump({
-            'metadata': {
-                'scraped_at': datetime.now().isoformat(),
-                'total_jobs': len(unique_jobs),
-            },
-            'jobs': unique_jobs
-        }, f, indent=2, ensure_ascii=False)
+    write_json(timestamped_file, {
+        'metadata': {
+            'scraped_at': datetime.now().isoformat(),
+            'total_jobs': len(unique_jobs),
+        },
+        'jobs': unique_jobs
+    })
 
     print(f"Saved to: {timestamped_file}")
 
     # Update latest_jobs.json (used by frontend)
     latest_file = output_dir / 'latest_jobs.json'
-    with open(latest_file, 'w', encoding='utf-8') as f:
-        json.dump({'jobs': unique_jobs}, f, indent=2, ensure_ascii=False)
+    write_json(latest_file, {'jobs': unique_jobs})
 
     print(f"Updated: {latest_file}")
 
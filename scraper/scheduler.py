@@ -46,6 +46,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from scrapers.playwright_scraper import PlaywrightScraper
 from normalizer import JobNormalizer
+from json_output import write_json
 
 # Try to import Supabase
 try:
@@ -189,20 +190,18 @@ class JobScheduler:
 
         # Save to local JSON (always)
         json_path = self.output_dir / f'jobs_{timestamp}.json'
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump({
-                'metadata': {
-                    'scraped_at': datetime.now().isoformat(),
-                    'total_jobs': len(jobs),
-                },
-                'jobs': jobs
-            }, f, indent=2, ensure_ascii=False)
+        write_json(json_path, {
+            'metadata': {
+                'scraped_at': datetime.now().isoformat(),
+                'total_jobs': len(jobs),
+            },
+            'jobs': jobs
+        })
         logger.info(f"Saved to: {json_path}")
 
         # Update latest_jobs.json
         latest_path = self.output_dir / 'latest_jobs.json'
-        with open(latest_path, 'w', encoding='utf-8') as f:
-            json.dump({'jobs': jobs}, f, indent=2, ensure_ascii=False)
+        write_json(latest_path, {'jobs': jobs})
         logger.info(f"Updated: {latest_path}")
 
         # Save to Supabase (if connected)
@@ -245,9 +244,10 @@ class JobScheduler:
 
             # Upsert to database (update if URL exists, insert if new)
             # Using application_url as unique identifier
-            result = self.supabase.table('pilot_jobs').upsert(
+            self.supabase.table('pilot_jobs').upsert(
                 db_jobs,
-                on_conflict='application_url'
+                on_conflict='application_url',
+                returning='minimal'
             ).execute()
 
             logger.info(f"Saved {len(db_jobs)} jobs to Supabase")
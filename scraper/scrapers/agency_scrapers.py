@@ -37,6 +37,7 @@ class RishworthScraper:
         'pilot', 'captain', 'first officer', 'f/o', 'cadet',
         'a320', 'a330', 'a350', 'b737', 'b777', 'b787',
     ]
+    _PILOT_RE = re.compile('|'.join(map(re.escape, PILOT_KEYWORDS)), re.IGNORECASE)
 
     async def fetch_jobs(self) -> List[Dict]:
         """Fetch all pilot jobs from Rishworth"""
@@ -146,7 +147,7 @@ class RishworthScraper:
     def _is_pilot_job(self, title: str) -> bool:
         if not title:
             return False
-        return any(kw in title.lower() for kw in self.PILOT_KEYWORDS)
+        return self._PILOT_RE.search(title) is not None
 
     def _detect_region(self, location: str) -> str:
         loc_lower = location.lower()
@@ -252,7 +253,8 @@ class PARCScraper:
 
     def _is_pilot_job(self, text: str) -> bool:
         keywords = ['pilot', 'captain', 'first officer', 'f/o', 'cadet', 'a320', 'b737']
-        return any(kw in text.lower() for kw in keywords)
+        text_lower = text.lower()
+        return any(kw in text_lower for kw in keywords)
 
 
 class OSMScraper:
@@ -313,7 +315,8 @@ class OSMScraper:
 
     def _is_pilot_job(self, text: str) -> bool:
         keywords = ['pilot', 'captain', 'first officer', 'f/o', 'cadet', 'flight crew']
-        return any(kw in text.lower() for kw in keywords)
+        text_lower = text.lower()
+        return any(kw in text_lower for kw in keywords)
 
 
 class GooseRecruitmentScraper:
@@ -401,7 +404,8 @@ class GooseRecruitmentScraper:
 
     def _is_pilot_job(self, text: str) -> bool:
         keywords = ['pilot', 'captain', 'first officer', 'f/o', 'cadet', 'flight crew', 'atpl', 'cpl']
-        return any(kw in text.lower() for kw in keywords)
+        text_lower = text.lower()
+        return any(kw in text_lower for kw in keywords)
 
 
 class AgencyOrchestrator:
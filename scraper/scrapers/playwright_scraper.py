@@ -19,6 +19,7 @@ import sys
 from datetime import datetime
 from typing import List, Dict, Optional
 from pathlib import Path
+from urllib.parse import urljoin
 
 # Fix Windows console encoding
 if sys.platform == 'win32':
@@ -38,6 +39,47 @@ try:
 except ImportError:
     STEALTH_AVAILABLE = False
 
+# Airline sites rendered at once by scrape_all (one browser context each)
+MAX_CONCURRENT_SITES = 5
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Per-site cookies/localStorage, so consent banners are answered once, not every run
+STATE_DIR = Path(__file__).parent.parent / 'state' / 'playwright'
+
+# Consent buttons clicked on a site's first visit (before its state is saved)
+CONSENT_BUTTON_RE = re.compile(r'^\s*(accept all|accept all cookies|accept cookies|allow all|i accept|agree)\s*$', re.IGNORECASE)
+
+# A job list counts as loaded once at least JOB_LIST_MIN_LINKS links match and
+# that count has stopped changing for JOB_LIST_SETTLE_MS. Header/nav links that
+# happen to match are there at DOMContentLoaded, so "a match exists" alone
+# would return before a JS-rendered list has arrived.
+JOB_LIST_MIN_LINKS = 2
+JOB_LIST_SETTLE_MS = 1500
+_LIST_SETTLED_JS = """([selector, minCount, settleMs]) => {
+    const count = document.querySelectorAll(selector).length;
+    const state = window.__jobListWait || (window.__jobListWait = {count: -1, since: 0});
+    const now = performance.now();
+    if (count !== state.count) {
+        state.count = count;
+        state.since = now;
+    }
+    return count >= minCount && now - state.since >= settleMs;
+}"""
+
+# Link text arrives with newlines/indentation from the page layout
+_WS_RE = re.compile(r'\s+')
+
+# We only read link text and hrefs - never fetch what only affects rendering
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+
+
+async def _block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
 
 class PlaywrightScraper:
     """Universal scraper using Playwright for JavaScript-rendered sites"""
@@ -60,6 +102,9 @@ class PlaywrightScraper:
         'engineer', 'mechanic', 'technician', 'analyst', 'developer'
     ]
 
+    _PILOT_RE = re.compile('|'.join(map(re.escape, PILOT_KEYWORDS)), re.IGNORECASE)
+    _EXCLUDE_RE = re.compile('|'.join(map(re.escape, EXCLUDE_KEYWORDS)), re.IGNORECASE)
+
     def __init__(self, headless: bool = True):
         """
         Initialize Playwright scraper
@@ -71,10 +116,18 @@ class PlaywrightScraper:
         self.browser: Optional[Browser] = None
 
     async def _init_browser(self):
-        """Initialize Playwright browser"""
+        """
+        Initialize Playwright browser
+
+        Returns None when a browser is already running (e.g. the one shared
+        by scrape_all), in which case the caller only opens a new context on it.
+        """
         if not PLAYWRIGHT_AVAILABLE:
             raise RuntimeError("Playwright is not installed")
 
+        if self.browser:
+            return None
+
         playwright = await async_playwright().start()
         self.browser = await playwright.chromium.launch(
             headless=self.headless,
@@ -87,52 +140,117 @@ class PlaywrightScraper:
         return playwright
 
     async def _close_browser(self, playwright):
-        """Close browser and cleanup"""
+        """Close browser and cleanup (no-op for a shared browser)"""
+        if playwright is None:
+            return
         if self.browser:
             await self.browser.close()
+            self.browser = None
         await playwright.stop()
 
+    async def _new_page(self, site: str):
+        """
+        Open a context + page on the browser, with heavy resources blocked and stealth applied
+
+        The context starts from the site's saved storage state when there is
+        one, so returning runs arrive already past the cookie banner.
+        """
+        state_path = STATE_DIR / f'{site}.json'
+        context = await self.browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent=USER_AGENT,
+            storage_state=str(state_path) if state_path.exists() else None
+        )
+        await context.route('**/*', _block_heavy_resources)
+        page = await context.new_page()
+
+        # Apply stealth if available
+        if STEALTH_AVAILABLE:
+            stealth = Stealth()
+            await stealth.apply_stealth_async(page)
+
+        return context, page
+
+    async def _close_context(self, context, site: str):
+        """Save the site's storage state (accepting the consent banner on first visit) and close the context"""
+        state_path = STATE_DIR / f'{site}.json'
+        try:
+            if not state_path.exists():
+                for page in context.pages:
+                    try:
+                        await page.get_by_role('button', name=CONSENT_BUTTON_RE).first.click(timeout=2000)
+                    except Exception:
+                        pass
+            STATE_DIR.mkdir(parents=True, exist_ok=True)
+            await context.storage_state(path=str(state_path))
+        except Exception as e:
+            print(f"  Could not save browser state for {site}: {e}")
+        await context.close()
+
+    async def _wait_for_jobs(self, page: 'Page', selector: str, min_count: int = JOB_LIST_MIN_LINKS,
+                             timeout: int = 15000):
+        """
+        Wait until the job list matching selector has rendered and stopped growing.
+
+        If it never settles (no listings, or the list keeps changing), fall back
+        to networkidle with the same timeout - the old behaviour, minus the
+        fixed sleep. Neither timeout is an error.
+        """
+        try:
+            await page.wait_for_function(
+                _LIST_SETTLED_JS, arg=[selector, min_count, JOB_LIST_SETTLE_MS],
+                timeout=timeout, polling=250
+            )
+            return
+        except Exception:
+            pass
+
+        try:
+            await page.wait_for_load_state('networkidle', timeout=timeout)
+        except Exception:
+            pass
+
+    async def _extract_links(self, page: 'Page', selector: str) -> List[list]:
+        """
+        Read [text, href] for every element matching selector in one evaluate
+
+        Replaces per-element inner_text()/get_attribute() calls, which cost
+        two protocol round-trips per link.
+        """
+        return await page.eval_on_selector_all(
+            selector,
+            "els => els.map(el => [el.innerText, el.getAttribute('href')])"
+        )
+
     async def scrape_emirates(self) -> List[Dict]:
         """Scrape Emirates Group Careers - Pilot positions"""
         jobs = []
         playwright = await self._init_browser()
 
         try:
-            context = await self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            page = await context.new_page()
-
-            # Apply stealth if available
-            if STEALTH_AVAILABLE:
-                stealth = Stealth()
-                await stealth.apply_stealth_async(page)
+            context, page = await self._new_page('emirates')
 
             # Go directly to the pilots page which has the actual pilot positions
             print("[Emirates] Loading pilot careers page...")
-            await page.goto('https://www.emiratesgroupcareers.com/pilots/', timeout=60000)
-            await page.wait_for_load_state('networkidle')
-            await asyncio.sleep(3)
+            await page.goto('https://www.emiratesgroupcareers.com/pilots/', timeout=60000, wait_until='domcontentloaded')
+            await self._wait_for_jobs(page, 'a[href*="/search-and-apply/"], a[href*="/pilots/"]')
 
             # Find pilot position links - Emirates has specific role detail pages
-            links = await page.query_selector_all('a')
-
-            for link in links:
-                href = await link.get_attribute('href')
-                text = await link.inner_text()
+            links = await self._extract_links(page, 'a')
 
+            for text, href in links:
                 if not href or not text:
                     continue
 
-                text = text.strip().replace('\n', ' ')
+                text = _WS_RE.sub(' ', text).strip()
+                text_lower = text.lower()
 
                 # Look for actual pilot positions (Captain, First Officer, Cadet)
-                if any(term in text.lower() for term in ['captain', 'first officer', 'cadet', 'accelerated command']):
+                if any(term in text_lower for term in ['captain', 'first officer', 'cadet', 'accelerated command']):
                     # Clean up the title
-                    title = text.strip()
+                    title = text
                     # Remove "Starting from X hours" part for cleaner title
-                    if 'starting from' in title.lower():
+                    if 'starting from' in text_lower:
                         parts = title.split('Starting from')
                         title = parts[0].strip()
                         hours_info = parts[1].strip() if len(parts) > 1 else ''
@@ -140,7 +258,7 @@ class PlaywrightScraper:
                         hours_info = ''
 
                     # Determine position type
-                    title_lower = title.lower()
+                    title_lower = text_lower if title == text else title.lower()
                     if 'captain' in title_lower or 'command' in title_lower:
                         position_type = 'captain'
                     elif 'first officer' in title_lower:
@@ -158,7 +276,7 @@ class PlaywrightScraper:
                             min_hours = int(hours_match.group(1).replace(',', ''))
 
                     # Build full URL
-                    full_url = href if href.startswith('http') else f'https://www.emiratesgroupcareers.com{href}'
+                    full_url = urljoin(page.url, href)
 
                     job = {
                         'title': f'Emirates {title}',
@@ -183,16 +301,13 @@ class PlaywrightScraper:
                         print(f"  [Emirates] Found: {job['title']}")
 
             # Also check for direct job listings with numeric IDs
-            job_links = await page.query_selector_all('a[href*="/search-and-apply/"]')
-            for link in job_links:
-                href = await link.get_attribute('href')
-                text = await link.inner_text()
-
+            job_links = await self._extract_links(page, 'a[href*="/search-and-apply/"]')
+            for text, href in job_links:
                 if href and '/search-and-apply/' in href:
                     match = re.search(r'/search-and-apply/(\d+)', href)
                     if match and text:
                         # Get better title by checking page title
-                        text = text.strip().replace('\n', ' ')
+                        text = _WS_RE.sub(' ', text).strip()
                         if self._is_pilot_job(text) and 'cadet' in text.lower():
                             job = {
                                 'title': f'Emirates {text}' if not text.startswith('Emirates') else text,
@@ -202,7 +317,7 @@ class PlaywrightScraper:
                                 'position_type': 'cadet',
                                 'min_total_hours': 0,
                                 'type_rating_provided': True,
-                                'application_url': f'https://www.emiratesgroupcareers.com{href}' if href.startswith('/') else href,
+                                'application_url': urljoin(page.url, href),
                                 'source': 'Direct - Emirates',
                                 'date_scraped': datetime.now().isoformat(),
                                 'is_active': True,
@@ -210,7 +325,7 @@ class PlaywrightScraper:
                             if not any(j.get('application_url') == job['application_url'] for j in jobs):
                                 jobs.append(job)
 
-            await context.close()
+            await self._close_context(context, 'emirates')
 
         except Exception as e:
             print(f"[Emirates] Error: {e}")
@@ -227,15 +342,7 @@ class PlaywrightScraper:
         playwright = await self._init_browser()
 
         try:
-            context = await self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            page = await context.new_page()
-
-            if STEALTH_AVAILABLE:
-                stealth = Stealth()
-                await stealth.apply_stealth_async(page)
+            context, page = await self._new_page('ryanair')
 
             print("[Ryanair] Loading careers page...")
 
@@ -250,7 +357,7 @@ class PlaywrightScraper:
             for url in urls_to_try:
                 try:
                     await page.goto(url, timeout=30000, wait_until='domcontentloaded')
-                    await asyncio.sleep(3)
+                    await self._wait_for_jobs(page, 'a[href*="/jobs/"], a[href*="job"], a[href*="pilot"]')
                     page_loaded = True
                     break
                 except Exception as e:
@@ -287,30 +394,24 @@ class PlaywrightScraper:
                     'type_rating_required': True,
                     'contract_type': 'permanent',
                 })
-                await context.close()
+                await self._close_context(context, 'ryanair')
                 return jobs
 
-            # Wait for dynamic content
-            await asyncio.sleep(2)
-
             # Ryanair uses a React job board - try multiple selectors
             job_cards = await page.query_selector_all('[class*="job"], [class*="card"], [class*="position"], [data-testid*="job"]')
             print(f"[Ryanair] Found {len(job_cards)} job card elements")
 
             # Also try to find job links
-            links = await page.query_selector_all('a[href*="/jobs/"], a[href*="job"], a[href*="pilot"]')
-            for link in links:
+            links = await self._extract_links(page, 'a[href*="/jobs/"], a[href*="job"], a[href*="pilot"]')
+            for text, href in links:
                 try:
-                    href = await link.get_attribute('href')
-                    text = await link.inner_text()
-
                     if href and text and len(text.strip()) > 5:
                         job = {
                             'title': text.strip(),
                             'company': 'Ryanair',
                             'location': 'Europe (Multiple Bases)',
                             'region': 'europe',
-                            'application_url': f'https://careers.ryanair.com{href}' if href.startswith('/') else href,
+                            'application_url': urljoin(page.url, href),
                             'source': 'Direct - Ryanair',
                             'date_scraped': datetime.now().isoformat(),
                             'is_active': True,
@@ -322,7 +423,7 @@ class PlaywrightScraper:
                 except Exception:
                     continue
 
-            await context.close()
+            await self._close_context(context, 'ryanair')
 
         except Exception as e:
             print(f"[Ryanair] Error: {e}")
@@ -339,15 +440,7 @@ class PlaywrightScraper:
         playwright = await self._init_browser()
 
         try:
-            context = await self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            page = await context.new_page()
-
-            if STEALTH_AVAILABLE:
-                stealth = Stealth()
-                await stealth.apply_stealth_async(page)
+            context, page = await self._new_page('easyjet')
 
             print("[easyJet] Loading careers page...")
 
@@ -362,7 +455,7 @@ class PlaywrightScraper:
             for url in urls_to_try:
                 try:
                     await page.goto(url, timeout=30000, wait_until='domcontentloaded')
-                    await asyncio.sleep(2)
+                    await self._wait_for_jobs(page, 'a[href*="vacancy"], a[href*="job"], a[href*="pilot"]')
                     page_loaded = True
                     break
                 except Exception as e:
@@ -399,23 +492,20 @@ class PlaywrightScraper:
                     'type_rating_required': True,
                     'contract_type': 'permanent',
                 })
-                await context.close()
+                await self._close_context(context, 'easyjet')
                 return jobs
 
             # Look for job listings
-            links = await page.query_selector_all('a[href*="vacancy"], a[href*="job"], a[href*="pilot"]')
-            for link in links:
+            links = await self._extract_links(page, 'a[href*="vacancy"], a[href*="job"], a[href*="pilot"]')
+            for text, href in links:
                 try:
-                    href = await link.get_attribute('href')
-                    text = await link.inner_text()
-
                     if href and text and len(text.strip()) > 5:
                         job = {
                             'title': text.strip(),
                             'company': 'easyJet',
                             'location': 'UK/Europe',
                             'region': 'europe',
-                            'application_url': f'https://careers.easyjet.com{href}' if href.startswith('/') else href,
+                            'application_url': urljoin(page.url, href),
                             'source': 'Direct - easyJet',
                             'date_scraped': datetime.now().isoformat(),
                             'is_active': True,
@@ -427,7 +517,7 @@ class PlaywrightScraper:
                 except Exception:
                     continue
 
-            await context.close()
+            await self._close_context(context, 'easyjet')
 
         except Exception as e:
             print(f"[easyJet] Error: {e}")
@@ -444,15 +534,7 @@ class PlaywrightScraper:
         playwright = await self._init_browser()
 
         try:
-            context = await self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            page = await context.new_page()
-
-            if STEALTH_AVAILABLE:
-                stealth = Stealth()
-                await stealth.apply_stealth_async(page)
+            context, page = await self._new_page('wizz_air')
 
             print("[Wizz Air] Loading careers page...")
 
@@ -467,7 +549,7 @@ class PlaywrightScraper:
             for url in urls_to_try:
                 try:
                     await page.goto(url, timeout=30000, wait_until='domcontentloaded')
-                    await asyncio.sleep(2)
+                    await self._wait_for_jobs(page, 'a[href*="/jobs/"], a[href*="job"], a[href*="pilot"]')
                     page_loaded = True
                     break
                 except Exception as e:
@@ -504,23 +586,20 @@ class PlaywrightScraper:
                     'type_rating_required': True,
                     'contract_type': 'permanent',
                 })
-                await context.close()
+                await self._close_context(context, 'wizz_air')
                 return jobs
 
             # Look for job listings
-            links = await page.query_selector_all('a[href*="/jobs/"], a[href*="job"], a[href*="pilot"]')
-            for link in links:
+            links = await self._extract_links(page, 'a[href*="/jobs/"], a[href*="job"], a[href*="pilot"]')
+            for text, href in links:
                 try:
-                    href = await link.get_attribute('href')
-                    text = await link.inner_text()
-
                     if href and text and len(text.strip()) > 5:
                         job = {
                             'title': text.strip(),
                             'company': 'Wizz Air',
                             'location': 'Europe (Multiple Bases)',
                             'region': 'europe',
-                            'application_url': f'https://careers.wizzair.com{href}' if href.startswith('/') else href,
+                            'application_url': urljoin(page.url, href),
                             'source': 'Direct - Wizz Air',
                             'date_scraped': datetime.now().isoformat(),
                             'is_active': True,
@@ -532,7 +611,7 @@ class PlaywrightScraper:
                 except Exception:
                     continue
 
-            await context.close()
+            await self._close_context(context, 'wizz_air')
 
         except Exception as e:
             print(f"[Wizz Air] Error: {e}")
@@ -549,33 +628,21 @@ class PlaywrightScraper:
         playwright = await self._init_browser()
 
         try:
-            context = await self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            )
-            page = await context.new_page()
-
-            if STEALTH_AVAILABLE:
-                stealth = Stealth()
-                await stealth.apply_stealth_async(page)
+            context, page = await self._new_page('rishworth')
 
             print("[Rishworth] Loading pilot jobs page...")
-            await page.goto('https://www.rishworthaviation.com/pilot-jobs/', timeout=60000)
-            await page.wait_for_load_state('networkidle')
-            await asyncio.sleep(3)
+            await page.goto('https://www.rishworthaviation.com/pilot-jobs/', timeout=60000, wait_until='domcontentloaded')
+            await self._wait_for_jobs(page, 'a[href*="/job/"], a[href*="pilot"]')
 
             # Rishworth has a job listing page
             job_cards = await page.query_selector_all('[class*="job"], article, .card')
             print(f"[Rishworth] Found {len(job_cards)} job card elements")
 
             # Find all job links
-            links = await page.query_selector_all('a[href*="/job/"], a[href*="pilot"]')
+            links = await self._extract_links(page, 'a[href*="/job/"], a[href*="pilot"]')
             seen_urls = set()
 
-            for link in links:
-                href = await link.get_attribute('href')
-                text = await link.inner_text()
-
+            for text, href in links:
                 if href and text and len(text.strip()) > 5 and href not in seen_urls:
                     seen_urls.add(href)
 
@@ -599,7 +666,7 @@ class PlaywrightScraper:
                         'company': company,
                         'location': 'Various',
                         'region': 'global',
-                        'application_url': href if href.startswith('http') else f'https://www.rishworthaviation.com{href}',
+                        'application_url': urljoin(page.url, href),
                         'source': 'Rishworth Aviation',
                         'date_scraped': datetime.now().isoformat(),
                         'is_active': True,
@@ -608,7 +675,7 @@ class PlaywrightScraper:
                     if self._is_pilot_job(job['title']):
                         jobs.append(job)
 
-            await context.close()
+            await self._close_context(context, 'rishworth')
 
         except Exception as e:
             print(f"[Rishworth] Error: {e}")
@@ -625,15 +692,7 @@ class PlaywrightScraper:
         playwright = await self._init_browser()
 
         try:
-            context = await self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            page = await context.new_page()
-
-            if STEALTH_AVAILABLE:
-                stealth = Stealth()
-                await stealth.apply_stealth_async(page)
+            context, page = await self._new_page('qatar_airways')
 
             print("[Qatar Airways] Loading careers page...")
 
@@ -648,7 +707,7 @@ class PlaywrightScraper:
             for url in urls_to_try:
                 try:
                     await page.goto(url, timeout=30000, wait_until='domcontentloaded')
-                    await asyncio.sleep(3)
+                    await self._wait_for_jobs(page, 'a[href*="/job/"], a[href*="pilot"], [class*="job"] a')
                     page_loaded = True
                     break
                 except Exception as e:
@@ -687,17 +746,14 @@ class PlaywrightScraper:
                     'contract_type': 'permanent',
                     'salary_info': 'Tax-free competitive package',
                 })
-                await context.close()
+                await self._close_context(context, 'qatar_airways')
                 return jobs
 
             # Look for job cards
-            job_links = await page.query_selector_all('a[href*="/job/"], a[href*="pilot"], [class*="job"] a')
+            job_links = await self._extract_links(page, 'a[href*="/job/"], a[href*="pilot"], [class*="job"] a')
 
-            for link in job_links:
+            for text, href in job_links:
                 try:
-                    href = await link.get_attribute('href')
-                    text = await link.inner_text()
-
                     if href and text and len(text.strip()) > 3:
                         text = text.strip()
                         if self._is_pilot_job(text):
@@ -706,7 +762,7 @@ class PlaywrightScraper:
                                 'company': 'Qatar Airways',
                                 'location': 'Doha, Qatar',
                                 'region': 'middle_east',
-                                'application_url': href if href.startswith('http') else f'https://careers.qatarairways.com{href}',
+                                'application_url': urljoin(page.url, href),
                                 'source': 'Direct - Qatar Airways',
                                 'date_scraped': datetime.now().isoformat(),
                                 'is_active': True,
@@ -720,7 +776,7 @@ class PlaywrightScraper:
                 except Exception:
                     continue
 
-            await context.close()
+            await self._close_context(context, 'qatar_airways')
 
         except Exception as e:
             print(f"[Qatar Airways] Error: {e}")
@@ -737,15 +793,7 @@ class PlaywrightScraper:
         playwright = await self._init_browser()
 
         try:
-            context = await self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            page = await context.new_page()
-
-            if STEALTH_AVAILABLE:
-                stealth = Stealth()
-                await stealth.apply_stealth_async(page)
+            context, page = await self._new_page('etihad')
 
             print("[Etihad] Loading careers page...")
 
@@ -760,7 +808,7 @@ class PlaywrightScraper:
             for url in urls_to_try:
                 try:
                     await page.goto(url, timeout=30000, wait_until='domcontentloaded')
-                    await asyncio.sleep(3)
+                    await self._wait_for_jobs(page, 'a[href*="job"], a[href*="pilot"], [class*="job"] a')
                     page_loaded = True
                     break
                 except Exception as e:
@@ -799,17 +847,14 @@ class PlaywrightScraper:
                     'contract_type': 'permanent',
                     'salary_info': 'Tax-free competitive package',
                 })
-                await context.close()
+                await self._close_context(context, 'etihad')
                 return jobs
 
             # Look for job listings
-            job_links = await page.query_selector_all('a[href*="job"], a[href*="pilot"], [class*="job"] a')
+            job_links = await self._extract_links(page, 'a[href*="job"], a[href*="pilot"], [class*="job"] a')
 
-            for link in job_links:
+            for text, href in job_links:
                 try:
-                    href = await link.get_attribute('href')
-                    text = await link.inner_text()
-
                     if href and text and len(text.strip()) > 3:
                         text = text.strip()
                         if self._is_pilot_job(text):
@@ -818,7 +863,7 @@ class PlaywrightScraper:
                                 'company': 'Etihad Airways',
                                 'location': 'Abu Dhabi, UAE',
                                 'region': 'middle_east',
-                                'application_url': href if href.startswith('http') else f'https://careers.etihad.com{href}',
+                                'application_url': urljoin(page.url, href),
                                 'source': 'Direct - Etihad',
                                 'date_scraped': datetime.now().isoformat(),
                                 'is_active': True,
@@ -832,7 +877,7 @@ class PlaywrightScraper:
                 except Exception:
                     continue
 
-            await context.close()
+            await self._close_context(context, 'etihad')
 
         except Exception as e:
             print(f"[Etihad] Error: {e}")
@@ -849,28 +894,16 @@ class PlaywrightScraper:
         playwright = await self._init_browser()
 
         try:
-            context = await self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            )
-            page = await context.new_page()
-
-            if STEALTH_AVAILABLE:
-                stealth = Stealth()
-                await stealth.apply_stealth_async(page)
+            context, page = await self._new_page('flydubai')
 
             print("[flydubai] Loading careers page...")
-            await page.goto('https://careers.flydubai.com/en/jobs/?search=pilot', timeout=60000)
-            await page.wait_for_load_state('networkidle')
-            await asyncio.sleep(3)
+            await page.goto('https://careers.flydubai.com/en/jobs/?search=pilot', timeout=60000, wait_until='domcontentloaded')
+            await self._wait_for_jobs(page, 'a[href*="/job/"], a[href*="pilot"]')
 
             # Look for job listings
-            job_links = await page.query_selector_all('a[href*="/job/"], a[href*="pilot"]')
-
-            for link in job_links:
-                href = await link.get_attribute('href')
-                text = await link.inner_text()
+            job_links = await self._extract_links(page, 'a[href*="/job/"], a[href*="pilot"]')
 
+            for text, href in job_links:
                 if href and text and len(text.strip()) > 3:
                     text = text.strip()
                     if self._is_pilot_job(text):
@@ -879,7 +912,7 @@ class PlaywrightScraper:
                             'company': 'flydubai',
                             'location': 'Dubai, UAE',
                             'region': 'middle_east',
-                            'application_url': href if href.startswith('http') else f'https://careers.flydubai.com{href}',
+                            'application_url': urljoin(page.url, href),
                             'source': 'Direct - flydubai',
                             'date_scraped': datetime.now().isoformat(),
                             'is_active': True,
@@ -889,7 +922,7 @@ class PlaywrightScraper:
                             jobs.append(job)
                             print(f"  [flydubai] Found: {job['title']}")
 
-            await context.close()
+            await self._close_context(context, 'flydubai')
 
         except Exception as e:
             print(f"[flydubai] Error: {e}")
@@ -906,28 +939,16 @@ class PlaywrightScraper:
         playwright = await self._init_browser()
 
         try:
-            context = await self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            )
-            page = await context.new_page()
-
-            if STEALTH_AVAILABLE:
-                stealth = Stealth()
-                await stealth.apply_stealth_async(page)
+            context, page = await self._new_page('vueling')
 
             print("[Vueling] Loading careers page...")
-            await page.goto('https://careers.vueling.com/jobs?q=pilot', timeout=60000)
-            await page.wait_for_load_state('networkidle')
-            await asyncio.sleep(3)
+            await page.goto('https://careers.vueling.com/jobs?q=pilot', timeout=60000, wait_until='domcontentloaded')
+            await self._wait_for_jobs(page, 'a[href*="/job"], a[href*="pilot"]')
 
             # Look for job listings
-            job_links = await page.query_selector_all('a[href*="/job"], a[href*="pilot"]')
-
-            for link in job_links:
-                href = await link.get_attribute('href')
-                text = await link.inner_text()
+            job_links = await self._extract_links(page, 'a[href*="/job"], a[href*="pilot"]')
 
+            for text, href in job_links:
                 if href and text and len(text.strip()) > 3:
                     text = text.strip()
                     if self._is_pilot_job(text):
@@ -936,7 +957,7 @@ class PlaywrightScraper:
                             'company': 'Vueling',
                             'location': 'Barcelona, Spain',
                             'region': 'europe',
-                            'application_url': href if href.startswith('http') else f'https://careers.vueling.com{href}',
+                            'application_url': urljoin(page.url, href),
                             'source': 'Direct - Vueling',
                             'date_scraped': datetime.now().isoformat(),
                             'is_active': True,
@@ -946,7 +967,7 @@ class PlaywrightScraper:
                             jobs.append(job)
                             print(f"  [Vueling] Found: {job['title']}")
 
-            await context.close()
+            await self._close_context(context, 'vueling')
 
         except Exception as e:
             print(f"[Vueling] Error: {e}")
@@ -963,28 +984,16 @@ class PlaywrightScraper:
         playwright = await self._init_browser()
 
         try:
-            context = await self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            )
-            page = await context.new_page()
-
-            if STEALTH_AVAILABLE:
-                stealth = Stealth()
-                await stealth.apply_stealth_async(page)
+            context, page = await self._new_page('norwegian')
 
             print("[Norwegian] Loading careers page...")
-            await page.goto('https://careers.norwegian.com/', timeout=60000)
-            await page.wait_for_load_state('networkidle')
-            await asyncio.sleep(3)
+            await page.goto('https://careers.norwegian.com/', timeout=60000, wait_until='domcontentloaded')
+            await self._wait_for_jobs(page, 'a[href*="job"], a[href*="pilot"]')
 
             # Look for job listings
-            job_links = await page.query_selector_all('a[href*="job"], a[href*="pilot"], a[href*="career"]')
-
-            for link in job_links:
-                href = await link.get_attribute('href')
-                text = await link.inner_text()
+            job_links = await self._extract_links(page, 'a[href*="job"], a[href*="pilot"], a[href*="career"]')
 
+            for text, href in job_links:
                 if href and text and len(text.strip()) > 3:
                     text = text.strip()
                     if self._is_pilot_job(text):
@@ -993,7 +1002,7 @@ class PlaywrightScraper:
                             'company': 'Norwegian Air',
                             'location': 'Oslo, Norway',
                             'region': 'europe',
-                            'application_url': href if href.startswith('http') else f'https://careers.norwegian.com{href}',
+                            'application_url': urljoin(page.url, href),
                             'source': 'Direct - Norwegian',
                             'date_scraped': datetime.now().isoformat(),
                             'is_active': True,
@@ -1003,7 +1012,7 @@ class PlaywrightScraper:
                             jobs.append(job)
                             print(f"  [Norwegian] Found: {job['title']}")
 
-            await context.close()
+            await self._close_context(context, 'norwegian')
 
         except Exception as e:
             print(f"[Norwegian] Error: {e}")
@@ -1015,7 +1024,7 @@ class PlaywrightScraper:
         return jobs
 
     async def scrape_all(self) -> List[Dict]:
-        """Scrape all configured airlines"""
+        """Scrape all configured airlines concurrently on one shared browser"""
         all_jobs = []
 
         # All airline scrapers
@@ -1037,16 +1046,30 @@ class PlaywrightScraper:
             ('Rishworth Aviation', self.scrape_rishworth),
         ]
 
-        for name, scraper_func in scrapers:
-            try:
-                jobs = await scraper_func()
-                all_jobs.extend(jobs)
-                print(f"[{name}] Added {len(jobs)} jobs")
-            except Exception as e:
-                print(f"[{name}] Failed: {e}")
+        # Each site gets its own context on the shared browser; overlap their
+        # navigation and render waits instead of paying them one after another
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SITES)
 
-            # Rate limiting between sites
-            await asyncio.sleep(2)
+        async def run_one(name, scraper_func) -> List[Dict]:
+            async with semaphore:
+                try:
+                    jobs = await scraper_func()
+                    print(f"[{name}] Added {len(jobs)} jobs")
+                    return jobs
+                except Exception as e:
+                    print(f"[{name}] Failed: {e}")
+                    return []
+
+        playwright = await self._init_browser()
+        try:
+            results = await asyncio.gather(
+                *(run_one(name, scraper_func) for name, scraper_func in scrapers)
+            )
+        finally:
+            await self._close_browser(playwright)
+
+        for jobs in results:
+            all_jobs.extend(jobs)
 
         return all_jobs
 
@@ -1055,14 +1078,12 @@ class PlaywrightScraper:
         if not title:
             return False
 
-        title_lower = title.lower()
-
         # Check for exclusions first
-        if any(kw in title_lower for kw in self.EXCLUDE_KEYWORDS):
+        if self._EXCLUDE_RE.search(title):
             return False
 
         # Check for pilot keywords
-        return any(kw in title_lower for kw in self.PILOT_KEYWORDS)
+        return self._PILOT_RE.search(title) is not None
 
 
 async def test_playwright_scraper():
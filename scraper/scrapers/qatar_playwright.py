@@ -12,12 +12,46 @@ import re
 import time
 import sys
 import os
+from urllib.parse import urlparse
 from playwright.sync_api import sync_playwright
 
 # Fix Windows encoding
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
+# Share buttons link to these hosts with the JobDetail URL embedded in the query
+_SOCIAL_DOMAINS = frozenset({
+    'facebook.com', 'linkedin.com', 'twitter.com', 'x.com',
+    'instagram.com', 'youtube.com',
+})
+
+# Runs of whitespace and/or non-ASCII (bullets, nbsp, ...) collapse to one space
+_NOISE_RE = re.compile(r'(?:[^\x00-\x7F]|\s)+')
+
+# Page text is all we read; stylesheets stay so inner_text still skips hidden elements
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+
+
+def _block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _wait_for(page, condition, timeout=3000):
+    """Wait until a JS condition holds; give up quietly after timeout"""
+    try:
+        page.wait_for_function(condition, timeout=timeout)
+    except Exception:
+        pass
+
+
+def _is_social_link(href):
+    """True if href points at a social network or one of its subdomains (m., uk.linkedin.com, ...)"""
+    host = urlparse(href).hostname or ''
+    return any(host == d or host.endswith('.' + d) for d in _SOCIAL_DOMAINS)
+
 
 def normalize_hours(text):
     """
@@ -29,9 +63,7 @@ def normalize_hours(text):
 
     # AGGRESSIVE CLEANING - Remove all non-ASCII characters, normalize whitespace
     # This handles bullet points, special characters, etc.
-    cleaned = re.sub(r'[^\x00-\x7F]+', ' ', text)  # Remove non-ASCII
-    cleaned = re.sub(r'\s+', ' ', cleaned)  # Normalize whitespace
-    cleaned = cleaned.lower()
+    cleaned = _NOISE_RE.sub(' ', text).lower()
 
     # PRIORITY patterns - these are the "total" requirements we want
     # Check these first and return if found
@@ -149,6 +181,7 @@ def scrape_qatar_real(headless=True):
         context = browser.new_context(
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         )
+        context.route('**/*', _block_heavy_resources)
         page = context.new_page()
 
         # Use the Avature search URL that shows pilot jobs
@@ -156,28 +189,29 @@ def scrape_qatar_real(headless=True):
         print(f"🌍 Navigating to: {url}")
 
         try:
-            page.goto(url, timeout=60000)
-            time.sleep(3)  # Wait for dynamic content
+            page.goto(url, timeout=60000, wait_until='domcontentloaded')
+            # Wait for the job list to render rather than a fixed delay
+            _wait_for(page, "document.querySelector('a[href*=\"/JobDetail/\"]') !== null", timeout=10000)
         except Exception as e:
             print(f"❌ Failed to load page: {e}")
             browser.close()
             return results
 
-        # Find all job links
-        all_links = page.query_selector_all('a')
+        # Find all job links - [text, href] for every <a> in one evaluate call
+        all_links = page.eval_on_selector_all(
+            'a', "els => els.map(a => [(a.innerText || '').trim(), a.getAttribute('href') || ''])"
+        )
         print(f"📋 Found {len(all_links)} total links")
 
         job_links = []
-        for link in all_links:
+        for text, href in all_links:
             try:
-                href = link.get_attribute('href') or ''
-                text = link.inner_text().strip()
-
                 # Filter for actual job links (JobDetail URLs, not social share)
                 if text and len(text) > 5:
-                    if '/JobDetail/' in href and 'facebook' not in href.lower() and 'linkedin' not in href.lower() and 'twitter' not in href.lower():
+                    text_lower = text.lower()
+                    if '/JobDetail/' in href and not _is_social_link(href):
                         # Filter for pilot-related jobs
-                        if any(kw in text.lower() for kw in ['pilot', 'officer', 'captain', 'type rated', 'flight']):
+                        if any(kw in text_lower for kw in ['pilot', 'officer', 'captain', 'type rated', 'flight']):
                             job_links.append({'title': text, 'url': href})
             except:
                 continue
@@ -198,8 +232,8 @@ def scrape_qatar_real(headless=True):
 
             try:
                 # Navigate to job page
-                page.goto(job['url'], timeout=30000)
-                time.sleep(2)  # Wait for content
+                page.goto(job['url'], timeout=30000, wait_until='domcontentloaded')
+                _wait_for(page, "document.body && document.body.innerText.length > 200")
 
                 # Get all text on the page
                 description = ""
@@ -210,6 +244,7 @@ def scrape_qatar_real(headless=True):
 
                 # Extract hours requirement
                 hours = normalize_hours(description)
+                description_lower = description.lower()
 
                 # Extract location
                 location = "Doha, Qatar"  # Default
@@ -225,8 +260,8 @@ def scrape_qatar_real(headless=True):
                     "aircraft_type": extract_aircraft_type(job['title'] + " " + description[:1000]),
                     "application_url": job['url'],
                     "source": "Direct - Qatar Airways (Playwright)",
-                    "type_rating_required": 'type rated' in job['title'].lower() or 'type rating required' in description.lower(),
-                    "type_rating_provided": 'type rating provided' in description.lower(),
+                    "type_rating_required": 'type rated' in job['title'].lower() or 'type rating required' in description_lower,
+                    "type_rating_provided": 'type rating provided' in description_lower,
                     "visa_sponsorship": True,  # Qatar typically sponsors
                     "contract_type": "permanent",
                     "is_active": True,
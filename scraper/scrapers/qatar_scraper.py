@@ -31,6 +31,7 @@ class QatarAirwaysScraper:
         'flight crew', 'cockpit', 'atpl', 'type rated', 'a320', 'a330',
         'a350', 'a380', 'b777', 'b787', 'bd700', 'flight operations'
     ]
+    _PILOT_RE = re.compile('|'.join(map(re.escape, PILOT_KEYWORDS)), re.IGNORECASE)
 
     def __init__(self):
         self.headers = {
@@ -340,8 +341,7 @@ class QatarAirwaysScraper:
         """Check if job title indicates a pilot position"""
         if not title:
             return False
-        title_lower = title.lower()
-        return any(keyword in title_lower for keyword in self.PILOT_KEYWORDS)
+        return self._PILOT_RE.search(title) is not None
 
 
 async def test_qatar_scraper():
@@ -43,6 +43,7 @@ class SuccessfactorsScraper:
         'flight operations', 'atpl', 'cpl', 'mpl', 'flugkapitän', 'copilot',
         'flygkapten', 'styrman', 'pilote', 'commandant de bord'
     ]
+    _PILOT_RE = re.compile('|'.join(map(re.escape, PILOT_KEYWORDS)), re.IGNORECASE)
 
     def __init__(self, use_proxy: bool = False, proxy_url: Optional[str] = None):
         self.use_proxy = use_proxy
@@ -118,7 +119,8 @@ class SuccessfactorsScraper:
             'sap-apply',
             'recruitingsite',
         ]
-        return any(indicator in html.lower() for indicator in indicators)
+        html_lower = html.lower()
+        return any(indicator in html_lower for indicator in indicators)
 
     def _is_sf_career_site(self, html: str) -> bool:
         """Check if it's a SuccessFactors Career Site Builder page"""
@@ -272,7 +274,8 @@ class SuccessfactorsScraper:
 
             # Check if it looks like a job link
             job_url_patterns = ['job', 'position', 'requisition', 'vacancy', 'opening', 'career']
-            if not any(pattern in href.lower() for pattern in job_url_patterns):
+            href_lower = href.lower()
+            if not any(pattern in href_lower for pattern in job_url_patterns):
                 continue
 
             if not self._is_pilot_job(title):
@@ -451,8 +454,7 @@ class SuccessfactorsScraper:
         """Check if job title indicates a pilot position"""
         if not title:
             return False
-        title_lower = title.lower()
-        return any(keyword in title_lower for keyword in self.PILOT_KEYWORDS)
+        return self._PILOT_RE.search(title) is not None
 
     def _make_absolute_url(self, base_url: str, relative_url: str) -> str:
         """Convert relative URL to absolute"""
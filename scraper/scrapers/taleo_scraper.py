@@ -19,11 +19,16 @@ Common URL patterns:
 
 import asyncio
 import re
-import json
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
+from urllib.parse import urljoin, urlparse
 import httpx
 from bs4 import BeautifulSoup
+import soupsieve as sv
+from tenacity import (
+    retry, stop_after_attempt, wait_exponential_jitter,
+    retry_if_exception_type, retry_if_result,
+)
 import sys
 
 # Fix Windows console encoding
@@ -31,6 +36,65 @@ if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
 
+# Aircraft types and license mentions, matched in a single pass over the description
+_REQUIREMENT_TOKEN_RE = re.compile(
+    r'(?P<aircraft>a32[01]|a31[89]|a3[3-5]0|a380'
+    r'|b73[789]|737ng|737max|b7[4-8]7'
+    r'|crj\d{3}|erj\d{3}|e\d{3}|embraer\s*\d{3}'
+    r'|atr\s*\d{2}|dash\s*8|q\d{3}|bombardier)'
+    r'|(?P<authority>easa|faa|icao|uk caa)[\s-]*(?P<license>atpl|cpl|mpl)'
+    r'|(?P<bare_license>atpl|cpl|mpl)[\s/]*(?P<frozen>frozen|f)?'
+)
+
+# Total flight hours ("1,500 total hours", "minimum of 3000 hours", "2000+ hour tt").
+# The atomic group stops the engine re-splitting a digit run once it failed to match.
+_TOTAL_HOURS_RE = re.compile(
+    r'(?>(\d{1,2}[,.]?\d{3}))\+?\s*+'
+    r'(?:(?:total\s*+)?(?:flight\s*+)?hours|hours?\s*+(?:total|tt|flight))'
+)
+
+# Position keywords; group order is the precedence used when several appear
+_POSITION_RE = re.compile(
+    r'(?P<captain>captain|command)'
+    r'|(?P<first_officer>first officer|f/o|copilot)'
+    r'|(?P<cadet>cadet|trainee|ab initio)'
+    r'|(?P<instructor>instructor|\btri\b|\btre\b)'
+)
+_POSITION_RANK = {name: rank for rank, name in enumerate(_POSITION_RE.groupindex)}
+
+# Per-row list page selectors, compiled once instead of on every select_one call
+_ROW_SELECTORS = tuple(sv.compile(s) for s in (
+    'tr[id*="requisition"]', 'tr.datarow', '.job-listing', '.requisition-row',
+))
+_ROW_TITLE_SEL = sv.compile('a[id*="Title"], .titlelink, .jobTitle, a')
+_ROW_LOCATION_SEL = sv.compile('[id*="location"], .location, td:nth-child(2)')
+_ROW_DATE_SEL = sv.compile('[id*="Date"], .date, td:nth-child(3)')
+_NEXT_PAGE_SEL = sv.compile('a[id*="next"], .nextLink')
+
+# Transient HTTP statuses worth retrying
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+_backoff = wait_exponential_jitter(initial=0.5, max=8)
+
+
+def _is_retryable_response(response: httpx.Response) -> bool:
+    return response.status_code in _RETRYABLE_STATUS
+
+
+def _wait_retry_after(retry_state) -> float:
+    """Honor a Retry-After header when the server sends one, else back off exponentially"""
+    outcome = retry_state.outcome
+    if outcome is not None and not outcome.failed:
+        retry_after = outcome.result().headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return min(float(retry_after), 30.0)
+    return _backoff(retry_state)
+
+
+def _last_outcome(retry_state):
+    """Hand back the final response (or re-raise the final error) once retries run out"""
+    return retry_state.outcome.result()
+
+
 class TaleoScraper:
     """Universal scraper for Taleo-based career sites"""
 
@@ -56,18 +120,20 @@ class TaleoScraper:
         'boeing', 'airbus', 'embraer', 'bombardier', 'atr', 'crj', 'erj',
         'flight operations', 'atpl', 'cpl', 'mpl'
     ]
+    _PILOT_RE = re.compile('|'.join(map(re.escape, PILOT_KEYWORDS)), re.IGNORECASE)
 
     def __init__(self, use_proxy: bool = False, proxy_url: Optional[str] = None):
         self.use_proxy = use_proxy
         self.proxy_url = proxy_url
         self.session_cookies = {}
 
-    async def fetch_jobs(self, airline_config: Dict) -> List[Dict]:
+    async def fetch_jobs(self, airline_config: Dict, fetch_details: bool = True) -> List[Dict]:
         """
         Fetch all pilot jobs from a Taleo career site
 
         Args:
             airline_config: Dict with 'name', 'careers_url', 'region', etc.
+            fetch_details: Visit each job page for description and requirements
 
         Returns:
             List of job dictionaries
@@ -88,17 +154,20 @@ class TaleoScraper:
             'Cache-Control': 'max-age=0',
         }
 
-        timeout = httpx.Timeout(30.0, connect=10.0)
+        timeout = httpx.Timeout(30.0, connect=3.0)  # Retries cover transient connect failures
+        # One client per airline, so this caps concurrent connections per host
+        limits = httpx.Limits(max_connections=8, max_keepalive_connections=8)
 
         async with httpx.AsyncClient(
             headers=headers,
             timeout=timeout,
+            limits=limits,
             follow_redirects=True,
             verify=False  # Some airline sites have cert issues
         ) as client:
             try:
                 # First, get the main careers page to establish session
-                response = await client.get(base_url)
+                response = await self._request(client, 'GET', base_url)
 
                 if response.status_code != 200:
                     print(f"[Taleo] Failed to load page: {response.status_code}")
@@ -109,6 +178,8 @@ class TaleoScraper:
                 # Detect Taleo version and extract jobs accordingly
                 if self._is_taleo_enterprise(html):
                     jobs = await self._parse_taleo_enterprise(html, base_url, airline_config, client)
+                    if fetch_details:
+                        jobs = await self._fetch_all_job_details(jobs, client)
                 elif self._is_taleo_legacy(html):
                     jobs = await self._parse_taleo_legacy(html, base_url, airline_config, client)
                 else:
@@ -128,6 +199,16 @@ class TaleoScraper:
 
         return jobs
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=_wait_retry_after,
+        retry=retry_if_exception_type(httpx.TransportError) | retry_if_result(_is_retryable_response),
+        retry_error_callback=_last_outcome,
+    )
+    async def _request(self, client: httpx.AsyncClient, method: str, url: str, **kwargs) -> httpx.Response:
+        """Issue a request, retrying transient connection errors and 429/5xx responses"""
+        return await client.request(method, url, **kwargs)
+
     def _is_taleo_enterprise(self, html: str) -> bool:
         """Check if page is Taleo Enterprise (modern Oracle cloud)"""
         indicators = [
@@ -150,16 +231,48 @@ class TaleoScraper:
         return any(indicator in html for indicator in indicators)
 
     async def _parse_taleo_enterprise(self, html: str, base_url: str, airline_config: Dict, client: httpx.AsyncClient) -> List[Dict]:
-        """Parse Taleo Enterprise/Oracle Cloud career sites"""
+        """Parse Taleo Enterprise/Oracle Cloud career sites, following pagination (no detail fetches)"""
+        # Soup construction and selector work is CPU-bound, keep it off the event loop
+        partial_jobs, next_url = await asyncio.to_thread(self._parse_list_sync, html, base_url, airline_config)
+
+        # Recursively get next page (with limit)
+        if next_url and len(partial_jobs) < 100:  # Safety limit
+            try:
+                response = await self._request(client, 'GET', next_url)
+                if response.status_code == 200:
+                    more_jobs = await self._parse_taleo_enterprise(
+                        response.text, next_url, airline_config, client
+                    )
+                    partial_jobs.extend(more_jobs)
+            except Exception:
+                pass
+
+        return partial_jobs
+
+    async def _fetch_all_job_details(self, jobs: List[Dict], client: httpx.AsyncClient) -> List[Dict]:
+        """Fetch detail pages for all jobs at once, after list navigation is done"""
+        detailed_jobs = await asyncio.gather(*[
+            self._fetch_job_details(job['application_url'], job, client) for job in jobs
+        ])
+        return [detailed or job for detailed, job in zip(detailed_jobs, jobs)]
+
+    def _parse_list_sync(self, html: str, base_url: str, airline_config: Dict) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Extract pilot jobs from a Taleo Enterprise list page without any network I/O
+
+        Returns:
+            (jobs still needing detail fetches, absolute URL of the next page or None)
+        """
         jobs = []
         soup = BeautifulSoup(html, 'html.parser')
+        scraped_at = datetime.now().isoformat()
 
         # Look for job listings in various Taleo table formats
         job_elements = []
 
         # Try different selectors
-        for selector in ['tr[id*="requisition"]', 'tr.datarow', '.job-listing', '.requisition-row']:
-            job_elements = soup.select(selector)
+        for selector in _ROW_SELECTORS:
+            job_elements = selector.select(soup)
             if job_elements:
                 break
 
@@ -173,15 +286,22 @@ class TaleoScraper:
                     if not job_url.startswith('http'):
                         job_url = self._make_absolute_url(base_url, job_url)
 
-                    job = await self._extract_job_details(job_url, title, airline_config, client)
-                    if job:
-                        jobs.append(job)
-            return jobs
+                    jobs.append({
+                        'title': title,
+                        'company': airline_config.get('name', ''),
+                        'location': airline_config.get('headquarters', ''),
+                        'region': airline_config.get('region', ''),
+                        'application_url': job_url,
+                        'source': 'Taleo',
+                        'date_scraped': scraped_at,
+                        'is_active': True,
+                    })
+            return jobs, None
 
         for element in job_elements:
             try:
                 # Extract title
-                title_elem = element.select_one('a[id*="Title"], .titlelink, .jobTitle, a')
+                title_elem = _ROW_TITLE_SEL.select_one(element)
                 if not title_elem:
                     continue
 
@@ -197,18 +317,18 @@ class TaleoScraper:
 
                 # Extract location
                 location = ''
-                loc_elem = element.select_one('[id*="location"], .location, td:nth-child(2)')
+                loc_elem = _ROW_LOCATION_SEL.select_one(element)
                 if loc_elem:
                     location = loc_elem.get_text(strip=True)
 
                 # Extract date
                 date_posted = ''
-                date_elem = element.select_one('[id*="Date"], .date, td:nth-child(3)')
+                date_elem = _ROW_DATE_SEL.select_one(element)
                 if date_elem:
                     date_posted = date_elem.get_text(strip=True)
 
                 # Build job dict
-                job = {
+                jobs.append({
                     'title': title,
                     'company': airline_config.get('name', ''),
                     'location': location or airline_config.get('headquarters', ''),
@@ -216,35 +336,21 @@ class TaleoScraper:
                     'application_url': job_url,
                     'source': 'Taleo',
                     'date_posted': date_posted,
-                    'date_scraped': datetime.now().isoformat(),
+                    'date_scraped': scraped_at,
                     'is_active': True,
-                }
-
-                # Try to get more details from job page
-                detailed_job = await self._fetch_job_details(job_url, job, client)
-                jobs.append(detailed_job if detailed_job else job)
+                })
 
             except Exception as e:
                 print(f"[Taleo] Error parsing job element: {e}")
                 continue
 
         # Handle pagination
-        next_page = soup.select_one('a[id*="next"], .nextLink')
+        next_url = None
+        next_page = _NEXT_PAGE_SEL.select_one(soup)
         if next_page and next_page.get('href'):
             next_url = self._make_absolute_url(base_url, next_page.get('href'))
-            # Recursively get next page (with limit)
-            if len(jobs) < 100:  # Safety limit
-                try:
-                    response = await client.get(next_url)
-                    if response.status_code == 200:
-                        more_jobs = await self._parse_taleo_enterprise(
-                            response.text, next_url, airline_config, client
-                        )
-                        jobs.extend(more_jobs)
-                except Exception:
-                    pass
 
-        return jobs
+        return jobs, next_url
 
     async def _parse_taleo_legacy(self, html: str, base_url: str, airline_config: Dict, client: httpx.AsyncClient) -> List[Dict]:
         """Parse legacy Taleo sites"""
@@ -306,7 +412,8 @@ class TaleoScraper:
 
             # Check if it looks like a job link
             job_indicators = ['job', 'requisition', 'position', 'career', 'opening']
-            if not any(ind in href.lower() for ind in job_indicators):
+            href_lower = href.lower()
+            if not any(ind in href_lower for ind in job_indicators):
                 continue
 
             if not self._is_pilot_job(title):
@@ -343,66 +450,73 @@ class TaleoScraper:
         ]
 
         # Extract base domain
-        from urllib.parse import urlparse
         parsed = urlparse(base_url)
         base_domain = f"{parsed.scheme}://{parsed.netloc}"
 
-        for api_pattern in api_patterns:
-            api_url = f"{base_domain}{api_pattern}"
-
-            try:
-                # Try POST with search params
-                search_payload = {
-                    'keywords': 'pilot',
-                    'pageSize': 100,
-                    'pageNumber': 1,
-                }
+        search_payload = {
+            'keywords': 'pilot',
+            'pageSize': 100,
+            'pageNumber': 1,
+        }
 
-                response = await client.post(
-                    api_url,
-                    json=search_payload,
-                    headers={'Content-Type': 'application/json'}
-                )
+        # The endpoints are independent, so probe them all at once and keep
+        # the first one that returns pilot jobs
+        probes = [
+            asyncio.create_task(self._request(
+                client,
+                'POST',
+                f"{base_domain}{api_pattern}",
+                json=search_payload,
+                headers={'Content-Type': 'application/json'},
+                timeout=5.0,
+            ))
+            for api_pattern in api_patterns
+        ]
 
-                if response.status_code == 200:
-                    try:
-                        data = response.json()
-                        # Parse API response
-                        job_list = data.get('jobs', data.get('requisitions', data.get('results', [])))
-
-                        for job_data in job_list:
-                            title = job_data.get('title', job_data.get('jobTitle', ''))
-                            if self._is_pilot_job(title):
-                                job = {
-                                    'title': title,
-                                    'company': airline_config.get('name', ''),
-                                    'location': job_data.get('location', job_data.get('primaryLocation', '')),
-                                    'region': airline_config.get('region', ''),
-                                    'application_url': job_data.get('applyUrl', job_data.get('url', base_url)),
-                                    'source': 'Taleo API',
-                                    'description': job_data.get('description', job_data.get('jobDescription', '')),
-                                    'date_posted': job_data.get('postedDate', ''),
-                                    'date_scraped': datetime.now().isoformat(),
-                                    'is_active': True,
-                                }
-                                jobs.append(job)
-
-                        if jobs:
-                            print(f"[Taleo] Found {len(jobs)} jobs via API")
-                            return jobs
-
-                    except json.JSONDecodeError:
+        try:
+            for probe in asyncio.as_completed(probes):
+                try:
+                    response = await probe
+                    if response.status_code != 200:
                         continue
 
-            except Exception:
-                continue
+                    data = response.json()
+                    # Parse API response
+                    job_list = data.get('jobs', data.get('requisitions', data.get('results', [])))
+
+                    for job_data in job_list:
+                        title = job_data.get('title', job_data.get('jobTitle', ''))
+                        if self._is_pilot_job(title):
+                            job = {
+                                'title': title,
+                                'company': airline_config.get('name', ''),
+                                'location': job_data.get('location', job_data.get('primaryLocation', '')),
+                                'region': airline_config.get('region', ''),
+                                'application_url': job_data.get('applyUrl', job_data.get('url', base_url)),
+                                'source': 'Taleo API',
+                                'description': job_data.get('description', job_data.get('jobDescription', '')),
+                                'date_posted': job_data.get('postedDate', ''),
+                                'date_scraped': datetime.now().isoformat(),
+                                'is_active': True,
+                            }
+                            jobs.append(job)
+
+                    if jobs:
+                        print(f"[Taleo] Found {len(jobs)} jobs via API")
+                        return jobs
+
+                except Exception:
+                    continue
+        finally:
+            for probe in probes:
+                probe.cancel()
 
         return jobs
 
     async def _fetch_job_details(self, job_url: str, job: Dict, client: httpx.AsyncClient) -> Optional[Dict]:
         """Fetch additional details from job detail page"""
         try:
-            response = await client.get(job_url)
+            response = await self._request(client, 'GET', job_url)
             if response.status_code != 200:
                 return job
 
@@ -441,31 +555,14 @@ class TaleoScraper:
         except Exception:
             return job
 
-    async def _extract_job_details(self, job_url: str, title: str, airline_config: Dict, client: httpx.AsyncClient) -> Optional[Dict]:
-        """Extract full job details from a job URL"""
-        job = {
-            'title': title,
-            'company': airline_config.get('name', ''),
-            'location': airline_config.get('headquarters', ''),
-            'region': airline_config.get('region', ''),
-            'application_url': job_url,
-            'source': 'Taleo',
-            'date_scraped': datetime.now().isoformat(),
-            'is_active': True,
-        }
-
-        return await self._fetch_job_details(job_url, job, client)
-
     def _is_pilot_job(self, title: str) -> bool:
         """Check if job title indicates a pilot position"""
         if not title:
             return False
-        title_lower = title.lower()
-        return any(keyword in title_lower for keyword in self.PILOT_KEYWORDS)
+        return self._PILOT_RE.search(title) is not None
 
     def _make_absolute_url(self, base_url: str, relative_url: str) -> str:
         """Convert relative URL to absolute"""
-        from urllib.parse import urljoin
         return urljoin(base_url, relative_url)
 
     def _extract_requirements(self, job: Dict) -> Dict:
@@ -473,21 +570,9 @@ class TaleoScraper:
         description = job.get('description', '').lower()
 
         # Extract total hours
-        hours_patterns = [
-            r'(\d{1,2}[,.]?\d{3})\s*(?:total\s*)?(?:flight\s*)?hours',
-            r'minimum\s*(?:of\s*)?(\d{1,2}[,.]?\d{3})\s*hours',
-            r'(\d{1,2}[,.]?\d{3})\+?\s*hours?\s*(?:total|tt|flight)',
-        ]
-
-        for pattern in hours_patterns:
-            match = re.search(pattern, description)
-            if match:
-                hours_str = match.group(1).replace(',', '').replace('.', '')
-                try:
-                    job['min_total_hours'] = int(hours_str)
-                    break
-                except ValueError:
-                    pass
+        match = _TOTAL_HOURS_RE.search(description)
+        if match:
+            job['min_total_hours'] = int(match.group(1).replace(',', '').replace('.', ''))
 
         # Extract PIC hours
         pic_patterns = [
@@ -519,51 +604,31 @@ class TaleoScraper:
         ]
         job['type_rating_provided'] = any(phrase in description for phrase in type_provided_phrases)
 
-        # Extract license requirements
-        license_patterns = [
-            r'(easa|faa|icao|uk caa)[\s-]*(atpl|cpl|mpl)',
-            r'(atpl|cpl|mpl)[\s/]*(frozen|f)?',
-        ]
-
-        licenses = []
-        for pattern in license_patterns:
-            matches = re.findall(pattern, description)
-            for match in matches:
-                if isinstance(match, tuple):
-                    licenses.append(' '.join(match).upper().strip())
-                else:
-                    licenses.append(match.upper())
+        # Extract license requirements and aircraft types in one pass
+        licenses = set()
+        aircraft_types = set()
+        for match in _REQUIREMENT_TOKEN_RE.finditer(description):
+            if match.group('aircraft'):
+                aircraft_types.add(match.group('aircraft').upper())
+            elif match.group('license'):
+                licenses.add(f"{match.group('authority')} {match.group('license')}".upper())
+            else:
+                licenses.add(' '.join(filter(None, match.group('bare_license', 'frozen'))).upper())
 
         if licenses:
-            job['license_required'] = ', '.join(set(licenses))
+            job['license_required'] = ', '.join(licenses)
 
         # Detect position type
-        if 'captain' in description or 'command' in description:
-            job['position_type'] = 'captain'
-        elif 'first officer' in description or 'f/o' in description or 'copilot' in description:
-            job['position_type'] = 'first_officer'
-        elif 'cadet' in description or 'trainee' in description or 'ab initio' in description:
-            job['position_type'] = 'cadet'
-        elif 'instructor' in description or 'tri' in description or 'tre' in description:
-            job['position_type'] = 'instructor'
-        else:
-            job['position_type'] = 'other'
-
-        # Extract aircraft type
-        aircraft_patterns = [
-            r'(a320|a321|a319|a318|a330|a340|a350|a380)',
-            r'(b737|b738|b739|737ng|737max|b747|b757|b767|b777|b787)',
-            r'(crj\d{3}|erj\d{3}|e\d{3}|embraer\s*\d{3})',
-            r'(atr\s*\d{2}|dash\s*8|q\d{3}|bombardier)',
-        ]
-
-        aircraft_types = []
-        for pattern in aircraft_patterns:
-            matches = re.findall(pattern, description)
-            aircraft_types.extend(matches)
+        position_type = 'other'
+        for match in _POSITION_RE.finditer(description):
+            if position_type == 'other' or _POSITION_RANK[match.lastgroup] < _POSITION_RANK[position_type]:
+                position_type = match.lastgroup
+                if position_type == 'captain':
+                    break
+        job['position_type'] = position_type
 
         if aircraft_types:
-            job['aircraft_type'] = ', '.join(set(t.upper() for t in aircraft_types))
+            job['aircraft_type'] = ', '.join(aircraft_types)
 
         return job
 
@@ -588,11 +653,16 @@ async def test_taleo_scraper():
         },
     ]
 
-    all_jobs = []
-    for airline in test_airlines:
-        jobs = await scraper.fetch_jobs(airline)
-        all_jobs.extend(jobs)
-        await asyncio.sleep(2)  # Be respectful between requests
+    # Airlines live on different hosts, so scrape them concurrently;
+    # per-host politeness is handled by the client's connection limits
+    sem = asyncio.Semaphore(16)
+
+    async def fetch_one(airline: Dict) -> List[Dict]:
+        async with sem:
+            return await scraper.fetch_jobs(airline)
+
+    results = await asyncio.gather(*[fetch_one(airline) for airline in test_airlines])
+    all_jobs = [job for jobs in results for job in jobs]
 
     print(f"\n{'='*60}")
     print(f"Total pilot jobs found: {len(all_jobs)}")
@@ -9,17 +9,235 @@ Workday has a consistent API structure across all implementations.
 """
 
 import asyncio
-import json
+import random
 import re
-from typing import List, Dict, Optional
-from datetime import datetime
+from collections import defaultdict
+from dataclasses import dataclass, fields
+from typing import Awaitable, Callable, List, Dict, Optional
+from datetime import datetime, timezone
+from urllib.parse import urlparse
 import httpx
-from bs4 import BeautifulSoup
-from tenacity import retry, stop_after_attempt, wait_exponential
+import orjson
+from lxml import etree
+from lxml import html as lxml_html
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Posting text is arbitrary third-party input: prefer RE2's linear-time matching
+_text_re = re2 if RE2_AVAILABLE else re
+
+# Maximum concurrent airline scrapes against a single Workday host
+PER_HOST_CONCURRENCY = 4
+
+# Statuses worth retrying; anything else is a real answer
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# Precompiled patterns, applied to every posting
+_INITIAL_DATA_RE = re.compile(r'window\.__INITIAL_DATA__\s*=\s*({.*?});', re.DOTALL)
+
+# One pattern per hour requirement, each scanned separately: a single phrase can
+# satisfy two fields ("minimum of 500 hours pic" is both total and PIC), which one
+# shared alternation would consume for the first. Patterns are case-insensitive
+# ((?i), understood by both re and RE2) so postings can be scanned without a
+# lowered copy.
+_HOUR_PATTERNS = (
+    ('min_total_hours', _text_re.compile(
+        r'(?i)(\d{1,5})\s*(?:hours?|hrs?)\s*(?:total|tt)'
+        r'|minimum\s*(?:of\s*)?(\d{1,5})\s*(?:hours?|hrs?)'
+    )),
+    ('min_pic_hours', _text_re.compile(r'(?i)(\d{1,5})\s*(?:hours?|hrs?)\s*(?:pic|command)')),
+    ('min_type_hours', _text_re.compile(r'(?i)(\d{1,5})\s*(?:hours?|hrs?)\s*(?:on\s*type|type)')),
+)
+
+_TYPE_REQUIRED_RE = tuple(_text_re.compile(p) for p in (
+    r'(?i)type\s*rat(?:ed|ing)\s*required',
+    r'(?i)must\s*have.*type\s*rat',
+    r'(?i)current\s*type\s*rat',
+))
+
+_PROVIDED_RE = tuple(_text_re.compile(p) for p in (
+    r'(?i)type\s*rat(?:ed|ing).*provided',
+    r'(?i)training\s*provided',
+    r'(?i)will\s*provide\s*type',
+))
+
+# Compiled XPath queries for the HTML fallback (skips BeautifulSoup/soupsieve entirely)
+_JOBTITLE_XP = etree.XPath('//*[@data-automation-id="jobTitle"]')
+_JOBCARD_CLASS_XP = etree.XPath('//*[contains(concat(" ", normalize-space(@class), " "), " css-19uc56f ")]')
+_JOBLINK_XP = etree.XPath('//a[contains(@href, "/job/")]')
+_CARD_TITLE_XP = etree.XPath('.//*[@data-automation-id="jobTitle"]')
+
+PILOT_KEYWORDS = (
+    'pilot', 'captain', 'first officer', 'f/o', 'fo ',
+    'second officer', 'cruise pilot', 'flight crew',
+    'cadet', 'co-pilot', 'copilot', 'flight operations',
+    'type rated', 'direct entry'
+)
+
+# Exclude non-flying roles
+EXCLUDE_KEYWORDS = (
+    'drone', 'simulator', 'instructor only', 'ground',
+    'dispatcher', 'coordinator', 'manager', 'admin'
+)
+
+
+def _build_automaton(keywords):
+    """Build an Aho-Corasick automaton matching any of the keywords in one pass"""
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+if AHOCORASICK_AVAILABLE:
+    _PILOT_AC = _build_automaton(PILOT_KEYWORDS)
+    _EXCLUDE_AC = _build_automaton(EXCLUDE_KEYWORDS)
+
+
+def _first(d: Dict, *keys: str):
+    """Value of the first key in d with a truthy value, else ''"""
+    for key in keys:
+        value = d.get(key)
+        if value:
+            return value
+    return ''
+
 
 class WorkdayScraperError(Exception):
     pass
 
+
+async def _with_backoff(
+    send: Callable[[], Awaitable[httpx.Response]],
+    max_attempts: int = 3,
+    base: float = 2.0,
+    max_delay: float = 10.0
+) -> httpx.Response:
+    """
+    Send a request, retrying transport errors and 429/5xx responses.
+
+    Waits base**attempt seconds (capped, plus jitter) between attempts, or
+    the server's Retry-After when it sends one. Non-retryable HTTP errors
+    and the final failure are raised to the caller.
+    """
+    for attempt in range(max_attempts):
+        last_attempt = attempt == max_attempts - 1
+        delay = min(base ** attempt, max_delay)
+
+        try:
+            response = await send()
+            response.raise_for_status()
+            return response
+        except httpx.HTTPStatusError as e:
+            if last_attempt or e.response.status_code not in _RETRYABLE_STATUS:
+                raise
+            retry_after = e.response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                delay = min(float(retry_after), 60.0)
+        except httpx.TransportError:
+            if last_attempt:
+                raise
+
+        await asyncio.sleep(delay + random.random())
+
+
+@dataclass(slots=True)
+class WorkdayJob:
+    """
+    A job extracted from a Workday site.
+
+    Slotted to keep large result lists compact; optional fields left as None
+    are omitted by to_dict(), so each source yields the same keys as before.
+    """
+    title: str
+    company: str
+    location: str
+    region: str
+    country: str
+    application_url: str
+    source: str
+    scraped_at: str
+    job_id: Optional[str] = None
+    description: Optional[str] = None
+    posted_date: Optional[str] = None
+    min_total_hours: Optional[int] = None
+    min_pic_hours: Optional[int] = None
+    min_type_hours: Optional[int] = None
+    type_rating_required: Optional[bool] = None
+    type_rating_provided: Optional[bool] = None
+
+    def to_dict(self) -> Dict:
+        """Plain dict for the normalizer / database, without unset fields"""
+        return {
+            name: value
+            for name in _WORKDAY_JOB_FIELDS
+            if (value := getattr(self, name)) is not None
+        }
+
+
+_WORKDAY_JOB_FIELDS = tuple(f.name for f in fields(WorkdayJob))
+
+
+class HostRateLimiter:
+    """
+    Per-host request pacing driven by rate-limit response headers.
+
+    Each host gets a minimum interval between requests. A Retry-After header,
+    or X-RateLimit-Remaining hitting zero, pushes that host's next slot back
+    without slowing down requests to other hosts.
+    """
+
+    def __init__(self, min_interval: float = 0.5, max_delay: float = 60.0):
+        self.min_interval = min_interval
+        self.max_delay = max_delay
+        self._next_slot: Dict[str, float] = defaultdict(float)
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def acquire(self, request: httpx.Request):
+        """httpx request hook: wait for this host's next free slot"""
+        host = request.url.host
+        async with self._locks[host]:
+            loop = asyncio.get_running_loop()
+            wait = self._next_slot[host] - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_slot[host] = loop.time() + self.min_interval
+
+    async def observe(self, response: httpx.Response):
+        """httpx response hook: back off a host that reports it is rate limiting us"""
+        delay = self._header_delay(response.headers)
+        if delay:
+            host = response.request.url.host
+            resume_at = asyncio.get_running_loop().time() + delay
+            self._next_slot[host] = max(self._next_slot[host], resume_at)
+
+    def _header_delay(self, headers: httpx.Headers) -> float:
+        """Seconds to hold off a host, from Retry-After / X-RateLimit-* headers"""
+        retry_after = headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return min(float(retry_after), self.max_delay)
+
+        if headers.get('X-RateLimit-Remaining') == '0':
+            reset = headers.get('X-RateLimit-Reset', '')
+            # Reset is either seconds-until-reset or an epoch timestamp; only trust the former
+            if reset.isdigit() and int(reset) <= self.max_delay:
+                return float(reset)
+            return self.max_delay
+
+        return 0.0
+
+
 class WorkdayScraper:
     """
     Scrapes job listings from Workday-based career sites.
@@ -32,6 +250,7 @@ class WorkdayScraper:
 
     def __init__(self, proxy: Optional[str] = None):
         self.proxy = proxy
+        self.rate_limiter = HostRateLimiter()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'application/json, text/plain, */*',
@@ -39,13 +258,37 @@ class WorkdayScraper:
             'Accept-Encoding': 'gzip, deflate, br',
         }
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-    async def fetch_jobs(self, airline_config: Dict) -> List[Dict]:
+    def create_client(self) -> httpx.AsyncClient:
+        """
+        Build an HTTP/2 client with a pooled connection limit.
+
+        Share one across airlines so TLS sessions and keep-alive connections
+        are reused instead of being rebuilt per airline. Requests are paced
+        per host by self.rate_limiter.
+        """
+        return httpx.AsyncClient(
+            http2=True,
+            event_hooks={
+                'request': [self.rate_limiter.acquire],
+                'response': [self.rate_limiter.observe],
+            },
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+            headers=self.headers,
+            timeout=30.0,
+            follow_redirects=True,
+            proxy=self.proxy
+        )
+
+    async def fetch_jobs(self, airline_config: Dict, client: Optional[httpx.AsyncClient] = None) -> List[Dict]:
         """
         Fetch all pilot jobs from a Workday career site.
 
         Args:
             airline_config: Dict with 'name', 'workday_url', 'region', 'country'
+                            and optionally 'workday_facets' / 'workday_search_text'
+                            to narrow the API search
+            client: Shared client from create_client(); a temporary one is
+                    created for this call when omitted
 
         Returns:
             List of job dictionaries
@@ -60,78 +303,94 @@ class WorkdayScraper:
 
         print(f"[{airline_name}] Scraping Workday jobs...")
 
-        async with httpx.AsyncClient(
-            headers=self.headers,
-            timeout=30.0,
-            follow_redirects=True,
-            proxy=self.proxy
-        ) as client:
-            try:
-                # First, get the main page to find the API endpoint
-                response = await client.get(base_url)
-                response.raise_for_status()
-
-                # Look for Workday's embedded job data
-                html = response.text
-                jobs = await self._parse_workday_response(
-                    html,
-                    base_url,
-                    airline_config,
-                    client
-                )
+        if client is None:
+            async with self.create_client() as own_client:
+                found = await self._scrape_site(base_url, airline_config, own_client)
+        else:
+            found = await self._scrape_site(base_url, airline_config, client)
 
-            except httpx.HTTPStatusError as e:
-                print(f"[{airline_name}] HTTP error: {e.response.status_code}")
-            except Exception as e:
-                print(f"[{airline_name}] Error: {str(e)}")
+        # Callers (normalizer, upload) work on dicts
+        jobs = [job.to_dict() for job in found]
 
         print(f"[{airline_name}] Found {len(jobs)} pilot jobs")
         return jobs
 
+    async def _scrape_site(self, base_url: str, airline_config: Dict, client: httpx.AsyncClient) -> List[WorkdayJob]:
+        """Load the careers page and extract jobs from it"""
+        airline_name = airline_config['name']
+        try:
+            # First, get the main page to find the API endpoint
+            response = await _with_backoff(lambda: client.get(base_url))
+
+            # Look for Workday's embedded job data
+            html = response.text
+            return await self._parse_workday_response(
+                html,
+                base_url,
+                airline_config,
+                client
+            )
+
+        except httpx.HTTPStatusError as e:
+            print(f"[{airline_name}] HTTP error: {e.response.status_code}")
+        except Exception as e:
+            print(f"[{airline_name}] Error: {str(e)}")
+
+        return []
+
     async def _parse_workday_response(
         self,
         html: str,
         base_url: str,
         airline_config: Dict,
         client: httpx.AsyncClient
-    ) -> List[Dict]:
+    ) -> List[WorkdayJob]:
         """Parse Workday HTML/JSON response for job listings"""
         jobs = []
         airline_name = airline_config['name']
 
+        # Site root that relative job paths hang off, computed once per airline
+        has_search = '/search' in base_url
+        base_url_root = base_url.split('/search', 1)[0] if has_search else base_url
+        card_link_root = base_url_root if has_search else base_url.rsplit('/', 1)[0]
+        # Batch-level timestamp shared by every job from this response
+        scraped_at = datetime.now(timezone.utc).isoformat()
+
         # Method 1: Look for embedded JSON data
-        json_pattern = r'window\.__INITIAL_DATA__\s*=\s*({.*?});'
-        match = re.search(json_pattern, html, re.DOTALL)
+        match = _INITIAL_DATA_RE.search(html)
 
         if match:
             try:
-                data = json.loads(match.group(1))
-                jobs = self._extract_jobs_from_json(data, airline_config, base_url)
+                data = orjson.loads(match.group(1))
+                jobs = self._extract_jobs_from_json(data, airline_config, base_url, base_url_root, scraped_at)
                 return jobs
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 pass
 
         # Method 2: Parse HTML directly
-        soup = BeautifulSoup(html, 'lxml')
+        try:
+            tree = lxml_html.fromstring(html)
+        except (etree.ParserError, ValueError):
+            tree = None
 
         # Common Workday job listing patterns
-        job_cards = soup.select('[data-automation-id="jobTitle"]')
-        if not job_cards:
-            job_cards = soup.select('.css-19uc56f')  # Another common class
-        if not job_cards:
-            job_cards = soup.select('a[href*="/job/"]')
+        job_cards = []
+        if tree is not None:
+            job_cards = _JOBTITLE_XP(tree) or _JOBCARD_CLASS_XP(tree) or _JOBLINK_XP(tree)
+
+        card_locations = self._pair_card_locations(tree, job_cards) if job_cards else {}
 
         for card in job_cards:
             try:
-                job = self._parse_job_card(card, airline_config, base_url)
-                if job and self._is_pilot_job(job.get('title', '')):
+                job = self._parse_job_card(card, airline_config, card_link_root, scraped_at, card_locations.get(card, ''))
+                if job and self._is_pilot_job(job.title):
                     jobs.append(job)
             except Exception as e:
                 continue
 
         # Method 3: Try the Workday API directly
         if not jobs:
-            api_jobs = await self._try_workday_api(base_url, airline_config, client)
+            api_jobs = await self._try_workday_api(base_url, base_url_root, airline_config, client, scraped_at)
             jobs.extend(api_jobs)
 
         return jobs
@@ -139,9 +398,11 @@ class WorkdayScraper:
     async def _try_workday_api(
         self,
         base_url: str,
+        base_url_root: str,
         airline_config: Dict,
-        client: httpx.AsyncClient
-    ) -> List[Dict]:
+        client: httpx.AsyncClient,
+        scraped_at: str
+    ) -> List[WorkdayJob]:
         """Try to hit Workday's internal API"""
         jobs = []
 
@@ -152,69 +413,88 @@ class WorkdayScraper:
             base_url.replace('/search-results', '/wday/cxs/search'),
         ]
 
-        for api_url in api_patterns:
-            try:
-                # Common payload for Workday search
-                payload = {
-                    "appliedFacets": {},
-                    "limit": 50,
-                    "offset": 0,
-                    "searchText": "pilot"
-                }
-
-                response = await client.post(
-                    api_url,
-                    json=payload,
-                    headers={**self.headers, 'Content-Type': 'application/json'}
-                )
+        # Common payload for Workday search. Filter at the source where the
+        # airline config knows its job-family facets; _is_pilot_job still
+        # checks every title that comes back.
+        payload = {
+            "appliedFacets": airline_config.get('workday_facets', {}),
+            "limit": 50,
+            "offset": 0,
+            "searchText": airline_config.get('workday_search_text', 'pilot')
+        }
 
-                if response.status_code == 200:
-                    data = response.json()
-                    jobs = self._extract_jobs_from_api_response(data, airline_config, base_url)
-                    if jobs:
-                        break
-            except Exception:
-                continue
+        # The candidate endpoints are independent, so probe them all at once
+        # and keep the first one that returns pilot jobs
+        probes = [
+            asyncio.create_task(self._post_json(client, api_url, payload))
+            for api_url in api_patterns
+        ]
+
+        try:
+            for probe in asyncio.as_completed(probes):
+                try:
+                    data = await probe
+
+                    if data is not None:
+                        jobs = self._extract_jobs_from_api_response(data, airline_config, base_url, base_url_root, scraped_at)
+                        if jobs:
+                            break
+                except Exception:
+                    continue
+        finally:
+            # Drop the slower probes once one has answered
+            for probe in probes:
+                probe.cancel()
 
         return jobs
 
-    def _extract_jobs_from_json(self, data: Dict, airline_config: Dict, base_url: str) -> List[Dict]:
+    async def _post_json(self, client: httpx.AsyncClient, url: str, payload: Dict) -> Optional[Dict]:
+        """
+        POST a search payload and decode the JSON reply, or None if not 200.
+
+        The body (already gunzipped by httpx) is read in one go and parsed with
+        orjson, which has no incremental parser; error pages are dropped
+        without reading them.
+        """
+        async with client.stream(
+            'POST',
+            url,
+            json=payload,
+            headers={**self.headers, 'Content-Type': 'application/json'}
+        ) as response:
+            if response.status_code != 200:
+                return None
+            return orjson.loads(await response.aread())
+
+    def _extract_jobs_from_json(self, data: Dict, airline_config: Dict, base_url: str, base_url_root: str, scraped_at: str) -> List[WorkdayJob]:
         """Extract jobs from embedded JSON data"""
         jobs = []
 
         # Navigate common Workday JSON structures
-        job_postings = []
-
-        if 'jobPostings' in data:
-            job_postings = data['jobPostings']
-        elif 'jobs' in data:
-            job_postings = data['jobs']
-        elif 'searchResults' in data:
-            job_postings = data['searchResults']
+        job_postings = _first(data, 'jobPostings', 'jobs', 'searchResults') or []
 
         for posting in job_postings:
             try:
-                title = posting.get('title', posting.get('jobTitle', ''))
+                title = _first(posting, 'title', 'jobTitle')
 
                 if not self._is_pilot_job(title):
                     continue
 
-                job = {
-                    'title': title,
-                    'company': airline_config['name'],
-                    'location': posting.get('location', posting.get('primaryLocation', '')),
-                    'region': airline_config.get('region', ''),
-                    'country': airline_config.get('country', ''),
-                    'job_id': posting.get('id', posting.get('jobId', '')),
-                    'description': posting.get('description', posting.get('jobDescription', '')),
-                    'posted_date': posting.get('postedDate', posting.get('datePosted', '')),
-                    'application_url': self._build_application_url(posting, base_url),
-                    'source': 'Workday',
-                    'scraped_at': datetime.utcnow().isoformat(),
-                }
-
-                # Extract requirements if available
-                job.update(self._extract_requirements(posting))
+                job = WorkdayJob(
+                    title=title,
+                    company=airline_config['name'],
+                    location=_first(posting, 'location', 'primaryLocation'),
+                    region=airline_config.get('region', ''),
+                    country=airline_config.get('country', ''),
+                    job_id=_first(posting, 'id', 'jobId'),
+                    description=_first(posting, 'description', 'jobDescription'),
+                    posted_date=_first(posting, 'postedDate', 'datePosted'),
+                    application_url=self._build_application_url(posting, base_url, base_url_root),
+                    source='Workday',
+                    scraped_at=scraped_at,
+                    # Extract requirements if available
+                    **self._extract_requirements(posting),
+                )
 
                 jobs.append(job)
             except Exception:
@@ -222,11 +502,11 @@ class WorkdayScraper:
 
         return jobs
 
-    def _extract_jobs_from_api_response(self, data: Dict, airline_config: Dict, base_url: str) -> List[Dict]:
+    def _extract_jobs_from_api_response(self, data: Dict, airline_config: Dict, base_url: str, base_url_root: str, scraped_at: str) -> List[WorkdayJob]:
         """Extract jobs from Workday API response"""
         jobs = []
 
-        job_postings = data.get('jobPostings', data.get('jobs', []))
+        job_postings = _first(data, 'jobPostings', 'jobs') or []
 
         for posting in job_postings:
             try:
@@ -239,24 +519,25 @@ class WorkdayScraper:
                 external_path = posting.get('externalPath', '')
                 if external_path:
                     # Workday URLs are relative
-                    base = base_url.split('/search')[0] if '/search' in base_url else base_url
-                    application_url = f"{base}{external_path}"
+                    application_url = f"{base_url_root}{external_path}"
                 else:
                     application_url = base_url
 
-                job = {
-                    'title': title,
-                    'company': airline_config['name'],
-                    'location': self._extract_location(posting),
-                    'region': airline_config.get('region', ''),
-                    'country': airline_config.get('country', ''),
-                    'job_id': posting.get('bulletFields', [{}])[0] if posting.get('bulletFields') else '',
-                    'description': posting.get('descriptionSummary', ''),
-                    'posted_date': posting.get('postedOn', ''),
-                    'application_url': application_url,
-                    'source': 'Workday API',
-                    'scraped_at': datetime.utcnow().isoformat(),
-                }
+                bullet_fields = posting.get('bulletFields')
+
+                job = WorkdayJob(
+                    title=title,
+                    company=airline_config['name'],
+                    location=self._extract_location(posting),
+                    region=airline_config.get('region', ''),
+                    country=airline_config.get('country', ''),
+                    job_id=bullet_fields[0] if bullet_fields else '',
+                    description=posting.get('descriptionSummary', ''),
+                    posted_date=posting.get('postedOn', ''),
+                    application_url=application_url,
+                    source='Workday API',
+                    scraped_at=scraped_at,
+                )
 
                 jobs.append(job)
             except Exception:
@@ -264,37 +545,60 @@ class WorkdayScraper:
 
         return jobs
 
-    def _parse_job_card(self, card, airline_config: Dict, base_url: str) -> Optional[Dict]:
-        """Parse a single job card element"""
+    def _pair_card_locations(self, tree, cards: List) -> Dict:
+        """
+        Pair each job card with the first jobLocation element after it.
+
+        One document-order walk over the tree, rather than a forward search
+        from every card (which is quadratic in page size).
+        """
+        card_set = set(cards)
+        locations = {}
+        pending = []
+
+        for element in tree.iter(etree.Element):
+            if element in card_set:
+                pending.append(element)
+            elif pending and element.get('data-automation-id') == 'jobLocation':
+                location = element.text_content().strip()
+                for card in pending:
+                    locations[card] = location
+                pending.clear()
+
+        return locations
+
+    def _parse_job_card(self, card, airline_config: Dict, link_root: str, scraped_at: str, location: str = '') -> Optional[WorkdayJob]:
+        """Parse a single job card element (lxml)"""
         try:
             # Get job title
-            title_elem = card.select_one('[data-automation-id="jobTitle"]') or card
-            title = title_elem.get_text(strip=True)
+            title_matches = _CARD_TITLE_XP(card)
+            title_elem = title_matches[0] if title_matches else card
+            title = title_elem.text_content().strip()
 
             # Get job URL
-            link = card.get('href') or card.find_parent('a').get('href', '')
+            link = card.get('href')
+            if not link:
+                parent_link = next(card.iterancestors('a'), None)
+                if parent_link is None:
+                    return None
+                link = parent_link.get('href', '')
             if link and not link.startswith('http'):
-                base = base_url.split('/search')[0] if '/search' in base_url else base_url.rsplit('/', 1)[0]
-                link = f"{base}{link}"
-
-            # Get location
-            location_elem = card.find_next('[data-automation-id="jobLocation"]')
-            location = location_elem.get_text(strip=True) if location_elem else ''
-
-            return {
-                'title': title,
-                'company': airline_config['name'],
-                'location': location,
-                'region': airline_config.get('region', ''),
-                'country': airline_config.get('country', ''),
-                'application_url': link,
-                'source': 'Workday HTML',
-                'scraped_at': datetime.utcnow().isoformat(),
-            }
+                link = f"{link_root}{link}"
+
+            return WorkdayJob(
+                title=title,
+                company=airline_config['name'],
+                location=location,
+                region=airline_config.get('region', ''),
+                country=airline_config.get('country', ''),
+                application_url=link,
+                source='Workday HTML',
+                scraped_at=scraped_at,
+            )
         except Exception:
             return None
 
-    def _build_application_url(self, posting: Dict, base_url: str) -> str:
+    def _build_application_url(self, posting: Dict, base_url: str, base_url_root: str) -> str:
         """Build the actual application URL from job posting data"""
         # Check for direct application URL
         if 'applyUrl' in posting:
@@ -303,10 +607,9 @@ class WorkdayScraper:
             return posting['applicationUrl']
 
         # Build from job ID
-        job_id = posting.get('id', posting.get('jobId', ''))
+        job_id = _first(posting, 'id', 'jobId')
         if job_id:
-            base = base_url.split('/search')[0] if '/search' in base_url else base_url
-            return f"{base}/job/{job_id}"
+            return f"{base_url_root}/job/{job_id}"
 
         return base_url
 
@@ -325,45 +628,26 @@ class WorkdayScraper:
     def _extract_requirements(self, posting: Dict) -> Dict:
         """Extract hour requirements and other qualifications"""
         requirements = {}
-        description = posting.get('description', '') + ' ' + posting.get('qualifications', '')
-        description = description.lower()
-
-        # Extract hour requirements using regex
-        hour_patterns = [
-            (r'(\d{1,5})\s*(?:hours?|hrs?)\s*(?:total|tt)', 'min_total_hours'),
-            (r'minimum\s*(?:of\s*)?(\d{1,5})\s*(?:hours?|hrs?)', 'min_total_hours'),
-            (r'(\d{1,5})\s*(?:hours?|hrs?)\s*(?:pic|command)', 'min_pic_hours'),
-            (r'(\d{1,5})\s*(?:hours?|hrs?)\s*(?:on\s*type|type)', 'min_type_hours'),
-        ]
-
-        for pattern, field in hour_patterns:
-            match = re.search(pattern, description)
-            if match:
-                try:
-                    requirements[field] = int(match.group(1))
-                except ValueError:
-                    pass
+        # Scan description and qualifications in place rather than building a
+        # lowered concatenation of the two (the patterns ignore case)
+        texts = [t for t in (posting.get('description'), posting.get('qualifications')) if t]
+
+        # Extract hour requirements using regex (first mention of each field wins)
+        for field, pattern in _HOUR_PATTERNS:
+            for text in texts:
+                match = pattern.search(text)
+                if match:
+                    requirements[field] = int(match.group(1) or match.group(2))
+                    break
 
         # Check for type rating requirement
-        type_rating_patterns = [
-            r'type\s*rat(?:ed|ing)\s*required',
-            r'must\s*have.*type\s*rat',
-            r'current\s*type\s*rat',
-        ]
-
         requirements['type_rating_required'] = any(
-            re.search(p, description) for p in type_rating_patterns
+            p.search(text) for text in texts for p in _TYPE_REQUIRED_RE
         )
 
         # Check if type rating is provided
-        provided_patterns = [
-            r'type\s*rat(?:ed|ing).*provided',
-            r'training\s*provided',
-            r'will\s*provide\s*type',
-        ]
-
         requirements['type_rating_provided'] = any(
-            re.search(p, description) for p in provided_patterns
+            p.search(text) for text in texts for p in _PROVIDED_RE
         )
 
         return requirements
@@ -372,21 +656,14 @@ class WorkdayScraper:
         """Check if job title is pilot-related"""
         title_lower = title.lower()
 
-        pilot_keywords = [
-            'pilot', 'captain', 'first officer', 'f/o', 'fo ',
-            'second officer', 'cruise pilot', 'flight crew',
-            'cadet', 'co-pilot', 'copilot', 'flight operations',
-            'type rated', 'direct entry'
-        ]
+        if AHOCORASICK_AVAILABLE:
+            return (
+                next(_PILOT_AC.iter(title_lower), None) is not None
+                and next(_EXCLUDE_AC.iter(title_lower), None) is None
+            )
 
-        # Exclude non-flying roles
-        exclude_keywords = [
-            'drone', 'simulator', 'instructor only', 'ground',
-            'dispatcher', 'coordinator', 'manager', 'admin'
-        ]
-
-        has_pilot_keyword = any(kw in title_lower for kw in pilot_keywords)
-        has_exclude_keyword = any(kw in title_lower for kw in exclude_keywords)
+        has_pilot_keyword = any(kw in title_lower for kw in PILOT_KEYWORDS)
+        has_exclude_keyword = any(kw in title_lower for kw in EXCLUDE_KEYWORDS)
 
         return has_pilot_keyword and not has_exclude_keyword
 
@@ -396,19 +673,33 @@ class WorkdayScraper:
 # ============================================================
 
 async def scrape_all_workday_airlines():
-    """Scrape all airlines using Workday ATS"""
+    """Scrape all airlines using Workday ATS, concurrently across hosts"""
     from airline_sources import WORKDAY_AIRLINES
 
     scraper = WorkdayScraper()
     all_jobs = []
 
-    for airline_key, config in WORKDAY_AIRLINES.items():
-        try:
-            jobs = await scraper.fetch_jobs(config)
-            all_jobs.extend(jobs)
-            await asyncio.sleep(2)  # Be polite between requests
-        except Exception as e:
-            print(f"Error scraping {airline_key}: {e}")
+    # Airlines can share a Workday tenant host; cap in-flight scrapes per host
+    host_limits = defaultdict(lambda: asyncio.Semaphore(PER_HOST_CONCURRENCY))
+
+    async def scrape_one(config: Dict, client: httpx.AsyncClient) -> List[Dict]:
+        host = urlparse(config.get('workday_url', '')).netloc
+        async with host_limits[host]:
+            return await scraper.fetch_jobs(config, client)
+
+    # One pooled HTTP/2 client for every airline
+    async with scraper.create_client() as client:
+        tasks = [
+            asyncio.create_task(scrape_one(config, client))
+            for config in WORKDAY_AIRLINES.values()
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    for airline_key, result in zip(WORKDAY_AIRLINES, results):
+        if isinstance(result, BaseException):
+            print(f"Error scraping {airline_key}: {result}")
+        else:
+            all_jobs.extend(result)
 
     return all_jobs
 
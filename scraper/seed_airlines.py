@@ -92,9 +92,27 @@ inserted = 0
 updated = 0
 skipped = 0
 
+# One round trip for every existing airline instead of a SELECT per airline
+existing = client.table('airlines_to_scrape').select('name, career_page_url').in_(
+    'name', [a[0] for a in all_airlines]
+).execute()
+existing_urls = {row['name']: row['career_page_url'] for row in existing.data}
+
+# Only new airlines and airlines whose URL changed need writing
+rows_to_write = []
+
 for airline in all_airlines:
     name = airline[0]
-    data = {
+
+    if name in existing_urls:
+        if existing_urls[name] == airline[1]:
+            skipped += 1
+            continue
+        print(f"  ~ {name} (URL updated)")
+    else:
+        print(f"  + {name}")
+
+    rows_to_write.append({
         'name': name,
         'career_page_url': airline[1],
         'ats_type': airline[2],
@@ -104,31 +122,18 @@ for airline in all_airlines:
         'country': airline[6],
         'iata_code': airline[7],
         'icao_code': airline[8]
-    }
-
-    try:
-        # Check if exists
-        existing = client.table('airlines_to_scrape').select('id, career_page_url').eq('name', name).execute()
-
-        if existing.data:
-            # Update URL if different
-            if existing.data[0]['career_page_url'] != airline[1]:
-                client.table('airlines_to_scrape').update({
-                    'career_page_url': airline[1],
-                    'ats_type': airline[2]
-                }).eq('name', name).execute()
-                print(f"  ~ {name} (URL updated)")
-                updated += 1
-            else:
-                skipped += 1
-        else:
-            # Insert new
-            client.table('airlines_to_scrape').insert(data).execute()
-            print(f"  + {name}")
-            inserted += 1
-
-    except Exception as e:
-        print(f"  x {name}: {str(e)[:60]}")
+    })
+
+# One RPC for all writes (migrations/002_bulk_upsert_airlines.sql): new airlines
+# get the full row, existing ones only their URL/ATS
+try:
+    if rows_to_write:
+        result = client.rpc('bulk_upsert_airlines', {'payload': rows_to_write}).execute()
+        counts = result.data[0] if result.data else {}
+        inserted = counts.get('inserted', 0)
+        updated = counts.get('updated', 0)
+except Exception as e:
+    print(f"  x bulk write failed: {str(e)[:60]}")
 
 print(f"\n{'='*50}")
 print(f"Results: {inserted} inserted, {updated} updated, {skipped} unchanged")
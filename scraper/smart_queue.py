@@ -9,6 +9,7 @@ Usage:
     python smart_queue.py --once             # Run one batch and exit
     python smart_queue.py --tier 1           # Only process Tier 1 airlines
     python smart_queue.py --batch-size 10    # Process 10 airlines per batch
+    python smart_queue.py --workers 2        # Scrape 2 airlines in parallel
 """
 
 import os
@@ -16,15 +17,17 @@ import sys
 import time
 import signal
 import logging
+import threading
 import argparse
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional
 
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
 # Import the universal engine
-from universal_engine import scrape_airline
+from universal_engine import scrape_airline, flush_pending
 
 # Load environment variables from project root
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -36,8 +39,10 @@ SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_KEY") or os.getenv("SUPABASE_KEY")
 
 # Queue settings
 DEFAULT_BATCH_SIZE = 5
-SLEEP_BETWEEN_AIRLINES = 10  # seconds
-SLEEP_WHEN_EMPTY = 300  # 5 minutes when no airlines due
+DEFAULT_WORKERS = 4  # airlines scraped in parallel, each with its own browser
+SLEEP_WHEN_EMPTY = 300  # 5 minutes when no airlines due (if next due time is unknown)
+MAX_IDLE_SLEEP = 3600  # re-check at least hourly so newly added airlines get picked up
+STATS_CACHE_TTL = 60  # seconds queue stats are reused before re-querying
 
 # Tier frequency settings (in hours)
 TIER_FREQUENCIES = {
@@ -63,12 +68,14 @@ logger = logging.getLogger(__name__)
 
 # Graceful shutdown handling
 shutdown_requested = False
+shutdown_event = threading.Event()  # wakes the queue out of idle sleeps
 
 
 def signal_handler(signum, frame):
     global shutdown_requested
     logger.info("Shutdown signal received, finishing current batch...")
     shutdown_requested = True
+    shutdown_event.set()
 
 
 signal.signal(signal.SIGINT, signal_handler)
@@ -79,74 +86,120 @@ signal.signal(signal.SIGTERM, signal_handler)
 # QUEUE DATABASE OPERATIONS
 # =============================================================================
 
+# One Supabase client per process, so its HTTP keep-alive pool is shared
+_client: Optional[Client] = None
+_client_lock = threading.Lock()
+
+
+def get_client(supabase_url: str, supabase_key: str) -> Client:
+    """Return the process-wide Supabase client, creating it on first use"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = create_client(supabase_url, supabase_key)
+        return _client
+
+
 class QueueDB:
     """Database operations for the smart queue"""
 
     def __init__(self, supabase_url: str, supabase_key: str):
         if not supabase_url or not supabase_key:
             raise ValueError("Supabase credentials required for queue operation")
-        self.client: Client = create_client(supabase_url, supabase_key)
+        self.client: Client = get_client(supabase_url, supabase_key)
+        self._stats_cache: Optional[Dict] = None
+        self._stats_cached_at = 0.0
 
     def get_due_airlines(self, batch_size: int = 5, tier: int = None) -> List[Dict]:
-        """Get airlines that are due for scraping."""
-        now = datetime.utcnow()
-        all_due = []
-
+        """Get airlines that are due for scraping (one query across all tiers)."""
+        now = datetime.now(timezone.utc)
         tiers_to_check = [tier] if tier else [1, 2, 3]
 
+        # Each tier has its own cutoff; never-checked airlines are always due
+        due_filters = ["last_checked.is.null"]
         for t in tiers_to_check:
             frequency_hours = TIER_FREQUENCIES.get(t, 24)
             cutoff = (now - timedelta(hours=frequency_hours)).isoformat()
+            due_filters.append(f"and(tier.eq.{t},last_checked.lt.{cutoff})")
 
-            try:
-                response = self.client.table("airlines_to_scrape")\
-                    .select("*")\
-                    .eq("status", "active")\
-                    .eq("tier", t)\
-                    .or_(f"last_checked.is.null,last_checked.lt.{cutoff}")\
-                    .order("last_checked", nullsfirst=True)\
-                    .limit(batch_size)\
-                    .execute()
+        try:
+            response = self.client.table("airlines_to_scrape")\
+                .select("*")\
+                .eq("status", "active")\
+                .in_("tier", tiers_to_check)\
+                .or_(",".join(due_filters))\
+                .order("last_checked", nullsfirst=True)\
+                .limit(batch_size)\
+                .execute()
 
-                if response.data:
-                    all_due.extend(response.data)
+            return response.data or []
 
-            except Exception as e:
-                logger.error(f"Error querying tier {t}: {e}")
+        except Exception as e:
+            logger.error(f"Error querying due airlines: {e}")
+            return []
 
-        all_due.sort(key=lambda x: x.get("last_checked") or "1900-01-01")
-        return all_due[:batch_size]
+    def get_queue_stats(self, max_age: float = STATS_CACHE_TTL) -> Dict:
+        """Get statistics about the queue, reusing a result up to max_age seconds old"""
+        if self._stats_cache is not None and time.monotonic() - self._stats_cached_at < max_age:
+            return self._stats_cache
 
-    def get_queue_stats(self) -> Dict:
-        """Get statistics about the queue"""
         stats = {"total": 0, "by_tier": {}, "by_status": {}, "due_count": 0}
 
         try:
-            total = self.client.table("airlines_to_scrape").select("id", count="exact").execute()
-            stats["total"] = total.count if total.count else 0
-
-            for tier in [1, 2, 3]:
-                count = self.client.table("airlines_to_scrape")\
-                    .select("id", count="exact")\
-                    .eq("tier", tier)\
-                    .execute()
-                stats["by_tier"][tier] = count.count if count.count else 0
-
-            for status in ["active", "inactive", "error"]:
-                count = self.client.table("airlines_to_scrape")\
-                    .select("id", count="exact")\
-                    .eq("status", status)\
-                    .execute()
-                stats["by_status"][status] = count.count if count.count else 0
-
-            due = self.get_due_airlines(batch_size=100)
-            stats["due_count"] = len(due)
+            # Single aggregate query (migrations/004_queue_stats.sql)
+            response = self.client.rpc("queue_stats", {"tier_hours": TIER_FREQUENCIES}).execute()
+            stats = self._parse_stats(response.data or {})
+
+            self._stats_cache = stats
+            self._stats_cached_at = time.monotonic()
 
         except Exception as e:
             logger.error(f"Error getting stats: {e}")
 
         return stats
 
+    @staticmethod
+    def _parse_stats(data: Dict) -> Dict:
+        """Shape a queue_stats() JSON object (tier keys come back as strings)"""
+        return {
+            "total": data.get("total", 0),
+            "by_tier": {int(tier): count for tier, count in data.get("by_tier", {}).items()},
+            "by_status": data.get("by_status", {}),
+            "due_count": data.get("due_count", 0),
+        }
+
+    def get_materialized_stats(self) -> Dict:
+        """
+        Queue stats from the queue_stats_mv materialized view (refreshed every
+        minute by pg_cron, migrations/007_queue_stats_mv.sql). Falls back to
+        get_queue_stats() if the view is unavailable.
+        """
+        try:
+            response = self.client.table("queue_stats_mv").select("stats").limit(1).execute()
+            if response.data:
+                return self._parse_stats(response.data[0]["stats"])
+        except Exception as e:
+            logger.error(f"Error reading materialized stats: {e}")
+
+        return self.get_queue_stats()
+
+    def seconds_until_next_due(self, tier: int = None) -> Optional[float]:
+        """Seconds until the next active airline is due (0 if overdue), None if unknown"""
+        try:
+            # migrations/006_next_due_at.sql
+            response = self.client.rpc("next_due_at", {"tier_hours": TIER_FREQUENCIES, "p_tier": tier}).execute()
+            if not response.data:
+                return None
+            next_due = datetime.fromisoformat(response.data)
+            return max((next_due - datetime.now(timezone.utc)).total_seconds(), 0.0)
+        except Exception as e:
+            logger.error(f"Error getting next due time: {e}")
+            return None
+
+    def invalidate_stats(self):
+        """Drop cached stats after scrapes have changed last_checked / status"""
+        self._stats_cache = None
+
 
 # =============================================================================
 # SMART QUEUE ENGINE
@@ -155,10 +208,25 @@ class QueueDB:
 class SmartQueue:
     """The main queue engine that runs continuously"""
 
-    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE):
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE, workers: int = DEFAULT_WORKERS):
         self.batch_size = batch_size
+        self.workers = workers
         self.db = QueueDB(SUPABASE_URL, SUPABASE_KEY)
 
+    def process_airline(self, airline: Dict) -> Optional[bool]:
+        """Scrape one airline; None if skipped for shutdown, else whether it succeeded"""
+        if shutdown_requested:
+            return None
+
+        try:
+            # Use the nuclear scrape_airline function (it waits per host, so
+            # airlines on different sites don't sleep behind each other)
+            scrape_airline(airline)
+            return True
+        except Exception as e:
+            logger.error(f"Error processing {airline['name']}: {e}")
+            return False
+
     def process_batch(self, tier: int = None) -> Dict:
         """Process a batch of due airlines"""
         airlines = self.db.get_due_airlines(self.batch_size, tier)
@@ -173,20 +241,19 @@ class SmartQueue:
 
         results = {"processed": 0, "jobs_found": 0, "errors": 0}
 
-        for airline in airlines:
-            if shutdown_requested:
-                logger.info("Shutdown requested, stopping batch")
-                break
+        # Airlines are independent sites, so scrape several at once
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            outcomes = list(executor.map(self.process_airline, airlines))
+
+        if None in outcomes:
+            logger.info("Shutdown requested, stopped batch early")
 
-            try:
-                # Use the nuclear scrape_airline function
-                scrape_airline(airline)
-                results["processed"] += 1
-            except Exception as e:
-                logger.error(f"Error processing {airline['name']}: {e}")
-                results["errors"] += 1
+        results["processed"] = outcomes.count(True)
+        results["errors"] = outcomes.count(False)
 
-            time.sleep(SLEEP_BETWEEN_AIRLINES)
+        # Finish the batch's database writes; one insert for its scrape_logs rows
+        flush_pending()
+        self.db.invalidate_stats()
 
         logger.info(f"\nBatch complete: {results['processed']} processed, {results['errors']} errors")
         return results
@@ -208,11 +275,14 @@ class SmartQueue:
             results = self.process_batch(tier)
 
             if results["processed"] == 0:
-                logger.info(f"Sleeping {SLEEP_WHEN_EMPTY}s (no airlines due)...")
-                time.sleep(SLEEP_WHEN_EMPTY)
+                # Sleep until the next airline is actually due instead of polling
+                wait = self.db.seconds_until_next_due(tier)
+                wait = SLEEP_WHEN_EMPTY if wait is None else min(max(wait, 60), MAX_IDLE_SLEEP)
+                logger.info(f"Sleeping {wait:.0f}s (no airlines due)...")
+                shutdown_event.wait(wait)
             else:
                 logger.info("Sleeping 60s before next batch...")
-                time.sleep(60)
+                shutdown_event.wait(60)
 
         logger.info("Queue stopped")
 
@@ -226,14 +296,15 @@ def main():
     parser.add_argument("--once", action="store_true", help="Run one batch and exit")
     parser.add_argument("--tier", type=int, choices=[1, 2, 3], help="Only process specific tier")
     parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Number of airlines per batch")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Airlines scraped in parallel")
     parser.add_argument("--stats", action="store_true", help="Print queue statistics and exit")
 
     args = parser.parse_args()
 
-    queue = SmartQueue(batch_size=args.batch_size)
+    queue = SmartQueue(batch_size=args.batch_size, workers=args.workers)
 
     if args.stats:
-        stats = queue.db.get_queue_stats()
+        stats = queue.db.get_materialized_stats()
         print("\n=== Queue Statistics ===")
         print(f"Total airlines: {stats['total']}")
         print(f"Due for scraping: {stats['due_count']}")
@@ -5,19 +5,171 @@ Brute force crawler that feeds EVERYTHING to Claude.
 It doesn't guess. It grabs every link and lets AI decide.
 """
 
+import atexit
 import time
 import os
+import hashlib
 import random
+import json
+import queue
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from urllib.parse import quote, urljoin, urlparse
+import httpx
+import orjson
+from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright
 from supabase import create_client
 from dotenv import load_dotenv
-from ai_parser import parse_job_with_ai
+from ai_parser import parse_job_with_ai, MAX_PROMPT_CHARS
+
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
 
 load_dotenv()
 supabase = create_client(os.getenv("NEXT_PUBLIC_SUPABASE_URL"), os.getenv("SUPABASE_SERVICE_KEY"))
 
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Job pages are fetched over plain HTTP first; only pages that come back
+# (nearly) empty or JS-gated are loaded in the browser
+MIN_STATIC_TEXT = 500
+JS_GATE_MARKERS = ("enable javascript", "javascript is required", "javascript is disabled")
+FETCH_WORKERS = 8
+_http = httpx.Client(
+    http2=True,
+    timeout=10,
+    follow_redirects=True,
+    headers={"User-Agent": USER_AGENT},
+    limits=httpx.Limits(max_connections=50),
+)
+
+# A page needs at least one of these (and MIN_STATIC_TEXT chars) before it is
+# worth an AI call; anything else can't be a pilot job posting. Covers the
+# French/Spanish/Portuguese/Italian/German/Dutch/Nordic titles airlines post
+# under (same vocabulary as SuccessFactorsScraper.PILOT_KEYWORDS)
+PILOT_TEXT_RE = re.compile(
+    r"\b(?:pilots?|first officer|captain|cadet|type rating|flight hours|atpl|b73[78]|a3[23]0"
+    r"|pilotes?|pilot[oa]s?|piloten|co-?pilot(?:e|o|en)?s?|commandant de bord|officier pilote"
+    r"|comandantes?|primer oficial|copiloto|flugkapitän|kapitän|erster offizier|verkehrspilot"
+    r"|kapitein|eerste officier|flygkapten|styrman|flykaptajn|flyger)\b",
+    re.IGNORECASE,
+)
+
+# AI verdicts persist in ai_parse_cache (migrations/008_ai_parse_cache.sql) and
+# are reused while the page text is unchanged and the row is this fresh
+AI_CACHE_TTL_DAYS = 7
+
+# Cookies/local storage per career-site host, so consent banners and session
+# cookies survive between runs
+STATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "state")
+
+# Requests that cost bandwidth but add no text. Page text is read from the raw
+# HTML (no layout), so stylesheets aren't needed either.
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+
+# Same flags as PlaywrightScraper, plus images off at the renderer level so
+# even requests the route handler never sees (e.g. from CSS) aren't decoded
+LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--blink-settings=imagesEnabled=false",
+    "--disable-dev-shm-usage",
+]
+
+# Max rows per upsert request (keeps payloads well under PostgREST limits)
+UPSERT_CHUNK_SIZE = 500
+# Existence lookups put the URLs in the query string: cap each request at this
+# many URL-encoded characters (long ATS links would blow an 8 KB request line
+# at a fixed count) and at LOOKUP_CHUNK_SIZE URLs
+LOOKUP_MAX_URL_CHARS = 4000
+LOOKUP_CHUNK_SIZE = 100
+
+# Confirmed jobs are buffered across airlines and upserted a full chunk at a
+# time, instead of one upsert round-trip per airline. Each airline's status
+# update and log row wait in _pending_results until its jobs are written, so
+# they report how many were actually saved.
+_pending_jobs = []
+_pending_results = []
+_jobs_lock = threading.Lock()
+
+# Candidate URLs already claimed in this run/batch: shared portals and agencies
+# list the same postings under several airlines, and each needs only one AI
+# call and one upsert. Cleared by flush_pending().
+_seen_job_urls = set()
+_seen_lock = threading.Lock()
+
+# Every confirmed job is also appended to this file as one JSON line, as soon
+# as its airline finishes (no run-wide job list kept in memory)
+OUTPUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "output", "universal_jobs.ndjson")
+_output_file = None
+_output_lock = threading.Lock()
+
+# scrape_logs rows are buffered and written in one insert per batch
+LOG_FLUSH_SIZE = 50
+_pending_logs = []
+_logs_lock = threading.Lock()  # scrape_airline may run on several threads
+
+# Only the airline columns scrape_airline reads; the active list is reused for
+# AIRLINES_CACHE_TTL seconds when run_engine is called repeatedly in-process
+AIRLINE_COLUMNS = "id,name,career_page_url,region,ats_type"
+AIRLINES_CACHE_TTL = 60
+_airlines_cache = None  # (fetched_at, rows)
+
+# Politeness is per host: a request only waits for the previous one to the same
+# site, never for other airlines' sites. Career pages keep the old 10 s gap
+# between airlines; job pages (static fetches and browser loads alike) the old
+# average of 2 s per 10 loads.
+CAREER_PAGE_INTERVAL = 10.0
+JOB_PAGE_INTERVAL = 0.2
+_last_hit = {}
+_last_hit_lock = threading.Lock()
+
+# Airlines scraped at once by run_engine (one browser per worker thread; the
+# sync Playwright API can't be shared between threads)
+SCRAPE_WORKERS = 4
+
+# Database writes run here, so a scraping thread moves on to its next airline
+# while Supabase requests are still in flight
+_db_writer = ThreadPoolExecutor(max_workers=2, thread_name_prefix="db-writer")
+_pending_writes = set()
+_pending_writes_lock = threading.Lock()  # scraping threads add, db-writer threads discard
+
 
 # --- BRUTE FORCE LINK FINDER ---
+# Links that look like postings (href or text) - what a JS job list adds after
+# DOMContentLoaded. The career page counts as loaded once at least minCount of
+# them exist and their number has held for settleMs.
+JOB_LINK_PATTERN = r"job|vacanc|position|requisition|opening|pilot|captain|officer|cadet"
+_LINKS_SETTLED_JS = """([pattern, minCount, settleMs]) => {
+    const re = new RegExp(pattern, 'i');
+    const count = Array.from(document.querySelectorAll('a[href]'))
+        .filter(a => re.test(a.getAttribute('href') + ' ' + a.textContent)).length;
+    const state = window.__jobLinksWait || (window.__jobLinksWait = {count: -1, since: 0});
+    const now = performance.now();
+    if (count !== state.count) {
+        state.count = count;
+        state.since = now;
+    }
+    return count >= minCount && now - state.since >= settleMs;
+}"""
+
+# 1. THE BLOCKLIST (Skip technical pages to save money)
+# Matched against whole words of the URL and link text, so "help" blocks
+# /help/ but not /helpful-pilot-tips
+BLOCKED_SCHEMES = ("javascript:", "mailto:", "tel:")
+BLOCKLIST = frozenset({
+    "login", "signin", "register", "password", "privacy", "terms",
+    "policy", "facebook", "twitter", "linkedin", "instagram", "youtube",
+    "faq", "help", "contact", "forgot", "reset", "accessibility",
+    "sitemap", "language"
+})
+_TOKEN_SPLIT_RE = re.compile(r"[^a-z0-9]+")
+
+
 def get_potential_links(page, base_url):
     """
     Finds ALL links that might be jobs.
@@ -25,52 +177,41 @@ def get_potential_links(page, base_url):
     """
     print("      [*] Scanning page for potential job links...")
 
-    # Wait for dynamic content
+    # Wait for dynamic content: until the posting-like links have rendered and
+    # stopped changing, else (no such links) for the network to go idle
     try:
-        page.wait_for_load_state("networkidle", timeout=5000)
+        page.wait_for_function(
+            _LINKS_SETTLED_JS, arg=[JOB_LINK_PATTERN, 2, 1500], timeout=15000, polling=250
+        )
     except:
-        pass
+        try:
+            page.wait_for_load_state("networkidle", timeout=10000)
+        except:
+            pass
 
-    all_links = page.locator("a[href]").all()
+    # [href, text] for every link in one round-trip, instead of two per link
+    all_links = page.eval_on_selector_all(
+        "a[href]",
+        "els => els.map(a => [a.getAttribute('href') || '', (a.innerText || '').toLowerCase().trim()])"
+    )
     unique_urls = set()
 
-    # 1. THE BLOCKLIST (Skip technical pages to save money)
-    BLOCKLIST = [
-        "login", "signin", "register", "password", "privacy", "terms",
-        "policy", "javascript:", "mailto:", "tel:", "facebook", "twitter",
-        "linkedin", "instagram", "youtube", "faq", "help", "contact",
-        "forgot", "reset", "accessibility", "sitemap", "language"
-    ]
-
-    # 2. THE GREENLIST (If URL/Text contains this, we MUST check it)
-    GREENLIST = [
-        "captain", "officer", "pilot", "instructor", "cadet", "flight-crew",
-        "vacancy", "opening", "job", "career", "join", "apply", "detail"
-    ]
-
-    for link in all_links:
+    for href, text in all_links:
         try:
-            href = link.get_attribute("href")
-            text = link.inner_text().lower().strip()
-
-            if not href or len(href) < 2:
+            if not href or len(href) < 2 or href.startswith("#"):
                 continue
 
-            # Normalize URL
-            if href.startswith("/"):
-                # Handle base URL robustly
-                domain = "/".join(base_url.split("/")[:3])
-                href = domain + href
+            # Normalize URL (root-relative, page-relative and protocol-relative)
+            href = urljoin(base_url, href)
 
             href_lower = href.lower()
 
-            # Skip Blocklisted
-            if any(bad in href_lower for bad in BLOCKLIST):
+            # Skip Blocklisted (one split of URL and text, one set check)
+            if href_lower.startswith(BLOCKED_SCHEMES):
                 continue
-            if any(bad in text for bad in BLOCKLIST):
+            if not BLOCKLIST.isdisjoint(_TOKEN_SPLIT_RE.split(f"{href_lower} {text}")):
                 continue
 
-            # Keep Greenlisted OR anything that looks like a deep link
             # We are aggressive here: If it's not blocked, we check it.
             unique_urls.add(href)
 
@@ -81,37 +222,382 @@ def get_potential_links(page, base_url):
     return list(unique_urls)[:40]
 
 
-# --- THE ENGINE ---
-def scrape_airline(airline):
-    print(f"\n[+] Processing: {airline['name']}")
+def _claim_new_urls(urls):
+    """Keep only URLs no other airline has claimed since the last flush_pending()"""
+    with _seen_lock:
+        new_urls = [u for u in urls if u not in _seen_job_urls]
+        _seen_job_urls.update(new_urls)
+    return new_urls
+
+
+def wait_for_host(url, interval):
+    """Sleep until `interval` seconds have passed since the last request to url's host"""
+    host = urlparse(url).netloc
+    with _last_hit_lock:
+        now = time.monotonic()
+        last = _last_hit.get(host)
+        ready_at = now if last is None else max(now, last + interval)
+        _last_hit[host] = ready_at  # reserve the slot before sleeping
+    if ready_at > now:
+        time.sleep(ready_at - now)
+
+
+# --- STATIC FETCH ---
+def _visible_text(html):
+    """Body text without scripts/styles, whitespace collapsed"""
+    if SELECTOLAX_AVAILABLE:
+        tree = HTMLParser(html)
+        tree.strip_tags(["script", "style", "noscript", "template"])
+        text = tree.body.text(separator=" ") if tree.body else ""
+    else:
+        soup = BeautifulSoup(html, "lxml")
+        for tag in soup(["script", "style", "noscript", "template"]):
+            tag.decompose()
+        text = soup.body.get_text(" ") if soup.body else ""
+    return " ".join(text.split())
+
+
+def fetch_text(url):
+    """
+    Fetch a job page without the browser.
 
-    with sync_playwright() as p:
-        # Launch Headless Chrome
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
-        page = context.new_page()
+    Returns its visible text, or None when the page needs JavaScript (or the
+    request failed) and has to be rendered with Playwright instead.
+    """
+    # Same per-host pacing as browser loads - the FETCH_WORKERS threads share it
+    wait_for_host(url, JOB_PAGE_INTERVAL)
+    try:
+        response = _http.get(url)
+        response.raise_for_status()
+    except Exception:
+        return None
+
+    if "html" not in response.headers.get("content-type", ""):
+        return None
+
+    text = _visible_text(response.text)
+    if len(text) < MIN_STATIC_TEXT:
+        return None
+    text_lower = text.lower()
+    if any(marker in text_lower for marker in JS_GATE_MARKERS):
+        return None
+    return text
+
+
+# --- AI CACHE ---
+def parse_job_cached(raw_text, url, company_name):
+    """parse_job_with_ai, skipped when ai_parse_cache has this URL with the same text"""
+    url_hash = hashlib.md5(url.encode()).hexdigest()
+    content_hash = hashlib.sha256(raw_text[:MAX_PROMPT_CHARS].encode()).hexdigest()
+    cutoff = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() - AI_CACHE_TTL_DAYS * 86400))
+
+    try:
+        response = (supabase.table("ai_parse_cache").select("ai_json")
+                    .eq("url_hash", url_hash).eq("content_sha256", content_hash)
+                    .gte("cached_at", cutoff).limit(1).execute())
+        if response.data:
+            return response.data[0]["ai_json"]
+    except Exception as e:
+        print(f"      [!] AI cache lookup failed: {e}")
+
+    ai_data = parse_job_with_ai(raw_text, url, company_name)
 
+    # Failed calls are not cached
+    if "error" not in ai_data:
         try:
-            # 1. GO TO CAREER PAGE
-            url = airline.get('career_page_url') or airline.get('url', '')
-            print(f"   Navigating to: {url}...")
-            page.goto(url, timeout=60000)
-            time.sleep(4)  # Allow JS to load
+            supabase.table("ai_parse_cache").upsert({
+                "url_hash": url_hash,
+                "content_sha256": content_hash,
+                "ai_json": ai_data,
+                "cached_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            }, on_conflict="url_hash", returning="minimal").execute()
+        except Exception as e:
+            print(f"      [!] AI cache write failed: {e}")
 
-            # 2. FIND ALL LINKS
-            potential_jobs = get_potential_links(page, url)
-            print(f"   Found {len(potential_jobs)} potential pages. Analyzing with AI...")
+    return ai_data
 
-            # 3. VISIT & ANALYZE EACH LINK
-            valid_jobs_count = 0
 
-            for i, job_url in enumerate(potential_jobs):
-                try:
-                    # Brief pause to be polite
-                    if i > 0 and i % 10 == 0:
-                        time.sleep(2)
+# --- DATABASE ---
+def _lookup_chunks(urls):
+    """Split urls into groups that each fit one lookup's query string"""
+    chunk, size = [], 0
+    for url in urls:
+        # quoted, plus the comma and quotes PostgREST's in.(...) adds
+        length = len(quote(url, safe="")) + 3
+        if chunk and (size + length > LOOKUP_MAX_URL_CHARS or len(chunk) >= LOOKUP_CHUNK_SIZE):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(url)
+        size += length
+    if chunk:
+        yield chunk
+
+
+def _changed_jobs(jobs):
+    """
+    Drop jobs whose stored row already has identical values, so re-scraped
+    postings that haven't changed cost no write. One SELECT per lookup chunk.
+    """
+    columns = ",".join(sorted({key for job in jobs for key in job}))
+    stored = {}
+
+    for urls in _lookup_chunks(job["application_url"] for job in jobs):
+        try:
+            response = supabase.table("pilot_jobs").select(columns).in_("application_url", urls).execute()
+        except Exception as e:
+            # Can't tell what changed; write everything
+            print(f"   [!] Existing-job lookup failed: {e}")
+            return jobs
+        stored.update({row["application_url"]: row for row in response.data or []})
+
+    return [
+        job for job in jobs
+        if (row := stored.get(job["application_url"])) is None
+        or any(row.get(key) != value for key, value in job.items())
+    ]
+
+
+def upsert_jobs(jobs):
+    """Save jobs with one multi-row upsert per chunk. Returns the application_urls now stored."""
+    # One row per application_url (last wins): Postgres rejects an upsert that
+    # hits the same conflict key twice in one statement
+    jobs = list({job["application_url"]: job for job in jobs}.values())
+    changed = _changed_jobs(jobs) if jobs else []
+
+    # Unchanged jobs are already stored as-is
+    changed_urls = {job["application_url"] for job in changed}
+    saved = {job["application_url"] for job in jobs} - changed_urls
+    for start in range(0, len(changed), UPSERT_CHUNK_SIZE):
+        chunk = changed[start:start + UPSERT_CHUNK_SIZE]
+        try:
+            supabase.table("pilot_jobs").upsert(chunk, on_conflict="application_url", returning="minimal").execute()
+            saved.update(job["application_url"] for job in chunk)
+        except Exception as e:
+            print(f"   [X] Failed to save {len(chunk)} jobs: {e}")
+    return saved
+
+
+def write_output(jobs):
+    """Append jobs to OUTPUT_PATH as NDJSON (the file is truncated on first use per run)"""
+    global _output_file
+    if not jobs:
+        return
+    with _output_lock:
+        if _output_file is None:
+            os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
+            _output_file = open(OUTPUT_PATH, "wb")
+        _output_file.write(b"".join(orjson.dumps(job) + b"\n" for job in jobs))
+        _output_file.flush()
+
+
+def queue_jobs(airline, jobs, started_at, error=None):
+    """
+    Buffer one airline's jobs for saving; upserts everything waiting once a
+    full chunk has built up. The airline's status and log row follow the write.
+    """
+    with _jobs_lock:
+        _pending_jobs.extend(jobs)
+        _pending_results.append((airline, jobs, started_at, error))
+        if len(_pending_jobs) < UPSERT_CHUNK_SIZE:
+            return
+        rows, results = _take_pending()
+    _write_pending(rows, results)
+
+
+def flush_jobs():
+    """Upsert whatever jobs are still buffered"""
+    with _jobs_lock:
+        if not _pending_results:
+            return
+        rows, results = _take_pending()
+    _write_pending(rows, results)
+
+
+def _take_pending():
+    """Empty the job buffers (caller holds _jobs_lock)"""
+    rows, results = _pending_jobs[:], _pending_results[:]
+    _pending_jobs.clear()
+    _pending_results.clear()
+    return rows, results
+
+
+def _write_pending(rows, results):
+    """Upsert buffered jobs, then record each airline with the count actually saved"""
+    saved_urls = upsert_jobs(rows)
+    print(f"   [SAVED] {len(saved_urls)}/{len(rows)} jobs upserted.")
+    for airline, jobs, started_at, error in results:
+        saved = sum(job["application_url"] in saved_urls for job in jobs)
+        _record_result(airline, saved, started_at, error)
+
+
+def _record_result(airline, jobs_saved, started_at, error=None):
+    """Update airline last_checked / health (failures too) and buffer its log row"""
+    if airline.get('id'):
+        update_airline_after_scrape(airline['id'], jobs_saved, error)
+    log_scrape(airline, jobs_saved, started_at, error)
+
+
+def update_airline_after_scrape(airline_id, jobs_found, error=None):
+    """
+    Record a scrape outcome (last_checked, job counts, failure streak) in one
+    atomic RPC. See migrations/003_update_airline_after_scrape.sql.
+    """
+    try:
+        supabase.rpc("update_airline_after_scrape", {
+            "p_id": airline_id,
+            "p_jobs": jobs_found,
+            "p_success": error is None,
+            "p_error": error,
+        }).execute()
+    except Exception as e:
+        print(f"   [X] Failed to update airline status: {e}")
+
+
+def log_scrape(airline, jobs_found, started_at, error=None):
+    """Buffer a scrape_logs row; written by flush_logs()"""
+    finished_at = time.time()
+    row = {
+        "airline_id": airline.get('id'),
+        "airline_name": airline['name'],
+        "ats_type_detected": airline.get('ats_type'),
+        "scraper_used": "universal_engine",
+        "status": "success" if error is None else "failed",
+        "jobs_found": jobs_found,
+        "duration_seconds": round(finished_at - started_at, 2),
+        "error_message": error[:500] if error else None,
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(started_at)),
+        "completed_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(finished_at)),
+    }
+    with _logs_lock:
+        _pending_logs.append(row)
+        full = len(_pending_logs) >= LOG_FLUSH_SIZE
+    if full:
+        flush_logs()
+
+
+def flush_logs():
+    """Insert all buffered scrape_logs rows in a single request"""
+    with _logs_lock:
+        if not _pending_logs:
+            return
+        rows = _pending_logs[:]
+        _pending_logs.clear()
+    try:
+        supabase.table("scrape_logs").insert(rows, returning="minimal").execute()
+    except Exception as e:
+        print(f"   [X] Failed to write {len(rows)} scrape logs: {e}")
+
+
+def flush_pending():
+    """Wait for queued database writes, then write the buffered jobs and scrape logs"""
+    with _pending_writes_lock:
+        pending = list(_pending_writes)
+    wait(pending)
+    flush_jobs()
+    flush_logs()
+    with _seen_lock:
+        _seen_job_urls.clear()
+
+
+# Buffered jobs/logs still get written if a run exits early (crash, Ctrl+C)
+atexit.register(flush_pending)
+
+
+def save_airline_results(airline, job_records, started_at, error=None):
+    """Persist one airline's scrape: its jobs, then airline status and its log row"""
+    write_output(job_records)
+    if not job_records:
+        # Nothing to wait for
+        _record_result(airline, 0, started_at, error)
+        return
+
+    # Queue for saving (also keeps jobs confirmed before a mid-scrape failure);
+    # status and log are recorded once the upsert reports what was saved
+    queue_jobs(airline, job_records, started_at, error)
+    print(f"   [QUEUED] {airline['name']}: {len(job_records)} jobs.")
+
+
+# --- BROWSER STATE ---
+def _state_path(url):
+    host = urlparse(url).netloc or "default"
+    return os.path.join(STATE_DIR, f"{host.replace(':', '_')}.json")
+
+
+def _block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _save_storage_state(context, path):
+    """Persist the context's cookies/storage (atomic replace; workers may share a host)"""
+    try:
+        os.makedirs(STATE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(context.storage_state(), f)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"   [!] Could not save browser state: {e}")
+
+
+# --- THE ENGINE ---
+def scrape_airline(airline, browser=None):
+    """
+    Scrape one airline and queue its results for saving.
+
+    Pass the calling thread's browser to reuse it (the airline still gets its
+    own context); without one a browser is launched just for this airline.
+
+    Returns the Future of the background write; call flush_pending() before
+    exiting or reading the results back.
+    """
+    if browser is None:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=True, args=LAUNCH_ARGS)
+            try:
+                return scrape_airline(airline, browser)
+            finally:
+                browser.close()
+
+    print(f"\n[+] Processing: {airline['name']}")
+
+    started_at = time.time()
+    job_records = []
+    error = None
+
+    url = airline.get('career_page_url') or airline.get('url', '')
+    state_path = _state_path(url)
+
+    context = browser.new_context(
+        user_agent=USER_AGENT,
+        storage_state=state_path if os.path.exists(state_path) else None,
+        service_workers="block",
+    )
+    context.route("**/*", _block_heavy_resources)
+    page = context.new_page()
+
+    try:
+        # 1. GO TO CAREER PAGE
+        print(f"   Navigating to: {url}...")
+        wait_for_host(url, CAREER_PAGE_INTERVAL)
+        page.goto(url, timeout=60000, wait_until="domcontentloaded")
+
+        # 2. FIND ALL LINKS (skipping ones another airline already claimed)
+        potential_jobs = _claim_new_urls(get_potential_links(page, url))
+        print(f"   Found {len(potential_jobs)} potential pages. Analyzing with AI...")
+
+        # 3. FETCH STATIC PAGES IN PARALLEL (no browser needed)
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+            static_texts = list(pool.map(fetch_text, potential_jobs))
+
+        # 4. VISIT & ANALYZE EACH LINK
+        for job_url, raw_text in zip(potential_jobs, static_texts):
+            try:
+                if raw_text is None:
+                    # Brief pause to be polite (only if this host was just hit)
+                    wait_for_host(job_url, JOB_PAGE_INTERVAL)
 
                     # Go to the specific job page
                     page.goto(job_url, timeout=30000)
@@ -120,78 +606,129 @@ def scrape_airline(airline):
                     except:
                         pass
 
-                    # Grab text
-                    raw_text = page.locator("body").inner_text()
-
-                    # AI DECISION TIME
-                    ai_data = parse_job_with_ai(raw_text, job_url, airline['name'])
-
-                    # If AI says "Not a job", skip it.
-                    if not ai_data.get("is_valid_job", False):
-                        continue
-
-                    # If verified, save it!
-                    print(f"      [OK] JOB CONFIRMED: {ai_data.get('job_title')} ({ai_data.get('min_hours')}h)")
-
-                    # Save to Database
-                    job_record = {
-                        "company": airline['name'],
-                        "title": ai_data.get('job_title', 'Pilot Position'),
-                        "application_url": job_url,
-                        "min_total_hours": ai_data.get('min_hours', 0),
-                        "aircraft_type": ", ".join(ai_data.get('aircraft', [])) if ai_data.get('aircraft') else None,
-                        "visa_sponsorship": ai_data.get('visa_sponsored', False),
-                        "is_entry_level": ai_data.get('is_low_hour', False),
-                        "type_rating_required": ai_data.get('type_rating_required', False),
-                        "is_active": True,
-                        "source": f"Direct - {airline['name']}",
-                        "region": airline.get('region', 'global'),
-                    }
-
-                    # Upsert (Save)
-                    supabase.table("pilot_jobs").upsert(job_record, on_conflict="application_url").execute()
-                    valid_jobs_count += 1
+                    # Grab text: one HTML transfer, parsed like a static fetch
+                    # (no style/layout flush as with inner_text())
+                    raw_text = _visible_text(page.content())
 
-                except Exception as e:
-                    # Ignore link errors and keep moving
+                # Cheap pre-check - obviously not a pilot job, no AI call
+                if len(raw_text) < MIN_STATIC_TEXT or not PILOT_TEXT_RE.search(raw_text):
                     continue
 
-            print(f"   [DONE] Finished {airline['name']}: {valid_jobs_count} valid jobs saved.")
+                # AI DECISION TIME
+                ai_data = parse_job_cached(raw_text, job_url, airline['name'])
 
-            # Update airline last_checked
-            if airline.get('id'):
-                supabase.table("airlines_to_scrape").update({
-                    "last_checked": time.strftime("%Y-%m-%dT%H:%M:%SZ"),
-                    "jobs_found_last_scrape": valid_jobs_count
-                }).eq("id", airline['id']).execute()
+                # If AI says "Not a job", skip it.
+                if not ai_data.get("is_valid_job", False):
+                    continue
 
-        except Exception as e:
-            print(f"   [X] Failed to scrape airline: {e}")
+                # If verified, save it!
+                print(f"      [OK] JOB CONFIRMED: {ai_data.get('job_title')} ({ai_data.get('min_hours')}h)")
+
+                # Queue for saving
+                job_record = {
+                    "company": airline['name'],
+                    "title": ai_data.get('job_title', 'Pilot Position'),
+                    "application_url": job_url,
+                    "min_total_hours": ai_data.get('min_hours', 0),
+                    "aircraft_type": ", ".join(ai_data.get('aircraft', [])) if ai_data.get('aircraft') else None,
+                    "visa_sponsorship": ai_data.get('visa_sponsored', False),
+                    "is_entry_level": ai_data.get('is_low_hour', False),
+                    "type_rating_required": ai_data.get('type_rating_required', False),
+                    "is_active": True,
+                    "source": f"Direct - {airline['name']}",
+                    "region": airline.get('region', 'global'),
+                }
+
+                job_records.append(job_record)
+
+            except Exception as e:
+                # Ignore link errors and keep moving
+                continue
+
+        print(f"   [DONE] Finished {airline['name']}: {len(job_records)} valid jobs found.")
+
+    except Exception as e:
+        print(f"   [X] Failed to scrape airline: {e}")
+        error = str(e)
+    finally:
+        _save_storage_state(context, state_path)
+        context.close()
+
+    future = _db_writer.submit(save_airline_results, airline, job_records, started_at, error)
+    with _pending_writes_lock:
+        _pending_writes.add(future)
+    future.add_done_callback(_forget_write)
+    return future
+
+
+def _forget_write(future):
+    """Drop a finished save from _pending_writes (runs on the db-writer thread)"""
+    with _pending_writes_lock:
+        _pending_writes.discard(future)
+
+
+def _scrape_worker(todo):
+    """Scrape airlines from the queue until it is empty, on one browser"""
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True, args=LAUNCH_ARGS)
+        try:
+            while True:
+                try:
+                    airline = todo.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    scrape_airline(airline, browser)
+                except Exception as e:
+                    print(f"   [X] Worker error on {airline.get('name')}: {e}")
         finally:
             browser.close()
 
 
+def get_active_airlines():
+    """Active airlines to scrape (cached for AIRLINES_CACHE_TTL seconds)"""
+    global _airlines_cache
+    if _airlines_cache and time.time() - _airlines_cache[0] < AIRLINES_CACHE_TTL:
+        return _airlines_cache[1]
+    rows = supabase.table("airlines_to_scrape").select(AIRLINE_COLUMNS).eq("status", "active").execute().data or []
+    _airlines_cache = (time.time(), rows)
+    return rows
+
+
 def run_engine(single_airline=None):
     """Run the scraper for all airlines or a single airline"""
     if single_airline:
         # Fetch single airline
-        response = supabase.table("airlines_to_scrape").select("*").ilike("name", single_airline).limit(1).execute()
+        response = supabase.table("airlines_to_scrape").select(AIRLINE_COLUMNS).ilike("name", single_airline).limit(1).execute()
         if response.data:
             scrape_airline(response.data[0])
+            flush_pending()
         else:
             print(f"Airline '{single_airline}' not found in database.")
         return
 
     # Fetch active airlines from DB
-    rows = supabase.table("airlines_to_scrape").select("*").eq("status", "active").execute()
-    if not rows.data:
+    airlines = get_active_airlines()
+    if not airlines:
         print("No airlines found in DB. Run the Hunter script first.")
         return
 
-    print(f"Found {len(rows.data)} airlines to scrape.")
+    print(f"Found {len(airlines)} airlines to scrape.")
+
+    todo = queue.Queue()
+    for airline in airlines:
+        todo.put(airline)
+
+    workers = [
+        threading.Thread(target=_scrape_worker, args=(todo,), name=f"scraper-{n}")
+        for n in range(min(SCRAPE_WORKERS, len(airlines)))
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
 
-    for airline in rows.data:
-        scrape_airline(airline)
+    flush_pending()
 
 
 if __name__ == "__main__":
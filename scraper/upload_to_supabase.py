@@ -14,6 +14,7 @@ import asyncio
 import os
 import sys
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict
 from dotenv import load_dotenv
 
@@ -32,8 +33,14 @@ from supabase import create_client, Client
 from scrapers.qatar_scraper import QatarAirwaysScraper
 
 
+@lru_cache(maxsize=1)
 def get_supabase_client() -> Client:
-    """Create Supabase client with service role key"""
+    """
+    Create Supabase client with service role key
+
+    Cached, so the upload and the deactivation step share one client and
+    its keep-alive connection pool.
+    """
     url = os.getenv('NEXT_PUBLIC_SUPABASE_URL')
     key = os.getenv('SUPABASE_SERVICE_KEY')
 
@@ -113,12 +120,15 @@ def upload_jobs_to_supabase(jobs: List[Dict], test_mode: bool = False):
         print(f"\nUploading {len(prepared_jobs)} jobs to Supabase...")
 
         # Upsert jobs (update if URL exists, insert if not)
+        # Only the row count comes back, not every upserted row
         result = supabase.table('pilot_jobs').upsert(
             prepared_jobs,
-            on_conflict='application_url'
+            on_conflict='application_url',
+            returning='minimal',
+            count='exact'
         ).execute()
 
-        print(f"Successfully uploaded {len(result.data)} jobs")
+        print(f"Successfully uploaded {result.count} jobs")
 
         # Print summary
         print("\nUploaded jobs:")
@@ -139,9 +149,9 @@ def deactivate_old_jobs(company: str):
         # Mark all jobs from this company as inactive
         result = supabase.table('pilot_jobs').update({
             'is_active': False
-        }).eq('company', company).execute()
+        }, returning='minimal', count='exact').eq('company', company).execute()
 
-        print(f"Marked {len(result.data)} old {company} jobs as inactive")
+        print(f"Marked {result.count} old {company} jobs as inactive")
 
     except Exception as e:
         print(f"Error deactivating old jobs: {e}")
@@ -167,8 +177,12 @@ async def main():
         airline_lower = args.airline.lower()
         if airline_lower == 'qatar':
             jobs = await scrape_qatar_airways()
-            if not args.test:
-                deactivate_old_jobs('Qatar Airways')
+            # Only once the scrape returned jobs - fetch_all_jobs returns []
+            # on failure, and that must not leave the existing jobs deactivated
+            # with nothing to replace them. Runs off the event loop (the
+            # supabase client is sync).
+            if jobs and not args.test:
+                await asyncio.to_thread(deactivate_old_jobs, 'Qatar Airways')
             all_jobs.extend(jobs)
         else:
             print(f"Unknown airline: {args.airline}")
@@ -178,8 +192,8 @@ async def main():
         # Run all scrapers
         all_jobs = await run_all_scrapers()
 
-    # Upload to Supabase
-    upload_jobs_to_supabase(all_jobs, test_mode=args.test)
+    # Upload to Supabase (sync client, kept off the event loop)
+    await asyncio.to_thread(upload_jobs_to_supabase, all_jobs, test_mode=args.test)
 
     print("\n" + "="*70)
     print("SCRAPING COMPLETE")